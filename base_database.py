@@ -11,7 +11,7 @@ Data: 2024
 
 import os
 import sqlite3
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Tuple, Iterable
 from abc import ABC, abstractmethod
 from src.utils.logger import logger
 
@@ -42,6 +42,9 @@ class BaseDatabase(ABC):
         # Crea la directory se non esiste
         self._ensure_directory()
         
+        # Abilita l'auto vacuum incrementale (effettivo sui database nuovi)
+        self._enable_incremental_vacuum()
+        
         # Inizializza il database specifico
         self._init_database()
     
@@ -55,6 +58,14 @@ class BaseDatabase(ABC):
             logger.error(f"Errore creazione directory {self.db_dir}: {e}")
             raise
     
+    def _enable_incremental_vacuum(self):
+        """Imposta auto_vacuum=INCREMENTAL prima della creazione delle tabelle"""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        except Exception as e:
+            logger.error(f"Errore impostazione auto_vacuum {self.db_path}: {e}")
+    
     @abstractmethod
     def _init_database(self):
         """
@@ -149,6 +160,51 @@ class BaseDatabase(ABC):
         result = self._execute_query(query, (table_name,), fetch=True)
         return len(result) > 0 if result else False
     
+    def create_index(self, index_name: str, table_name: str, columns: Iterable[str]) -> bool:
+        """
+        Crea un indice sulla tabella se non esiste già
+        
+        Args:
+            index_name: Nome dell'indice
+            table_name: Nome della tabella
+            columns: Colonne (o espressioni, es. LOWER(colonna)) indicizzate
+            
+        Returns:
+            True se successo
+        """
+        query = f"CREATE INDEX IF NOT EXISTS {index_name} ON {table_name}({', '.join(columns)})"
+        return self._execute_query(query) is not None
+    
+    def select_where_in(self, table_name: str, column: str, values: Iterable[Any],
+                        where: str = "", params: Tuple = (),
+                        ignore_case: bool = False) -> List[Dict]:
+        """
+        Seleziona i record con la colonna in un insieme di valori, filtrando in SQL
+        
+        Args:
+            table_name: Nome della tabella
+            column: Colonna su cui applicare il filtro IN
+            values: Valori ammessi (per ignore_case vanno passati in minuscolo)
+            where: Condizione aggiuntiva opzionale, in AND con il filtro
+            params: Parametri della condizione aggiuntiva
+            ignore_case: Se confrontare LOWER(column) con i valori
+            
+        Returns:
+            Lista di dizionari con i record trovati
+        """
+        values = tuple(values)
+        if not values:
+            return []
+        
+        target = f"LOWER({column})" if ignore_case else column
+        placeholders = ", ".join("?" * len(values))
+        query = f"SELECT * FROM {table_name} WHERE {target} IN ({placeholders})"
+        if where:
+            query += f" AND ({where})"
+        
+        result = self._execute_query(query, values + tuple(params), fetch=True)
+        return result or []
+    
     def get_table_info(self, table_name: str) -> Optional[List[Dict]]:
         """
         Ottiene informazioni su una tabella
@@ -36,6 +36,7 @@ def create_exe():
         "--icon=assets/icon.ico",       # Icona
         "--add-data=sounds;sounds",     # Includi cartella suoni
         "--add-data=data;data",         # Includi cartella dati
+        "--add-data=translations.json;.",  # Includi tabelle traduzioni
         "--hidden-import=pygame",       # Import nascosti
         "--hidden-import=psutil",
         "--hidden-import=scipy",
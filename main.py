@@ -17,7 +17,14 @@ Data: 2025
 import os
 import sys
 import time
+import itertools
+import threading
 import logging
+import tkinter as tk
+from collections import defaultdict
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from operator import itemgetter
 from tkinter import messagebox
 import customtkinter as ctk  # type: ignore[reportMissingTypeStubs]
 
@@ -48,12 +55,229 @@ try:
     from src.utils.logger import logger
     from src.utils.error_handler import initialize_error_handler
     from src.utils.translations import translation_manager
+    from src.utils.cache_manager import get_cache_manager
 except Exception as e:
     # Se falliscono gli import, logga e fallisci in modo controllato usando il fallback logger
     logger.critical(f"Errore import moduli principali: {e}")
     raise
 
 
+# Durata (secondi) della cache dei ricambi disponibili: copre le letture
+# ripetute dei dialog costi senza nascondere a lungo le modifiche esterne
+_RICAMBI_CACHE_TTL = 2.0
+_RICAMBI_CACHE_PREFIX = "ricambi_disponibili_"
+
+# Scadenza (secondi) del listino in cache quando il controller officina non
+# espone un contatore di versione (listino_version)
+_LISTINO_CACHE_TTL = 30.0
+
+# Scadenza (secondi) dello snapshot bici ricondizionate: oltre questo intervallo
+# si rilegge dal database anche senza invalidazione esplicita (modifiche esterne)
+_BICI_SNAPSHOT_TTL = 30.0
+
+# Stati di ricondizionamento (in minuscolo) raggruppati per vista della lista bici
+_STATI_SOSPESO = frozenset({"sospeso", "in sospeso", "pausa", "fermo"})
+_STATI_LAVORAZIONE = frozenset({"in lavorazione", "iniziato", "in corso", "attivo"})
+_STATO_BUCKETS = {
+    "sospeso": _STATI_SOSPESO,
+    "lavorazione": _STATI_LAVORAZIONE,
+}
+# Viste bici ricondizionate: chiave dello snapshot -> (titolo, sottotitolo, lista con costi, descrizione)
+_RICOND_VIEWS = {
+    "sospeso": (
+        "⏸️ Biciclette in Sospeso",
+        "Biciclette con lavori temporaneamente sospesi",
+        False,
+        "bici in sospeso",
+    ),
+    "lavorazione": (
+        "🔨 Biciclette in Lavorazione",
+        "Biciclette attualmente in fase di ricondizionamento",
+        True,
+        "bici in lavorazione",
+    ),
+    "da_vendere": (
+        "💰 Biciclette da Mettere in Vendita",
+        "Biciclette completate e pronte per la vendita",
+        False,
+        "bici da vendere",
+    ),
+}
+# Indice inverso stato -> vista, per partizionare con una sola lookup per record
+_BUCKET_PER_STATO = {stato: nome for nome, stati in _STATO_BUCKETS.items() for stato in stati}
+
+
+# Stili condivisi dei pulsanti (il font resta per-chiamata: CTkFont richiede la root)
+_STILE_DANGER = {'fg_color': "#DC2626", 'hover_color': "#B91C1C"}
+_STILE_SUCCESS = {'fg_color': "#059669", 'hover_color': "#047857"}
+_STILE_BACK = {'fg_color': "#6B7280", 'hover_color': "#4B5563"}
+_STILE_MENU = {'width': 300, 'height': 120, 'corner_radius': 15}
+_STILE_OPERAZIONE = {'width': 250, 'height': 120, 'corner_radius': 15}
+
+# Testi dei pulsanti di scelta del tipo di cliente
+TEXT_CLIENTE_EXT = "👥 CLIENTE ESTERNO\n\nRiparazione per cliente esterno\n(Prezzo: Mano d'opera + Ricambi)"
+TEXT_OFFICINA_INT = "🏭 OFFICINA INTERNA\n\nRiparazione per officina interna\n(Prezzo: Ricambi × 2 + Aggiustamento)"
+
+# Righe della lista bici con costi create per ogni giro del loop Tk
+_RENDER_CHUNK_SIZE = 20
+# Righe create prima di chiedere conferma con il pulsante "Mostra altre"
+INITIAL_BATCH = 30
+
+# Altezza fissa delle righe della lista bici virtualizzata (slot = riga + padding)
+_RIGA_BICI_ALTEZZA = 170
+_RIGA_BICI_PADY = 10
+_RIGA_BICI_SLOT = _RIGA_BICI_ALTEZZA + 2 * _RIGA_BICI_PADY
+
+# Altezza fissa delle righe della lista operazioni virtualizzata (categorie e operazioni)
+_RIGA_OPERAZIONE_ALTEZZA = 46
+_RIGA_OPERAZIONE_PADY = 2
+_RIGA_OPERAZIONE_SLOT = _RIGA_OPERAZIONE_ALTEZZA + 2 * _RIGA_OPERAZIONE_PADY
+
+
+@lru_cache(maxsize=64)
+def _stato_normalizzato(stato):
+    """Stato di ricondizionamento in minuscolo, calcolato una volta per valore (vocabolario ridotto)"""
+    return stato.lower()
+
+# Template dei dettagli di calcolo, definiti una volta a livello di modulo e
+# riempiti con format_map(calcolo) invece di un f-string per ogni riga
+_DETTAGLI_PREZZO_BASE = (
+    "📊 Costi Base:\n"
+    "  • Costo acquisto: €{costo_acquisto:.2f}\n"
+    "  • Costo ricambi: €{costo_ricambi:.2f}\n"
+    "  • Costo totale: €{costo_totale:.2f}\n"
+    "\n"
+    "🧮 Calcolo Prezzo:\n"
+    "  • Formula: (Costo totale) × {moltiplicatore:.1f}\n"
+    "  • Calcolo: €{costo_totale:.2f} × {moltiplicatore:.1f} = €{prezzo_base:.2f}\n"
+)
+_DETTAGLI_PREZZO_ARROTONDAMENTO = "  • Arrotondamento: €{prezzo_base:.2f} → €{prezzo_finale:.2f}"
+_DETTAGLI_PREZZO_TEMPLATE = _DETTAGLI_PREZZO_BASE + _DETTAGLI_PREZZO_ARROTONDAMENTO
+_DETTAGLI_PREZZO_IVA_TEMPLATE = (
+    _DETTAGLI_PREZZO_BASE
+    + "  • IVA ({iva_percentuale:.1f}%): €{iva_applicata:.2f}\n"
+    + _DETTAGLI_PREZZO_ARROTONDAMENTO
+)
+
+_COSTI_RIGA_TEMPLATE = "Acquisto: €{acquisto:.2f} | Costo Totale: €{totale:.2f}"
+_DETTAGLI_COSTI_TEMPLATE = (
+    "Costo Base (Acquisto): €{costo_base:.2f}\n"
+    "\n"
+    "Ricambi:\n"
+    "  • Senza IVA: €{costo_ricambi_senza_iva:.2f}\n"
+    "  • Con IVA: €{costo_ricambi_con_iva:.2f}\n"
+    "  • Finale: €{costo_ricambi_finale:.2f}\n"
+    "\n"
+    "Raddoppio (Logica Officina):\n"
+    "  • Bicicletta: €{costo_bici_raddoppiato:.2f}\n"
+    "  • Ricambi: €{costo_ricambi_raddoppiato:.2f}\n"
+    "  • Totale: €{costo_totale_prima_arrotondamento:.2f}\n"
+    "\n"
+    "Arrotondamento: €{costo_totale_arrotondato:.2f}\n"
+    "Margine: €{margine:.2f}"
+)
+
+
+def _euro(valore):
+    """Formatta un importo in euro con due decimali"""
+    return f"€{valore:.2f}"
+
+
+def _si_no(valore):
+    """Formatta un flag come Sì/No"""
+    return "Sì" if valore else "No"
+
+
+@dataclass(frozen=True)
+class _TestiRigaBici:
+    """Testi precalcolati di una riga della lista bici ricondizionate"""
+    __slots__ = ("titolo", "codice_stato", "dettagli", "costi")
+    titolo: str
+    codice_stato: str
+    dettagli: str
+    costi: str
+
+
+def _prepara_testi_bici(bici):
+    """Precalcola sul record (chiave '_display') i testi della riga lista"""
+    dettagli = []
+    if bici.get('anno'):
+        dettagli.append(f"Anno: {bici['anno']}")
+    if bici.get('colore'):
+        dettagli.append(f"Colore: {bici['colore']}")
+    if bici.get('taglia'):
+        dettagli.append(f"Taglia: {bici['taglia']}")
+    bici['_display'] = _TestiRigaBici(
+        titolo=f"{bici['marca']} {bici['modello']}",
+        codice_stato=f"Codice: {bici['codice']} | Stato: {bici.get('stato_ricondizionamento', 'N/A')}",
+        dettagli=" | ".join(dettagli),
+        costi=(
+            f"Acquisto: €{bici.get('prezzo_acquisto', 0):.2f} | "
+            f"Totale: €{bici.get('costo_totale', 0):.2f} | "
+            f"Vendita: €{bici.get('prezzo_vendita', 0):.2f}"
+        )
+    )
+    return bici
+
+
+# Campi del dialog dettagli bici ricondizionata: gruppi di (etichetta, chiave, default, formatter)
+_DETTAGLI_BICI_RICONDIZIONATA = (
+    (
+        ("Codice", "codice", "N/A", str),
+        ("Marca", "marca", "N/A", str),
+        ("Modello", "modello", "N/A", str),
+        ("Anno", "anno", "N/A", str),
+        ("Colore", "colore", "N/A", str),
+        ("Taglia", "taglia", "N/A", str),
+        ("Telaio", "telaio", "N/A", str),
+    ),
+    (
+        ("Stato Ricondizionamento", "stato_ricondizionamento", "N/A", str),
+        ("Descrizione", "descrizione", "N/A", str),
+    ),
+    (
+        ("Prezzo Acquisto", "prezzo_acquisto", 0, _euro),
+        ("Costo Ricambi", "costo_ricambi", 0, _euro),
+        ("Costo Manodopera", "costo_manodopera", 0, _euro),
+        ("Costo Totale", "costo_totale", 0, _euro),
+        ("Prezzo Vendita", "prezzo_vendita", 0, _euro),
+        ("Margine", "margine", 0, _euro),
+    ),
+    (
+        ("Data Acquisto", "data_acquisto", "N/A", str),
+        ("Data Inizio", "data_inizio_ricondizionamento", "N/A", str),
+        ("Data Fine", "data_fine_ricondizionamento", "N/A", str),
+        ("Completato", "completato", False, _si_no),
+    ),
+    (
+        ("Note", "note", "N/A", str),
+    ),
+)
+
+
+def _destroy_all(frame, keep=()):
+    """Distrugge tutti i figli di un frame riducendo i round-trip Tcl.
+
+    I widget Tk puri senza figli vengono distrutti con un unico comando
+    `destroy`; i widget CustomTkinter ridefiniscono destroy() (tracker di
+    tema/scaling, canvas interni) e quindi passano dal loro metodo.
+    I widget in `keep` vengono solo nascosti con pack_forget().
+    """
+    paths = []
+    for widget in frame.winfo_children():
+        if any(widget is tenuto for tenuto in keep):
+            widget.pack_forget()
+        elif type(widget).destroy is tk.BaseWidget.destroy and not widget.children:
+            paths.append(widget._w)
+            # Pulizia lato Python normalmente svolta da BaseWidget.destroy
+            frame.children.pop(widget._name, None)
+            tk.Misc.destroy(widget)
+        else:
+            widget.destroy()
+    if paths:
+        frame.tk.call("destroy", *paths)
+
+
 class GestionaleApp:
     """Classe principale dell'applicazione Gestionale"""
 
@@ -113,6 +337,8 @@ class GestionaleApp:
 
         # Crea la finestra principale
         self.root = ctk.CTk()
+        # Dimensioni dello schermo lette una volta all'avvio (centratura dei dialog)
+        self._screen_size = (self.root.winfo_screenwidth(), self.root.winfo_screenheight())
         try:
             self.root.title(f"{translation_manager.get_text('app.title')} v1.0")
         except Exception:
@@ -134,6 +360,10 @@ class GestionaleApp:
         self.bici_restaurate_gui = None
         self.bici_artigianali_gui = None
         self.inventario_gui = None
+        self.impostazioni_gui = None
+        self.riparazioni_gui = None
+        # Classe InventarioGUI importata in anticipo a idle (None finché non è pronta)
+        self._InventarioGUI = None
 
         # Defensive initialization: ensure attribute exists before async GUI loading
         self.guida_manager = None
@@ -154,6 +384,31 @@ class GestionaleApp:
         self.search_entry = None
         self.prodotti_frame = None
 
+        # Font CTk condivisi tra i widget, creati al primo utilizzo (vedi _font)
+        self._fonts = {}
+        # Dialog modali riutilizzati tra le aperture (vedi _apri_dialog_riutilizzabile)
+        self._dialogs = {}
+
+        # Snapshot delle bici ricondizionate partizionate per vista (sospeso/lavorazione/da vendere)
+        self._filter_cache = {}
+        self._bici_by_id = {}
+        self._cache_dirty = True
+        self._snapshot_caricato = 0.0
+        # Vista bici ricondizionate corrente e refresh pianificato dopo le eliminazioni
+        self._current_ricond_view = None
+        self._refresh_ricond_after_id = None
+        # Id del prossimo blocco di righe della lista con costi (rendering a blocchi)
+        self._render_after_id = None
+        # Ultima lista bici ricondizionate mostrata (early-out sulle viste vuote ripetute)
+        self._last_lista_titolo = None
+        self._last_lista_count = None
+        # Viste persistenti del contenuto tab, mostrate/nascoste invece di ricostruite
+        self._view_frames = {}
+        # Stato della lista bici ricondizionate virtualizzata (pool di righe riciclate)
+        self._lista_virtuale = None
+        # Righe della lista "in lavorazione" indicizzate per id bici (aggiornamento puntuale)
+        self._bici_row_widgets = {}
+
         # Crea la barra menu e imposta icona
         try:
             self.menu_handler.create_menu_bar()
@@ -182,6 +437,9 @@ class GestionaleApp:
         except Exception:
             pass
 
+        # Import dei moduli GUI aperti al primo click, a mainloop avviato
+        self.root.after(500, self._warm_imports)
+
         # Mostra indicatore di caricamento
         try:
             self._show_loading_indicator()
@@ -276,6 +534,24 @@ class GestionaleApp:
             logger.error(f"Errore inizializzazione BiciUsateController: {e}")
             self.bici_usate_controller = None
 
+        # Eager initialization del controller delle biciclette ricondizionate:
+        # un'unica istanza condivisa da tutti i dialog, senza import al click
+        self._ricond_controller_lock = threading.Lock()
+        try:
+            from src.modules.biciclette.bici_ricondizionate_controller import BiciRicondizionateController
+            self.bici_ricondizionate_controller = BiciRicondizionateController("data")
+        except Exception as e:
+            logger.error(f"Errore inizializzazione BiciRicondizionateController: {e}")
+            self.bici_ricondizionate_controller = None
+
+        # Listino operazioni in cache, valido finché non cambia la versione del listino
+        self._listino_cache = {
+            'ver': None, 'categorie': None, 'operazioni': None, 'by_cat': {}, 'caricato': 0.0
+        }
+        self._listino_lock = threading.Lock()
+        # Testi dei prezzi per (id operazione, tipo cliente), svuotati a ogni ricarica del listino
+        self._prezzi_operazioni = {}
+
         # Inizializza il controller officina se possibile (richiede db_dir)
         try:
             self.officina_controller = OfficinaController(db_dir)
@@ -292,6 +568,17 @@ class GestionaleApp:
             logger.error(f"Errore inizializzazione RiparazioniController: {e}")
             self.riparazioni_controller = None
 
+        # Precarica il listino in background: all'apertura delle riparazioni è già in cache
+        if self.officina_controller:
+            threading.Thread(target=self._prefetch_listino, daemon=True).start()
+
+
+    def _font(self, size, weight="normal"):
+        """Restituisce un CTkFont condiviso per la coppia (size, weight)"""
+        font = self._fonts.get((size, weight))
+        if font is None:
+            font = self._fonts[(size, weight)] = ctk.CTkFont(size=size, weight=weight)
+        return font
 
     def _load_guis_progressively(self):
         """Carica le GUI in background con approccio moderno e lazy loading"""
@@ -382,7 +669,7 @@ class GestionaleApp:
             if not hasattr(self, 'gui_cache'):
                 self.gui_cache = {}
             
-            if not hasattr(self, 'inventario_gui') or self.inventario_gui is None:
+            if self.inventario_gui is None:
                 # Controlla la cache
                 if 'inventario' in self.gui_cache:
                     self.inventario_gui = self.gui_cache['inventario']
@@ -439,6 +726,14 @@ class GestionaleApp:
             logger.error(f"❌ bici_artigianali fallita: {e}")
     
     
+    def _warm_imports(self):
+        """Importa in anticipo le classi GUI usate al primo click, così l'apertura è immediata"""
+        try:
+            from src.gui.inventario_gui import InventarioGUI
+            self._InventarioGUI = InventarioGUI
+        except Exception as e:
+            logger.error(f"Errore import anticipato InventarioGUI: {e}")
+
     def _show_loading_indicator(self):
         """Mostra un indicatore di caricamento visivo"""
         try:
@@ -527,9 +822,8 @@ class GestionaleApp:
     def _apply_window_settings(self):
         """Applica le impostazioni della finestra all'avvio - COMPLETAMENTE RESPONSIVE"""
         try:
-            # Ottieni le dimensioni dello schermo
-            screen_width = self.root.winfo_screenwidth()
-            screen_height = self.root.winfo_screenheight()
+            # Dimensioni dello schermo lette all'avvio
+            screen_width, screen_height = self._screen_size
             
             # Dimensioni fisse più piccole come richiesto
             window_width = 600
@@ -631,14 +925,17 @@ class GestionaleApp:
         except Exception as e:
             logger.error(f"Errore nel controllo backup automatico: {str(e)}", "BACKUP_AUTO", e)
 
+    def _geometria_centrata(self, width, height):
+        """Stringa geometry di una finestra width x height centrata sullo schermo"""
+        screen_width, screen_height = self._screen_size
+        return f"{width}x{height}+{(screen_width - width) // 2}+{(screen_height - height) // 2}"
+
     def _center_window(self):
         """Centra la finestra sullo schermo"""
         self.root.update_idletasks()
         width = self.root.winfo_width()
         height = self.root.winfo_height()
-        x = (self.root.winfo_screenwidth() // 2) - (width // 2)
-        y = (self.root.winfo_screenheight() // 2) - (height // 2)
-        self.root.geometry(f"{width}x{height}+{x}+{y}")
+        self.root.geometry(self._geometria_centrata(width, height))
 
     def _create_interface(self):
         """Crea l'interfaccia principale con sistema di tab - COMPLETAMENTE RESPONSIVE"""
@@ -703,9 +1000,8 @@ class GestionaleApp:
 
     def _clienti_tab_content(self):
         """Contenuto della tab gestione clienti"""
-        # Pulisce il frame del contenuto
-        for widget in self.tab_content_frame.winfo_children():
-            widget.destroy()
+        # Pulisce il frame del contenuto (le viste persistenti vengono solo nascoste)
+        self._pulisci_contenuto_tab()
 
         # Titolo
         title_label = ctk.CTkLabel(
@@ -764,28 +1060,19 @@ class GestionaleApp:
     def _clear_tab_content(self):
         """Pulisce il contenuto delle tab per evitare conflitti"""
         try:
-            # Pulisce il frame principale del contenuto
+            # Pulisce il frame principale del contenuto: le viste persistenti
+            # (riparazione, inventario, ...) vengono solo nascoste
             if hasattr(self, 'tab_content_frame'):
-                # Distruggi tutti i widget figli in modo sicuro
-                widgets_to_destroy = list(self.tab_content_frame.winfo_children())
-                for widget in widgets_to_destroy:
-                    try:
-                        widget.destroy()
-                    except Exception:
-                        pass
-                
-                # Forza l'aggiornamento della GUI
-                self.tab_content_frame.update_idletasks()
-                
-            # Pulisce anche eventuali riferimenti a GUI specifiche
-            if hasattr(self, 'inventario_gui'):
-                try:
-                    del self.inventario_gui
-                except Exception:
-                    pass
-                    
+                self._pulisci_contenuto_tab()
+                # Nessun update_idletasks(): il layout viene ricalcolato
+                # al prossimo ciclo idle, dopo la ricostruzione del contenuto
+
+            # Le impostazioni non sono una vista persistente: i loro widget
+            # sono stati distrutti sopra
+            self.impostazioni_gui = None
+
             # Pulisce il frame prodotti se esiste
-            if hasattr(self, 'prodotti_frame'):
+            if self.prodotti_frame is not None:
                 try:
                     for widget in self.prodotti_frame.winfo_children():
                         widget.destroy()
@@ -815,6 +1102,9 @@ class GestionaleApp:
 
     def _impostazioni_tab_content(self):
         """Contenuto della tab impostazioni"""
+        # Il listino può essere modificato da qui: non riusare la copia in cache
+        self.invalida_cache_listino()
+        
         # Crea l'istanza della GUI delle impostazioni
         self.impostazioni_gui = ImpostazioniGUI(
             self.tab_content_frame,
@@ -897,15 +1187,18 @@ class GestionaleApp:
     def _mostra_lista_bici_ricondizionate_con_costi(self, biciclette, titolo, sottotitolo):
         """Mostra una lista di biciclette ricondizionate con gestione costi"""
         try:
-            # Pulisce il frame del contenuto
-            for widget in self.tab_content_frame.winfo_children():
-                widget.destroy()
+            # Pulisce il frame del contenuto e annulla un rendering a blocchi in corso
+            if self._render_after_id is not None:
+                self.root.after_cancel(self._render_after_id)
+                self._render_after_id = None
+            self._pulisci_contenuto_tab()
+            self._bici_row_widgets = {}
 
             # Titolo
             title_label = ctk.CTkLabel(
                 self.tab_content_frame,
                 text=titolo,
-                font=ctk.CTkFont(size=24, weight="bold")
+                font=self._font(24, "bold")
             )
             title_label.pack(pady=20)
 
@@ -913,7 +1206,7 @@ class GestionaleApp:
             subtitle_label = ctk.CTkLabel(
                 self.tab_content_frame,
                 text=sottotitolo,
-                font=ctk.CTkFont(size=16)
+                font=self._font(16)
             )
             subtitle_label.pack(pady=(0, 30))
 
@@ -922,7 +1215,7 @@ class GestionaleApp:
                 no_bici_label = ctk.CTkLabel(
                     self.tab_content_frame,
                     text="Nessuna bicicletta trovata",
-                    font=ctk.CTkFont(size=16),
+                    font=self._font(16),
                     text_color="#6B7280"
                 )
                 no_bici_label.pack(pady=50)
@@ -931,9 +1224,8 @@ class GestionaleApp:
                 scroll_frame = ctk.CTkScrollableFrame(self.tab_content_frame, height=400)
                 scroll_frame.pack(fill="both", expand=True, padx=20, pady=20)
 
-                # Mostra ogni bicicletta con gestione costi
-                for bici in biciclette:
-                    self._create_bici_ricondizionata_widget_con_costi(scroll_frame, bici)
+                # Mostra le biciclette con gestione costi a blocchi, senza bloccare la UI
+                self._render_chunk(scroll_frame, iter(biciclette), len(biciclette), INITIAL_BATCH)
 
             # Pulsanti di controllo
             button_frame = ctk.CTkFrame(self.tab_content_frame, fg_color="transparent")
@@ -946,7 +1238,7 @@ class GestionaleApp:
                 command=self._seleziona_bici_ricondizionate,
                 width=200,
                 height=40,
-                font=ctk.CTkFont(size=14, weight="bold"),
+                font=self._font(14, "bold"),
                 fg_color="#6B7280",
                 hover_color="#4B5563"
             )
@@ -956,10 +1248,10 @@ class GestionaleApp:
             close_btn = ctk.CTkButton(
                 button_frame,
                 text="❌ Chiudi Tab",
-                command=lambda: self.tab_manager.close_tab("nuovo_lavoro"),
+                command=partial(self.tab_manager.close_tab, "nuovo_lavoro"),
                 width=200,
                 height=40,
-                font=ctk.CTkFont(size=14, weight="bold"),
+                font=self._font(14, "bold"),
                 fg_color="#DC2626",
                 hover_color="#B91C1C"
             )
@@ -969,6 +1261,51 @@ class GestionaleApp:
             logger.error(f"Errore mostrazione lista bici ricondizionate con costi: {e}")
             messagebox.showerror("Errore", f"Errore nella visualizzazione: {e}")
 
+    def _render_chunk(self, scroll_frame, biciclette, rimanenti, lotto):
+        """Crea un blocco di righe con costi; prosegue con after_idle fino a esaurire il lotto"""
+        self._render_after_id = None
+        try:
+            if not scroll_frame.winfo_exists():
+                return
+            creati = 0
+            for bici in itertools.islice(biciclette, min(_RENDER_CHUNK_SIZE, lotto)):
+                self._create_bici_ricondizionata_widget_con_costi(scroll_frame, bici)
+                creati += 1
+            rimanenti -= creati
+            lotto -= creati
+            if rimanenti <= 0:
+                return
+            if lotto > 0:
+                # Lotto non finito: riprendi al prossimo idle del loop Tk
+                self._render_after_id = self.root.after_idle(
+                    self._render_chunk, scroll_frame, biciclette, rimanenti, lotto
+                )
+            else:
+                self._mostra_pulsante_altre_bici(scroll_frame, biciclette, rimanenti)
+        except Exception as e:
+            logger.error(f"Errore rendering righe bici: {e}")
+
+    def _mostra_pulsante_altre_bici(self, scroll_frame, biciclette, rimanenti):
+        """Aggiunge in fondo alla lista il pulsante che carica il lotto successivo"""
+        altre_btn = ctk.CTkButton(
+            scroll_frame,
+            text=f"⬇️ Mostra altre {min(rimanenti, INITIAL_BATCH)} (su {rimanenti})",
+            width=220,
+            height=32,
+            font=self._font(12, "bold"),
+            fg_color="#6B7280",
+            hover_color="#4B5563"
+        )
+        altre_btn.configure(
+            command=lambda: self._carica_altre_bici(altre_btn, scroll_frame, biciclette, rimanenti)
+        )
+        altre_btn.pack(pady=10)
+
+    def _carica_altre_bici(self, altre_btn, scroll_frame, biciclette, rimanenti):
+        """Rimuove il pulsante "Mostra altre" e avvia il rendering del lotto successivo"""
+        altre_btn.destroy()
+        self._render_chunk(scroll_frame, biciclette, rimanenti, INITIAL_BATCH)
+
     def _create_bici_ricondizionata_widget_con_costi(self, parent, bici):
         """Crea un widget per una bicicletta ricondizionata con gestione costi"""
         try:
@@ -984,7 +1321,7 @@ class GestionaleApp:
             marca_modello = ctk.CTkLabel(
                 info_frame,
                 text=f"{bici['marca']} {bici['modello']}",
-                font=ctk.CTkFont(size=16, weight="bold")
+                font=self._font(16, "bold")
             )
             marca_modello.pack(anchor="w")
 
@@ -992,7 +1329,7 @@ class GestionaleApp:
             codice_stato = ctk.CTkLabel(
                 info_frame,
                 text=f"Codice: {bici['codice']} | Stato: {bici.get('stato_ricondizionamento', 'N/A')}",
-                font=ctk.CTkFont(size=12)
+                font=self._font(12)
             )
             codice_stato.pack(anchor="w")
 
@@ -1009,7 +1346,7 @@ class GestionaleApp:
                 dettagli_label = ctk.CTkLabel(
                     info_frame,
                     text=" | ".join(dettagli),
-                    font=ctk.CTkFont(size=11),
+                    font=self._font(11),
                     text_color="#6B7280"
                 )
                 dettagli_label.pack(anchor="w")
@@ -1018,14 +1355,13 @@ class GestionaleApp:
             costi_frame = ctk.CTkFrame(bici_frame, fg_color="transparent")
             costi_frame.pack(fill="x", padx=15, pady=(0, 10))
 
-            costo_acquisto = bici.get('prezzo_acquisto', 0)
-            costo_totale = bici.get('costo_totale', 0)
-
-            ctk.CTkLabel(
+            cost_label = ctk.CTkLabel(
                 costi_frame,
-                text=f"Acquisto: €{costo_acquisto:.2f} | Costo Totale: €{costo_totale:.2f}",
-                font=ctk.CTkFont(size=11, weight="bold")
-            ).pack(anchor="w")
+                text=self._testo_costi_bici(bici),
+                font=self._font(11, "bold")
+            )
+            cost_label.pack(anchor="w")
+            self._bici_row_widgets[bici['id']] = {'frame': bici_frame, 'cost_label': cost_label}
 
             # Pulsanti azione
             actions_frame = ctk.CTkFrame(bici_frame, fg_color="transparent")
@@ -1035,10 +1371,10 @@ class GestionaleApp:
             modifica_scheda_btn = ctk.CTkButton(
                 actions_frame,
                 text="🔧 Modifica Scheda",
-                command=lambda: self._modifica_scheda_lavoro_ricondizionata(bici),
+                command=partial(self._su_bici, self._modifica_scheda_lavoro_ricondizionata, bici['id']),
                 width=120,
                 height=30,
-                font=ctk.CTkFont(size=11),
+                font=self._font(11),
                 fg_color="#7C3AED",
                 hover_color="#6D28D9"
             )
@@ -1048,10 +1384,10 @@ class GestionaleApp:
             calcola_btn = ctk.CTkButton(
                 actions_frame,
                 text="💰 Calcola Costi",
-                command=lambda: self._calcola_costi_ricondizionamento(bici),
+                command=partial(self._su_bici, self._calcola_costi_ricondizionamento, bici['id']),
                 width=120,
                 height=30,
-                font=ctk.CTkFont(size=11),
+                font=self._font(11),
                 fg_color="#10B981",
                 hover_color="#059669"
             )
@@ -1061,10 +1397,10 @@ class GestionaleApp:
             modifica_costo_btn = ctk.CTkButton(
                 actions_frame,
                 text="✏️ Modifica Costo",
-                command=lambda: self._modifica_costo_bicicletta(bici),
+                command=partial(self._su_bici, self._modifica_costo_bicicletta, bici['id']),
                 width=120,
                 height=30,
-                font=ctk.CTkFont(size=11),
+                font=self._font(11),
                 fg_color="#3B82F6",
                 hover_color="#2563EB"
             )
@@ -1074,10 +1410,10 @@ class GestionaleApp:
             dettagli_btn = ctk.CTkButton(
                 actions_frame,
                 text="📋 Dettagli",
-                command=lambda: self._mostra_dettagli_bici_ricondizionata(bici),
+                command=partial(self._su_bici, self._mostra_dettagli_bici_ricondizionata, bici['id']),
                 width=100,
                 height=30,
-                font=ctk.CTkFont(size=11)
+                font=self._font(11)
             )
             dettagli_btn.pack(side="left", padx=5)
 
@@ -1085,10 +1421,10 @@ class GestionaleApp:
             elimina_btn = ctk.CTkButton(
                 actions_frame,
                 text="🗑️ Elimina",
-                command=lambda: self._elimina_bici_ricondizionata(bici),
+                command=partial(self._su_bici, self._elimina_bici_ricondizionata, bici['id']),
                 width=100,
                 height=30,
-                font=ctk.CTkFont(size=11),
+                font=self._font(11),
                 fg_color="#DC2626",
                 hover_color="#B91C1C"
             )
@@ -1103,15 +1439,10 @@ class GestionaleApp:
             # Crea finestra modifica scheda lavoro
             dialog = ctk.CTkToplevel(self.root)
             dialog.title(f"Modifica Scheda Lavoro - {bici['marca']} {bici['modello']}")
-            dialog.geometry("1000x700")
+            dialog.geometry(self._geometria_centrata(1000, 700))
             dialog.transient(self.root)
             dialog.grab_set()
             
-            # Centra la finestra
-            x = (dialog.winfo_screenwidth() // 2) - (1000 // 2)
-            y = (dialog.winfo_screenheight() // 2) - (700 // 2)
-            dialog.geometry(f"1000x700+{x}+{y}")
-            
             # Titolo
             title_label = ctk.CTkLabel(
                 dialog,
@@ -1132,6 +1463,8 @@ class GestionaleApp:
             # Tabview per le sezioni
             tabview = ctk.CTkTabview(dialog, width=950, height=500)
             tabview.pack(padx=20, pady=10)
+            # Riferimento diretto usato dai pulsanti "Continua" delle tab
+            dialog._tabview = tabview
             
             # Tab 1: Operazioni
             tab_operazioni = tabview.add("🔧 Operazioni")
@@ -1228,7 +1561,7 @@ class GestionaleApp:
             continua_ricambi_btn = ctk.CTkButton(
                 tab,
                 text="⚙️ Continua a Ricambi",
-                command=lambda: self.tab_manager.set_tab("⚙️ Ricambi"),
+                command=lambda: dialog._tabview.set("⚙️ Ricambi"),
                 height=40,
                 font=ctk.CTkFont(size=14, weight="bold"),
                 fg_color="#7C3AED",
@@ -1262,7 +1595,7 @@ class GestionaleApp:
             scroll_frame.pack(fill="both", expand=True, padx=20, pady=10)
             
             # Ottieni ricambi disponibili
-            ricambi_disponibili = self.bici_usate_controller.get_ricambi_disponibili()
+            ricambi_disponibili = self._get_ricambi_disponibili(self.bici_usate_controller)
             
             # Variabili per i checkbox
             self.ricambi_modifica_vars = {}
@@ -1297,11 +1630,7 @@ class GestionaleApp:
     def _continua_a_calcolo_prezzo_ricondizionata(self, dialog):
         """Passa al calcolo prezzo per bici ricondizionata"""
         try:
-            # Trova il tabview nella finestra
-            for widget in dialog.winfo_children():
-                if isinstance(widget, ctk.CTkTabview):
-                    widget.set("💰 Calcolo Prezzo")
-                    break
+            dialog._tabview.set("💰 Calcolo Prezzo")
         except Exception as e:
             logger.error(f"Errore continua a calcolo prezzo ricondizionata: {e}")
 
@@ -1370,8 +1699,7 @@ class GestionaleApp:
         """Ricalcola il prezzo per bici ricondizionata"""
         try:
             # Pulisci i risultati precedenti
-            for widget in self.risultati_prezzo_frame.winfo_children():
-                widget.destroy()
+            _destroy_all(self.risultati_prezzo_frame)
             
             # Ottieni costo acquisto
             costo_acquisto = bici.get('prezzo_acquisto', 0.0)
@@ -1379,7 +1707,7 @@ class GestionaleApp:
             # Calcola costo ricambi selezionati
             costo_ricambi = 0.0
             if hasattr(self, 'ricambi_modifica_vars'):
-                ricambi_disponibili = self.bici_usate_controller.get_ricambi_disponibili()
+                ricambi_disponibili = self._get_ricambi_disponibili(self.bici_usate_controller)
                 for ricambio_id, var in self.ricambi_modifica_vars.items():
                     if var.get():
                         for ricambio in ricambi_disponibili:
@@ -1407,75 +1735,28 @@ class GestionaleApp:
             dettagli_frame = ctk.CTkScrollableFrame(parent, height=200)
             dettagli_frame.pack(fill="both", expand=True, padx=10, pady=10)
             
-            # Costi base
-            ctk.CTkLabel(
-                dettagli_frame,
-                text="📊 Costi Base:",
-                font=ctk.CTkFont(size=14, weight="bold")
-            ).pack(pady=(10, 5), anchor="w")
-            
-            ctk.CTkLabel(
-                dettagli_frame,
-                text=f"  • Costo acquisto: €{calcolo['costo_acquisto']:.2f}",
-                font=ctk.CTkFont(size=12)
-            ).pack(anchor="w", pady=2)
-            
-            ctk.CTkLabel(
-                dettagli_frame,
-                text=f"  • Costo ricambi: €{calcolo['costo_ricambi']:.2f}",
-                font=ctk.CTkFont(size=12)
-            ).pack(anchor="w", pady=2)
+            # Dettagli del calcolo in un'unica etichetta multi-riga
+            template = _DETTAGLI_PREZZO_IVA_TEMPLATE if calcolo['con_iva'] else _DETTAGLI_PREZZO_TEMPLATE
             
             ctk.CTkLabel(
                 dettagli_frame,
-                text=f"  • Costo totale: €{calcolo['costo_totale']:.2f}",
-                font=ctk.CTkFont(size=12, weight="bold")
-            ).pack(anchor="w", pady=(5, 10))
-            
-            # Calcolo prezzo
-            ctk.CTkLabel(
-                dettagli_frame,
-                text="🧮 Calcolo Prezzo:",
-                font=ctk.CTkFont(size=14, weight="bold")
+                text=template.format_map(calcolo),
+                font=self._font(12),
+                justify="left"
             ).pack(pady=(10, 5), anchor="w")
             
-            ctk.CTkLabel(
-                dettagli_frame,
-                text=f"  • Formula: (Costo totale) × {calcolo['moltiplicatore']:.1f}",
-                font=ctk.CTkFont(size=12)
-            ).pack(anchor="w", pady=2)
-            
-            ctk.CTkLabel(
-                dettagli_frame,
-                text=f"  • Calcolo: €{calcolo['costo_totale']:.2f} × {calcolo['moltiplicatore']:.1f} = €{calcolo['prezzo_base']:.2f}",
-                font=ctk.CTkFont(size=12)
-            ).pack(anchor="w", pady=2)
-            
-            if calcolo['con_iva']:
-                ctk.CTkLabel(
-                    dettagli_frame,
-                    text=f"  • IVA ({calcolo['iva_percentuale']:.1f}%): €{calcolo['iva_applicata']:.2f}",
-                    font=ctk.CTkFont(size=12)
-                ).pack(anchor="w", pady=2)
-            
-            ctk.CTkLabel(
-                dettagli_frame,
-                text=f"  • Arrotondamento: €{calcolo['prezzo_base']:.2f} → €{calcolo['prezzo_finale']:.2f}",
-                font=ctk.CTkFont(size=12)
-            ).pack(anchor="w", pady=2)
-            
             # Risultato finale
             ctk.CTkLabel(
                 dettagli_frame,
                 text="💰 Prezzo di Vendita Suggerito:",
-                font=ctk.CTkFont(size=16, weight="bold"),
+                font=self._font(16, "bold"),
                 text_color="#059669"
             ).pack(pady=(20, 5), anchor="w")
             
             ctk.CTkLabel(
                 dettagli_frame,
                 text=f"€{calcolo['prezzo_finale']:.2f}",
-                font=ctk.CTkFont(size=24, weight="bold"),
+                font=self._font(24, "bold"),
                 text_color="#059669"
             ).pack(anchor="w", pady=5)
             
@@ -1492,25 +1773,20 @@ class GestionaleApp:
                     if var.get():
                         operazioni_selezionate.append(operazione_id)
             
-            # Raccogli ricambi selezionati
+            # Raccogli ricambi selezionati e somma il loro costo in un solo passaggio
             ricambi_selezionati = []
-            if hasattr(self, 'ricambi_modifica_vars'):
-                for ricambio_id, var in self.ricambi_modifica_vars.items():
-                    if var.get():
-                        ricambi_selezionati.append(ricambio_id)
-            
-            # Calcola il nuovo prezzo
             costo_acquisto = bici.get('prezzo_acquisto', 0.0)
             costo_ricambi = 0.0
             
             if hasattr(self, 'ricambi_modifica_vars'):
-                ricambi_disponibili = self.bici_usate_controller.get_ricambi_disponibili()
+                ricambi_disponibili = self._get_ricambi_disponibili(self.bici_usate_controller)
+                ricambi_by_id = {r['id']: r for r in ricambi_disponibili}
                 for ricambio_id, var in self.ricambi_modifica_vars.items():
                     if var.get():
-                        for ricambio in ricambi_disponibili:
-                            if ricambio['id'] == ricambio_id:
-                                costo_ricambi += ricambio['prezzo_vendita']
-                                break
+                        ricambi_selezionati.append(ricambio_id)
+                        ricambio = ricambi_by_id.get(ricambio_id)
+                        if ricambio:
+                            costo_ricambi += ricambio['prezzo_vendita']
             
             # Calcola prezzo finale
             calcolo = self.pricing_controller.calcola_prezzo_bicicletta(
@@ -1525,6 +1801,12 @@ class GestionaleApp:
                 tipo_bicicletta="ricondizionata",
                 calcolo=calcolo
             )
+            self._invalida_cache_ricambi()
+            self._invalida_cache_bici()
+            # Riporta sul record i totali salvati, così la riga non mostra valori vecchi
+            bici['costo_totale'] = calcolo['costo_totale']
+            bici['prezzo_vendita'] = calcolo['prezzo_finale']
+            _prepara_testi_bici(bici)
             
             # Mostra conferma
             messagebox.showinfo(
@@ -1539,8 +1821,8 @@ class GestionaleApp:
             # Chiudi la finestra
             dialog.destroy()
             
-            # Aggiorna la lista
-            self._mostra_bici_in_lavorazione()
+            # Aggiorna solo la riga della bicicletta
+            self._aggiorna_riga_bici(bici)
             
         except Exception as e:
             logger.error(f"Errore salvataggio modifiche scheda lavoro: {e}")
@@ -1552,15 +1834,10 @@ class GestionaleApp:
             # Crea finestra calcolo costi
             dialog = ctk.CTkToplevel(self.root)
             dialog.title("Calcolo Costi Ricondizionamento")
-            dialog.geometry("800x600")
+            dialog.geometry(self._geometria_centrata(800, 600))
             dialog.transient(self.root)
             dialog.grab_set()
             
-            # Centra la finestra
-            x = (dialog.winfo_screenwidth() // 2) - (800 // 2)
-            y = (dialog.winfo_screenheight() // 2) - (600 // 2)
-            dialog.geometry(f"800x600+{x}+{y}")
-            
             # Titolo
             title_label = ctk.CTkLabel(
                 dialog,
@@ -1596,6 +1873,25 @@ class GestionaleApp:
             # Frame per i risultati
             results_frame = ctk.CTkScrollableFrame(dialog, height=400)
             results_frame.pack(fill="both", expand=True, padx=20, pady=10)
+            dialog._results_frame = results_frame
+            
+            # Stato del calcolo costi, legato al dialog: ricambi indicizzati, selezioni,
+            # IVA e id del ricalcolo pianificato (debounce dei campi quantità)
+            dialog._calcolo_widgets = None
+            dialog._ricambi_by_id = {}
+            dialog._ricambi_vars = {}
+            dialog._quantita_vars = {}
+            dialog._costi_con_iva = iva_var.get()
+            dialog._recompute_after_id = None
+            dialog.bind("<Destroy>", partial(self._on_destroy_calcolo_costi, dialog), add="+")
+            
+            # Stato vuoto "nessun ricambio": creato una volta, mostrato solo se serve
+            dialog._empty_inventory_label = ctk.CTkLabel(
+                results_frame,
+                text="Nessun ricambio disponibile",
+                font=self._font(14),
+                text_color="#6B7280"
+            )
             
             # Calcola costi iniziali
             self._ricalcola_costi(dialog, bici, iva_var.get())
@@ -1604,138 +1900,301 @@ class GestionaleApp:
             logger.error(f"Errore calcolo costi ricondizionamento: {e}")
             messagebox.showerror("Errore", f"Errore nel calcolo: {e}")
 
+    def _get_ricambi_disponibili(self, controller):
+        """Restituisce i ricambi disponibili del controller, con cache a breve scadenza"""
+        return get_cache_manager().get_or_set(
+            f"{_RICAMBI_CACHE_PREFIX}{type(controller).__name__}",
+            controller.get_ricambi_disponibili,
+            ttl=_RICAMBI_CACHE_TTL
+        )
+
+    def _invalida_cache_ricambi(self):
+        """Invalida la cache dei ricambi dopo una scrittura che può modificarli"""
+        get_cache_manager().invalidate_pattern(_RICAMBI_CACHE_PREFIX)
+
+    def _get_ricond_controller(self):
+        """Restituisce il controller bici ricondizionate, creandolo solo se l'avvio non c'è riuscito"""
+        controller = self.bici_ricondizionate_controller
+        if controller is None:
+            # Doppio controllo sotto lock: una sola istanza anche con chiamate concorrenti
+            with self._ricond_controller_lock:
+                controller = self.bici_ricondizionate_controller
+                if controller is None:
+                    from src.modules.biciclette.bici_ricondizionate_controller import BiciRicondizionateController
+                    controller = self.bici_ricondizionate_controller = BiciRicondizionateController("data")
+        return controller
+
+    def _snapshot_bici(self):
+        """Partiziona in un solo caricamento le bici delle viste sospeso/lavorazione/da vendere"""
+        # Senza invalidazione esplicita lo snapshot vale solo per un breve intervallo
+        if self._cache_dirty or time.monotonic() - self._snapshot_caricato >= _BICI_SNAPSHOT_TTL:
+            controller = self._get_ricond_controller()
+            snapshot = {nome: [] for nome in _STATO_BUCKETS}
+            aperte = controller.get_biciclette(completate=False)
+            # Colonna degli stati normalizzati, poi partizione per indice inverso
+            stati = [_stato_normalizzato(bici.get('stato_ricondizionamento') or '') for bici in aperte]
+            for bici, stato in zip(aperte, stati):
+                nome = _BUCKET_PER_STATO.get(stato)
+                if nome is not None:
+                    snapshot[nome].append(_prepara_testi_bici(bici))
+            snapshot["da_vendere"] = [
+                _prepara_testi_bici(bici) for bici in controller.get_biciclette(completate=True)
+            ]
+            self._filter_cache = snapshot
+            self._bici_by_id = {bici['id']: bici for lista in snapshot.values() for bici in lista}
+            self._cache_dirty = False
+            self._snapshot_caricato = time.monotonic()
+        return self._filter_cache
+
+    def _su_bici(self, handler, bici_id):
+        """Esegue handler sul record corrente della bici, risolto per id dallo snapshot"""
+        self._snapshot_bici()
+        bici = self._bici_by_id.get(bici_id)
+        if bici is None:
+            logger.warning(f"Bicicletta ricondizionata {bici_id} non più presente")
+            messagebox.showerror("Errore", "Bicicletta non trovata: la lista verrà aggiornata")
+            self._schedula_refresh_ricond()
+            return
+        handler(bici)
+
+    def _get_bici_per_stato(self, bucket):
+        """Restituisce le bici della vista `bucket` dallo snapshot corrente"""
+        return self._snapshot_bici()[bucket]
+
+    def _invalida_cache_bici(self):
+        """Invalida le liste bici filtrate dopo un'aggiunta, eliminazione o modifica"""
+        self._cache_dirty = True
+
+    def _on_destroy_calcolo_costi(self, dialog, event):
+        """Annulla il ricalcolo pianificato quando il dialog calcolo costi viene chiuso"""
+        # <Destroy> arriva anche per ogni widget figlio: conta solo il dialog
+        if event.widget is dialog and dialog._recompute_after_id:
+            self.root.after_cancel(dialog._recompute_after_id)
+            dialog._recompute_after_id = None
+
     def _on_iva_change(self, con_iva, dialog, bici):
-        """Gestisce il cambio di IVA"""
-        self._ricalcola_costi(dialog, bici, con_iva)
+        """Gestisce il cambio di IVA: ricalcola solo il blocco costi"""
+        dialog._costi_con_iva = con_iva
+        if not getattr(dialog, '_results_frame', None) or not dialog._ricambi_vars:
+            return
+        self._recompute_cost_block(dialog, bici)
 
     def _ricalcola_costi(self, dialog, bici, con_iva):
-        """Ricalcola i costi di ricondizionamento"""
+        """Ricalcola i costi di ricondizionamento ricaricando i ricambi"""
         try:
             # Trova il frame dei risultati
-            results_frame = None
-            for widget in dialog.winfo_children():
-                if isinstance(widget, ctk.CTkScrollableFrame):
-                    results_frame = widget
-                    break
+            results_frame = getattr(dialog, '_results_frame', None)
             
             if not results_frame:
                 return
             
-            # Pulisci il frame
-            for widget in results_frame.winfo_children():
-                widget.destroy()
-            
-            # Ottieni ricambi disponibili
-            ricambi_disponibili = self.bici_ricondizionate_controller.get_ricambi_disponibili()
+            dialog._costi_con_iva = con_iva
             
-            if not ricambi_disponibili:
-                ctk.CTkLabel(
-                    results_frame,
-                    text="Nessun ricambio disponibile",
-                    font=ctk.CTkFont(size=14),
-                    text_color="#6B7280"
-                ).pack(pady=20)
-                return
+            # Stacca il frame durante la ricostruzione: la geometria viene
+            # calcolata una sola volta quando viene ri-pacchettato
+            results_frame.pack_forget()
+            try:
+                if self._build_ricambi_tree(dialog, bici):
+                    # Calcola costi iniziali
+                    self._recompute_cost_block(dialog, bici)
+            finally:
+                results_frame.pack(fill="both", expand=True, padx=20, pady=10)
             
-            # Crea sezione selezione ricambi
+        except Exception as e:
+            logger.error(f"Errore ricalcolo costi: {e}")
+
+    def _build_ricambi_tree(self, dialog, bici):
+        """Crea l'elenco dei ricambi selezionabili; restituisce False se non ce ne sono"""
+        # Pulisci il frame, mantenendo l'etichetta di stato vuoto condivisa
+        results_frame = dialog._results_frame
+        empty_label = dialog._empty_inventory_label
+        for widget in results_frame.winfo_children():
+            if widget is not empty_label:
+                widget.destroy()
+        dialog._calcolo_widgets = None
+        
+        # Ottieni ricambi disponibili e indicizzali per id: _recompute_cost_block
+        # li risolve ad ogni toggle/tasto senza interrogare di nuovo il controller
+        ricambi_disponibili = self._get_ricambi_disponibili(self._get_ricond_controller())
+        dialog._ricambi_by_id = {r['id']: r for r in ricambi_disponibili}
+        
+        # Variabili per checkbox, condivise con _recompute_cost_block
+        ricambi_vars = dialog._ricambi_vars = {}
+        quantita_vars = dialog._quantita_vars = {}
+        
+        if not ricambi_disponibili:
+            empty_label.pack(pady=20)
+            return False
+        empty_label.pack_forget()
+        
+        # Crea sezione selezione ricambi
+        ctk.CTkLabel(
+            results_frame,
+            text="🔧 Seleziona Ricambi Necessari:",
+            font=self._font(14, "bold")
+        ).pack(pady=10, anchor="w")
+        
+        # Le quantità accettano solo cifre già alla pressione del tasto
+        vcmd = (results_frame.register(lambda testo: testo == "" or testo.isdecimal()), "%P")
+        
+        # Raggruppa ricambi per categoria (ordine di prima apparizione)
+        ricambi_per_categoria = defaultdict(list)
+        for ricambio in ricambi_disponibili:
+            ricambi_per_categoria[ricambio['categoria']].append(ricambio)
+        
+        # Crea checkbox per ogni categoria
+        for categoria, ricambi_cat in ricambi_per_categoria.items():
+            # Titolo categoria
             ctk.CTkLabel(
                 results_frame,
-                text="🔧 Seleziona Ricambi Necessari:",
-                font=ctk.CTkFont(size=14, weight="bold")
-            ).pack(pady=10, anchor="w")
+                text=f"{categoria}:",
+                font=self._font(12, "bold")
+            ).pack(pady=(10, 5), anchor="w")
             
-            # Variabili per checkbox
-            ricambi_vars = {}
-            quantita_vars = {}
+            # Frame per ricambi della categoria
+            cat_frame = ctk.CTkFrame(results_frame, fg_color="transparent")
+            cat_frame.pack(fill="x", padx=20, pady=5)
             
-            # Raggruppa ricambi per categoria
-            ricambi_per_categoria = {}
-            for ricambio in ricambi_disponibili:
-                categoria = ricambio['categoria']
-                if categoria not in ricambi_per_categoria:
-                    ricambi_per_categoria[categoria] = []
-                ricambi_per_categoria[categoria].append(ricambio)
-            
-            # Crea checkbox per ogni categoria
-            for categoria, ricambi_cat in ricambi_per_categoria.items():
-                # Titolo categoria
-                ctk.CTkLabel(
-                    results_frame,
-                    text=f"{categoria}:",
-                    font=ctk.CTkFont(size=12, weight="bold")
-                ).pack(pady=(10, 5), anchor="w")
+            for ricambio in ricambi_cat:
+                # Frame per singolo ricambio
+                ricambio_frame = ctk.CTkFrame(cat_frame)
+                ricambio_frame.pack(fill="x", padx=5, pady=2)
                 
-                # Frame per ricambi della categoria
-                cat_frame = ctk.CTkFrame(results_frame, fg_color="transparent")
-                cat_frame.pack(fill="x", padx=20, pady=5)
+                # Checkbox selezione
+                var = ctk.BooleanVar()
+                ricambi_vars[ricambio['id']] = var
                 
-                for ricambio in ricambi_cat:
-                    # Frame per singolo ricambio
-                    ricambio_frame = ctk.CTkFrame(cat_frame)
-                    ricambio_frame.pack(fill="x", padx=5, pady=2)
-                    
-                    # Checkbox selezione
-                    var = ctk.BooleanVar()
-                    ricambi_vars[ricambio['id']] = var
-                    
-                    checkbox = ctk.CTkCheckBox(
-                        ricambio_frame,
-                        text=f"{ricambio['nome']} - €{ricambio['prezzo_acquisto']:.2f} (Disponibili: {ricambio['quantita_disponibile']})",
-                        variable=var,
-                        command=lambda: self._on_ricambi_change(results_frame, bici, con_iva, ricambi_vars, quantita_vars)
-                    )
-                    checkbox.pack(side="left", padx=10, pady=5)
-                    
-                    # Entry quantità
-                    quantita_var = ctk.StringVar(value="1")
-                    quantita_vars[ricambio['id']] = quantita_var
-                    
-                    quantita_entry = ctk.CTkEntry(
-                        ricambio_frame,
-                        textvariable=quantita_var,
-                        width=50,
-                        placeholder_text="Qty"
-                    )
-                    quantita_entry.pack(side="right", padx=10, pady=5)
-                    
-                    quantita_entry.bind('<KeyRelease>', lambda e: self._on_ricambi_change(results_frame, bici, con_iva, ricambi_vars, quantita_vars))
-            
-            # Calcola costi iniziali
-            self._on_ricambi_change(results_frame, bici, con_iva, ricambi_vars, quantita_vars)
-            
-        except Exception as e:
-            logger.error(f"Errore ricalcolo costi: {e}")
+                checkbox = ctk.CTkCheckBox(
+                    ricambio_frame,
+                    text=f"{ricambio['nome']} - €{ricambio['prezzo_acquisto']:.2f} (Disponibili: {ricambio['quantita_disponibile']})",
+                    variable=var,
+                    command=lambda: self._recompute_cost_block(dialog, bici)
+                )
+                checkbox.pack(side="left", padx=10, pady=5)
+                
+                # Entry quantità
+                quantita_var = ctk.StringVar(value="1")
+                quantita_vars[ricambio['id']] = quantita_var
+                
+                quantita_entry = ctk.CTkEntry(
+                    ricambio_frame,
+                    textvariable=quantita_var,
+                    width=50,
+                    placeholder_text="Qty",
+                    validate="key",
+                    validatecommand=vcmd
+                )
+                quantita_entry.pack(side="right", padx=10, pady=5)
+                
+                # Ricalcola solo quando il valore cambia davvero (non su frecce, Tab, ...)
+                quantita_var.trace_add("write", lambda *_: self._schedule_recompute(dialog, bici))
+        
+        return True
+
+    def _schedule_recompute(self, dialog, bici):
+        """Pianifica il ricalcolo dei costi dopo l'ultimo tasto premuto (debounce 200 ms)"""
+        if dialog._recompute_after_id:
+            self.root.after_cancel(dialog._recompute_after_id)
+        dialog._recompute_after_id = self.root.after(
+            200,
+            lambda: self._recompute_cost_block(dialog, bici)
+        )
 
-    def _on_ricambi_change(self, results_frame, bici, con_iva, ricambi_vars, quantita_vars):
-        """Gestisce il cambio di selezione ricambi"""
-        try:
-            # Trova il frame dei risultati del calcolo
-            calcolo_frame = None
-            for widget in results_frame.winfo_children():
-                if hasattr(widget, 'winfo_name') and 'calcolo' in str(widget.winfo_name()):
-                    calcolo_frame = widget
-                    break
-            
-            if calcolo_frame:
-                calcolo_frame.destroy()
-            
-            # Crea nuovo frame calcolo
-            calcolo_frame = ctk.CTkFrame(results_frame)
-            calcolo_frame.pack(fill="x", padx=20, pady=20)
+    def _build_calcolo_widgets(self, results_frame):
+        """Crea una sola volta i widget del blocco risultati del calcolo costi"""
+        calcolo_frame = ctk.CTkFrame(results_frame)
+        calcolo_frame.pack(fill="x", padx=20, pady=20)
+
+        # Messaggio per selezione vuota o errore di calcolo
+        messaggio = ctk.CTkLabel(
+            calcolo_frame,
+            text="",
+            font=self._font(12),
+            text_color="#6B7280"
+        )
+
+        # Contenitore dei risultati
+        risultati = ctk.CTkFrame(calcolo_frame, fg_color="transparent")
+
+        ctk.CTkLabel(
+            risultati,
+            text="💰 Risultati Calcolo:",
+            font=self._font(14, "bold")
+        ).pack(pady=10, anchor="w")
+
+        dettagli = ctk.CTkLabel(
+            risultati,
+            text="",
+            font=self._font(12),
+            justify="left"
+        )
+        dettagli.pack(pady=10, anchor="w")
+
+        # Pulsanti azione (i comandi vengono impostati ad ogni ricalcolo)
+        actions_frame = ctk.CTkFrame(risultati, fg_color="transparent")
+        actions_frame.pack(fill="x", pady=10)
+
+        # Pulsante Applica Costo
+        applica_btn = ctk.CTkButton(
+            actions_frame,
+            text="✅ Applica Costo",
+            width=150,
+            height=40,
+            font=self._font(12, "bold"),
+            fg_color="#10B981",
+            hover_color="#059669"
+        )
+        applica_btn.pack(side="left", padx=10)
+
+        # Pulsante Modifica Costo
+        modifica_btn = ctk.CTkButton(
+            actions_frame,
+            text="✏️ Modifica Costo",
+            width=150,
+            height=40,
+            font=self._font(12, "bold"),
+            fg_color="#3B82F6",
+            hover_color="#2563EB"
+        )
+        modifica_btn.pack(side="left", padx=10)
+
+        return {
+            'frame': calcolo_frame,
+            'messaggio': messaggio,
+            'risultati': risultati,
+            'dettagli': dettagli,
+            'applica_btn': applica_btn,
+            'modifica_btn': modifica_btn,
+        }
+
+    def _show_calcolo_messaggio(self, widgets, testo, colore):
+        """Mostra il messaggio del blocco calcolo al posto dei risultati"""
+        widgets['risultati'].pack_forget()
+        widgets['messaggio'].configure(text=testo, text_color=colore)
+        widgets['messaggio'].pack(pady=20)
+
+    def _recompute_cost_block(self, dialog, bici):
+        """Ricalcola il blocco costi per la selezione ricambi e l'IVA correnti"""
+        # Un ricalcolo immediato (checkbox) rende superfluo quello pianificato
+        if dialog._recompute_after_id:
+            self.root.after_cancel(dialog._recompute_after_id)
+            dialog._recompute_after_id = None
+        try:
+            # I widget del calcolo vengono creati al primo ricalcolo del dialog;
+            # i successivi aggiornano solo testi e comandi
+            widgets = dialog._calcolo_widgets
+            if widgets is None:
+                widgets = dialog._calcolo_widgets = self._build_calcolo_widgets(dialog._results_frame)
             
             # Ottieni ricambi selezionati
             ricambi_selezionati = []
-            for ricambio_id, var in ricambi_vars.items():
+            for ricambio_id, var in dialog._ricambi_vars.items():
                 if var.get():
-                    quantita_str = quantita_vars[ricambio_id].get()
-                    try:
-                        quantita = int(quantita_str) if quantita_str.isdigit() else 1
-                    except:
-                        quantita = 1
+                    # L'entry è validata: contiene solo cifre oppure è vuota
+                    quantita = int(dialog._quantita_vars[ricambio_id].get() or "1", 10)
                     
                     # Trova il ricambio
-                    ricambi_disponibili = self.bici_ricondizionate_controller.get_ricambi_disponibili()
-                    ricambio = next((r for r in ricambi_disponibili if r['id'] == ricambio_id), None)
+                    ricambio = dialog._ricambi_by_id.get(ricambio_id)
                     
                     if ricambio:
                         ricambi_selezionati.append({
@@ -1745,104 +2204,69 @@ class GestionaleApp:
                         })
             
             if not ricambi_selezionati:
-                ctk.CTkLabel(
-                    calcolo_frame,
-                    text="Seleziona almeno un ricambio per calcolare i costi",
-                    font=ctk.CTkFont(size=12),
-                    text_color="#6B7280"
-                ).pack(pady=20)
+                self._show_calcolo_messaggio(
+                    widgets, "Seleziona almeno un ricambio per calcolare i costi", "#6B7280"
+                )
                 return
             
             # Calcola costi
-            calcolo = self.bici_ricondizionate_controller.calcola_costo_ricondizionamento(
-                bici['id'], ricambi_selezionati, con_iva
+            calcolo = self._get_ricond_controller().calcola_costo_ricondizionamento(
+                bici['id'], ricambi_selezionati, dialog._costi_con_iva
             )
             
             if 'errore' in calcolo:
-                ctk.CTkLabel(
-                    calcolo_frame,
-                    text=f"Errore: {calcolo['errore']}",
-                    font=ctk.CTkFont(size=12),
-                    text_color="#EF4444"
-                ).pack(pady=20)
+                self._show_calcolo_messaggio(widgets, f"Errore: {calcolo['errore']}", "#EF4444")
                 return
             
-            # Mostra risultati
-            ctk.CTkLabel(
-                calcolo_frame,
-                text="💰 Risultati Calcolo:",
-                font=ctk.CTkFont(size=14, weight="bold")
-            ).pack(pady=10, anchor="w")
-            
             # Dettagli calcolo
-            dettagli_text = f"""
-Costo Base (Acquisto): €{calcolo['costo_base']:.2f}
-
-Ricambi:
-  • Senza IVA: €{calcolo['costo_ricambi_senza_iva']:.2f}
-  • Con IVA: €{calcolo['costo_ricambi_con_iva']:.2f}
-  • Finale: €{calcolo['costo_ricambi_finale']:.2f}
-
-Raddoppio (Logica Officina):
-  • Bicicletta: €{calcolo['costo_bici_raddoppiato']:.2f}
-  • Ricambi: €{calcolo['costo_ricambi_raddoppiato']:.2f}
-  • Totale: €{calcolo['costo_totale_prima_arrotondamento']:.2f}
-
-Arrotondamento: €{calcolo['costo_totale_arrotondato']:.2f}
-Margine: €{calcolo['margine']:.2f}
-            """
-            
-            ctk.CTkLabel(
-                calcolo_frame,
-                text=dettagli_text.strip(),
-                font=ctk.CTkFont(size=12),
-                justify="left"
-            ).pack(pady=10, anchor="w")
-            
-            # Pulsanti azione
-            actions_frame = ctk.CTkFrame(calcolo_frame, fg_color="transparent")
-            actions_frame.pack(fill="x", pady=10)
+            dettagli_text = _DETTAGLI_COSTI_TEMPLATE.format_map(calcolo)
             
-            # Pulsante Applica Costo
-            applica_btn = ctk.CTkButton(
-                actions_frame,
-                text="✅ Applica Costo",
-                command=lambda: self._applica_costo_calcolato(bici, calcolo['costo_totale']),
-                width=150,
-                height=40,
-                font=ctk.CTkFont(size=12, weight="bold"),
-                fg_color="#10B981",
-                hover_color="#059669"
+            # Aggiorna i widget esistenti invece di ricrearli
+            costo_totale = calcolo['costo_totale']
+            widgets['dettagli'].configure(text=dettagli_text)
+            widgets['applica_btn'].configure(
+                command=lambda: self._applica_costo_calcolato(bici, costo_totale)
             )
-            applica_btn.pack(side="left", padx=10)
-            
-            # Pulsante Modifica Costo
-            modifica_btn = ctk.CTkButton(
-                actions_frame,
-                text="✏️ Modifica Costo",
-                command=lambda: self._modifica_costo_manuale(bici, calcolo['costo_totale']),
-                width=150,
-                height=40,
-                font=ctk.CTkFont(size=12, weight="bold"),
-                fg_color="#3B82F6",
-                hover_color="#2563EB"
+            widgets['modifica_btn'].configure(
+                command=lambda: self._modifica_costo_manuale(bici, costo_totale)
             )
-            modifica_btn.pack(side="left", padx=10)
+            widgets['messaggio'].pack_forget()
+            widgets['risultati'].pack(fill="x")
             
         except Exception as e:
             logger.error(f"Errore cambio ricambi: {e}")
 
+    @staticmethod
+    def _testo_costi_bici(bici):
+        """Testo della riga costi di una bicicletta in lavorazione"""
+        return _COSTI_RIGA_TEMPLATE.format(
+            acquisto=bici.get('prezzo_acquisto', 0),
+            totale=bici.get('costo_totale', 0)
+        )
+
+    def _aggiorna_riga_bici(self, bici):
+        """Aggiorna solo la riga costi della bici; ricarica la lista se la riga non c'è"""
+        row = self._bici_row_widgets.get(bici['id'])
+        if row and row['cost_label'].winfo_exists():
+            row['cost_label'].configure(text=self._testo_costi_bici(bici))
+        else:
+            self._mostra_bici_in_lavorazione()
+
     def _applica_costo_calcolato(self, bici, costo_totale):
         """Applica il costo calcolato alla bicicletta"""
         try:
-            success = self.bici_ricondizionate_controller.aggiorna_costo_bicicletta(
+            success = self._get_ricond_controller().aggiorna_costo_bicicletta(
                 bici['id'], costo_totale, f"Costo calcolato automaticamente - {costo_totale:.2f}€"
             )
             
             if success:
+                self._invalida_cache_ricambi()
+                self._invalida_cache_bici()
+                bici['costo_totale'] = costo_totale
+                _prepara_testi_bici(bici)
                 messagebox.showinfo("Successo", f"Costo aggiornato: €{costo_totale:.2f}")
-                # Ricarica la lista
-                self._mostra_bici_in_lavorazione()
+                # Aggiorna solo la riga della bicicletta
+                self._aggiorna_riga_bici(bici)
             else:
                 messagebox.showerror("Errore", "Errore nell'aggiornamento del costo")
                 
@@ -1853,17 +2277,10 @@ Margine: €{calcolo['margine']:.2f}
     def _modifica_costo_manuale(self, bici, costo_suggerito):
         """Modifica manualmente il costo della bicicletta"""
         try:
-            # Crea finestra modifica costo
-            dialog = ctk.CTkToplevel(self.root)
-            dialog.title("Modifica Costo Bicicletta")
-            dialog.geometry("400x300")
-            dialog.transient(self.root)
-            dialog.grab_set()
-            
-            # Centra la finestra
-            x = (dialog.winfo_screenwidth() // 2) - (400 // 2)
-            y = (dialog.winfo_screenheight() // 2) - (300 // 2)
-            dialog.geometry(f"400x300+{x}+{y}")
+            # Finestra modifica costo (riutilizzata tra le aperture)
+            dialog = self._apri_dialog_riutilizzabile(
+                "modifica_costo", "Modifica Costo Bicicletta", 400, 300
+            )
             
             # Titolo
             title_label = ctk.CTkLabel(
@@ -1922,7 +2339,7 @@ Margine: €{calcolo['margine']:.2f}
             cancel_btn = ctk.CTkButton(
                 button_frame,
                 text="❌ Annulla",
-                command=dialog.destroy,
+                command=lambda: self._nascondi_dialog(dialog),
                 width=100,
                 height=40,
                 font=ctk.CTkFont(size=12, weight="bold"),
@@ -1935,6 +2352,44 @@ Margine: €{calcolo['margine']:.2f}
             logger.error(f"Errore modifica costo manuale: {e}")
             messagebox.showerror("Errore", f"Errore: {e}")
 
+    def _apri_dialog_riutilizzabile(self, nome, titolo, width, height, parent=None):
+        """Mostra un dialog modale creato una sola volta e riutilizzato.
+
+        Alla prima apertura crea e centra il CTkToplevel; alle successive ne
+        svuota il contenuto e lo riporta in primo piano.
+        """
+        parent = parent or self.root
+        dialog = self._dialogs.get(nome)
+        if dialog is None or not dialog.winfo_exists():
+            dialog = ctk.CTkToplevel(self.root)
+            
+            # Centra la finestra
+            dialog.geometry(self._geometria_centrata(width, height))
+            dialog.protocol("WM_DELETE_WINDOW", lambda: self._nascondi_dialog(dialog))
+            self._dialogs[nome] = dialog
+        else:
+            _destroy_all(dialog)
+            dialog.deiconify()
+        
+        dialog.title(titolo)
+        dialog.transient(parent)
+        # Finestra che riprende il grab modale quando il dialog viene nascosto
+        dialog._parent_modale = parent
+        dialog.grab_set()
+        return dialog
+
+    def _nascondi_dialog(self, dialog):
+        """Nasconde un dialog riutilizzabile invece di distruggerlo"""
+        dialog.grab_release()
+        dialog.withdraw()
+        # Non resta legato a un dialog padre che potrebbe essere distrutto
+        dialog.transient(self.root)
+        # Il dialog padre, se ancora aperto, torna modale
+        parent = getattr(dialog, '_parent_modale', None)
+        dialog._parent_modale = None
+        if parent is not None and parent is not self.root and parent.winfo_exists():
+            parent.grab_set()
+
     def _salva_costo_modificato(self, bici, nuovo_costo_str, note, dialog):
         """Salva il costo modificato"""
         try:
@@ -1946,15 +2401,19 @@ Margine: €{calcolo['margine']:.2f}
                 messagebox.showerror("Errore", "Costo non valido")
                 return
             
-            success = self.bici_ricondizionate_controller.aggiorna_costo_bicicletta(
+            success = self._get_ricond_controller().aggiorna_costo_bicicletta(
                 bici['id'], nuovo_costo, note
             )
             
             if success:
+                self._invalida_cache_ricambi()
+                self._invalida_cache_bici()
+                bici['costo_totale'] = nuovo_costo
+                _prepara_testi_bici(bici)
                 messagebox.showinfo("Successo", f"Costo aggiornato: €{nuovo_costo:.2f}")
-                dialog.destroy()
-                # Ricarica la lista
-                self._mostra_bici_in_lavorazione()
+                self._nascondi_dialog(dialog)
+                # Aggiorna solo la riga della bicicletta
+                self._aggiorna_riga_bici(bici)
             else:
                 messagebox.showerror("Errore", "Errore nell'aggiornamento del costo")
                 
@@ -1969,23 +2428,16 @@ Margine: €{calcolo['margine']:.2f}
     def _mostra_raccomandazioni_valutazione(self, parent_dialog, raccomandazioni, bici_id):
         """Mostra le raccomandazioni di valutazione e chiede conferma"""
         try:
-            # Crea finestra raccomandazioni
-            rec_dialog = ctk.CTkToplevel(parent_dialog)
-            rec_dialog.title("Raccomandazioni Valutazione")
-            rec_dialog.geometry("600x500")
-            rec_dialog.transient(parent_dialog)
-            rec_dialog.grab_set()
-            
-            # Centra la finestra
-            x = (rec_dialog.winfo_screenwidth() // 2) - (600 // 2)
-            y = (rec_dialog.winfo_screenheight() // 2) - (500 // 2)
-            rec_dialog.geometry(f"600x500+{x}+{y}")
+            # Finestra raccomandazioni (riutilizzata tra le aperture)
+            rec_dialog = self._apri_dialog_riutilizzabile(
+                "raccomandazioni", "Raccomandazioni Valutazione", 600, 500, parent_dialog
+            )
             
             # Titolo
             title_label = ctk.CTkLabel(
                 rec_dialog,
                 text="🔍 Raccomandazioni Valutazione",
-                font=ctk.CTkFont(size=18, weight="bold")
+                font=self._font(18, "bold")
             )
             title_label.pack(pady=15, padx=15, anchor="w")
             
@@ -1994,7 +2446,7 @@ Margine: €{calcolo['margine']:.2f}
             info_frame.pack(fill="x", padx=15, pady=10)
             
             ctk.CTkLabel(info_frame, text=f"Bicicletta: {raccomandazioni['marca']} {raccomandazioni['modello']}", 
-                        font=ctk.CTkFont(size=14, weight="bold")).pack(pady=5, padx=10, anchor="w")
+                        font=self._font(14, "bold")).pack(pady=5, padx=10, anchor="w")
             ctk.CTkLabel(info_frame, text=f"Colore: {raccomandazioni.get('colore', 'N/A')}").pack(pady=2, padx=10, anchor="w")
             ctk.CTkLabel(info_frame, text=f"Stato: {raccomandazioni['stato_valutazione']}").pack(pady=2, padx=10, anchor="w")
             
@@ -2002,15 +2454,15 @@ Margine: €{calcolo['margine']:.2f}
             msg_frame = ctk.CTkFrame(rec_dialog)
             msg_frame.pack(fill="x", padx=15, pady=10)
             
-            ctk.CTkLabel(msg_frame, text="Raccomandazione:", font=ctk.CTkFont(size=12, weight="bold")).pack(pady=5, padx=10, anchor="w")
+            ctk.CTkLabel(msg_frame, text="Raccomandazione:", font=self._font(12, "bold")).pack(pady=5, padx=10, anchor="w")
             ctk.CTkLabel(msg_frame, text=raccomandazioni['messaggio'], 
-                        font=ctk.CTkFont(size=11)).pack(pady=2, padx=10, anchor="w")
+                        font=self._font(11)).pack(pady=2, padx=10, anchor="w")
             
             # Azioni disponibili
             actions_frame = ctk.CTkFrame(rec_dialog)
             actions_frame.pack(fill="x", padx=15, pady=10)
             
-            ctk.CTkLabel(actions_frame, text="Azioni Disponibili:", font=ctk.CTkFont(size=12, weight="bold")).pack(pady=5, padx=10, anchor="w")
+            ctk.CTkLabel(actions_frame, text="Azioni Disponibili:", font=self._font(12, "bold")).pack(pady=5, padx=10, anchor="w")
             
             for _, azione in enumerate(raccomandazioni['azioni_disponibili']):
                 # '_' perché l'indice non è usato
@@ -2028,7 +2480,7 @@ Margine: €{calcolo['margine']:.2f}
                     command=lambda: self._conferma_vendita_diretta(rec_dialog, parent_dialog, bici_id),
                     width=200,
                     height=40,
-                    font=ctk.CTkFont(size=12, weight="bold"),
+                    font=self._font(12, "bold"),
                     fg_color="#059669",
                     hover_color="#047857"
                 )
@@ -2042,7 +2494,7 @@ Margine: €{calcolo['margine']:.2f}
                     command=lambda: self._conferma_spostamento_ricondizionate(rec_dialog, parent_dialog, bici_id),
                     width=200,
                     height=40,
-                    font=ctk.CTkFont(size=12, weight="bold"),
+                    font=self._font(12, "bold"),
                     fg_color="#dc2626",
                     hover_color="#b91c1c"
                 )
@@ -2055,7 +2507,7 @@ Margine: €{calcolo['margine']:.2f}
                 command=lambda: self._mantieni_in_usate(rec_dialog, parent_dialog, bici_id),
                 width=150,
                 height=40,
-                font=ctk.CTkFont(size=12, weight="bold"),
+                font=self._font(12, "bold"),
                 fg_color="#6B7280",
                 hover_color="#4B5563"
             )
@@ -2071,7 +2523,7 @@ Margine: €{calcolo['margine']:.2f}
             success = self.bici_usate_controller.sposta_a_vendita_diretta(bici_id)
             if success:
                 messagebox.showinfo("Successo", "Bicicletta spostata a vendita diretta!")
-                rec_dialog.destroy()
+                self._nascondi_dialog(rec_dialog)
                 parent_dialog.destroy()
             else:
                 messagebox.showerror("Errore", "Errore nello spostamento a vendita diretta")
@@ -2082,17 +2534,19 @@ Margine: €{calcolo['margine']:.2f}
     def _conferma_spostamento_ricondizionate(self, rec_dialog, parent_dialog, bici_id):
         """Conferma spostamento a ricondizionate"""
         try:
-            # Inizializza controller ricondizionate se non esiste
-            if not hasattr(self, 'bici_ricondizionate_controller'):
-                from src.modules.biciclette.bici_ricondizionate_controller import (
-                    BiciRicondizionateController
-                )
-                self.bici_ricondizionate_controller = BiciRicondizionateController("data")
+            try:
+                controller = self._get_ricond_controller()
+            except Exception as e:
+                logger.error(f"Controller biciclette ricondizionate non disponibile: {e}")
+                messagebox.showerror("Errore", "Controller biciclette ricondizionate non disponibile")
+                return
             
-            success = self.bici_usate_controller.sposta_a_ricondizionate(bici_id, self.bici_ricondizionate_controller)
+            success = self.bici_usate_controller.sposta_a_ricondizionate(bici_id, controller)
             if success:
+                self._invalida_cache_ricambi()
+                self._invalida_cache_bici()
                 messagebox.showinfo("Successo", "Bicicletta spostata a ricondizionate!")
-                rec_dialog.destroy()
+                self._nascondi_dialog(rec_dialog)
                 parent_dialog.destroy()
             else:
                 messagebox.showerror("Errore", "Errore nello spostamento a ricondizionate")
@@ -2104,7 +2558,7 @@ Margine: €{calcolo['margine']:.2f}
         """Mantiene la bicicletta in usate"""
         try:
             messagebox.showinfo("Info", "Bicicletta mantenuta in categoria usate")
-            rec_dialog.destroy()
+            self._nascondi_dialog(rec_dialog)
             parent_dialog.destroy()
         except Exception as e:
             logger.error(f"Errore mantenimento in usate: {e}")
@@ -2112,254 +2566,334 @@ Margine: €{calcolo['margine']:.2f}
 
     # ===== GESTIONE BICI RICONDIZIONATE =====
 
-    def _mostra_bici_in_sospeso(self):
-        """Mostra biciclette in sospeso"""
+    def _mostra_bici_ricond(self, vista):
+        """Mostra la vista bici ricondizionate `vista` descritta in _RICOND_VIEWS"""
+        titolo, sottotitolo, con_costi, descrizione = _RICOND_VIEWS[vista]
+        self._current_ricond_view = vista
         try:
-            # Inizializza controller se non esiste
-            if not hasattr(self, 'bici_ricondizionate_controller'):
-                from src.modules.biciclette.bici_ricondizionate_controller import BiciRicondizionateController
-                self.bici_ricondizionate_controller = BiciRicondizionateController("data")
-            
-            # Ottieni biciclette in sospeso (non completate)
-            biciclette = self.bici_ricondizionate_controller.get_biciclette(completate=False)
-            
-            # Filtra per stato "Sospeso" o simili
-            bici_sospeso = [bici for bici in biciclette if 
-                           bici.get('stato_ricondizionamento', '').lower() in 
-                           ['sospeso', 'in sospeso', 'pausa', 'fermo']]
-            
-            self._mostra_lista_bici_ricondizionate(
-                bici_sospeso, 
-                "⏸️ Biciclette in Sospeso",
-                "Biciclette con lavori temporaneamente sospesi"
-            )
+            # Biciclette della vista, dallo snapshot condiviso tra le tre viste
+            biciclette = self._get_bici_per_stato(vista)
+            
+            if con_costi:
+                self._mostra_lista_bici_ricondizionate_con_costi(biciclette, titolo, sottotitolo)
+            else:
+                self._mostra_lista_bici_ricondizionate(biciclette, titolo, sottotitolo)
             
         except Exception as e:
-            logger.error(f"Errore mostrazione bici in sospeso: {e}")
-            messagebox.showerror("Errore", f"Errore nel recupero bici in sospeso: {e}")
+            logger.error(f"Errore mostrazione {descrizione}: {e}")
+            messagebox.showerror("Errore", f"Errore nel recupero {descrizione}: {e}")
+
+    def _mostra_bici_in_sospeso(self):
+        """Mostra biciclette in sospeso"""
+        self._mostra_bici_ricond("sospeso")
 
     def _mostra_bici_in_lavorazione(self):
         """Mostra biciclette in lavorazione"""
-        try:
-            # Inizializza controller se non esiste
-            if not hasattr(self, 'bici_ricondizionate_controller'):
-                from src.modules.biciclette.bici_ricondizionate_controller import BiciRicondizionateController
-                self.bici_ricondizionate_controller = BiciRicondizionateController("data")
-            
-            # Ottieni biciclette in lavorazione (non completate)
-            biciclette = self.bici_ricondizionate_controller.get_biciclette(completate=False)
-            
-            # Filtra per stato "In lavorazione" o simili
-            bici_lavorazione = [bici for bici in biciclette if 
-                              bici.get('stato_ricondizionamento', '').lower() in 
-                              ['in lavorazione', 'iniziato', 'in corso', 'attivo']]
-            
-            self._mostra_lista_bici_ricondizionate_con_costi(
-                bici_lavorazione, 
-                "🔨 Biciclette in Lavorazione",
-                "Biciclette attualmente in fase di ricondizionamento"
-            )
-            
-        except Exception as e:
-            logger.error(f"Errore mostrazione bici in lavorazione: {e}")
-            messagebox.showerror("Errore", f"Errore nel recupero bici in lavorazione: {e}")
+        self._mostra_bici_ricond("lavorazione")
 
     def _mostra_bici_da_vendere(self):
         """Mostra biciclette pronte per la vendita"""
-        try:
-            # Inizializza controller se non esiste
-            if not hasattr(self, 'bici_ricondizionate_controller'):
-                from src.modules.biciclette.bici_ricondizionate_controller import BiciRicondizionateController
-                self.bici_ricondizionate_controller = BiciRicondizionateController("data")
-            
-            # Ottieni biciclette completate
-            biciclette = self.bici_ricondizionate_controller.get_biciclette(completate=True)
-            
-            self._mostra_lista_bici_ricondizionate(
-                biciclette, 
-                "💰 Biciclette da Mettere in Vendita",
-                "Biciclette completate e pronte per la vendita"
-            )
-            
-        except Exception as e:
-            logger.error(f"Errore mostrazione bici da vendere: {e}")
-            messagebox.showerror("Errore", f"Errore nel recupero bici da vendere: {e}")
+        self._mostra_bici_ricond("da_vendere")
+
+    def _pulisci_contenuto_tab(self):
+        """Svuota il contenuto tab: nasconde le viste persistenti e distrugge il resto"""
+        # Scarta le viste distrutte da altre schermate che hanno pulito il contenuto
+        self._view_frames = {n: f for n, f in self._view_frames.items() if f.winfo_exists()}
+        _destroy_all(self.tab_content_frame, keep=self._view_frames.values())
+
+    def _mostra_view(self, nome, costruisci):
+        """Mostra la vista persistente `nome` nel contenuto tab, costruendola solo la prima volta"""
+        # Vista già a schermo (es. doppio click sullo stesso pulsante): niente da fare
+        if self._view_visibile(nome):
+            return self._view_frames[nome]
+
+        self._pulisci_contenuto_tab()
+
+        frame = self._view_frames.get(nome)
+        if frame is None:
+            frame = ctk.CTkFrame(self.tab_content_frame, fg_color="transparent")
+            costruisci(frame)
+            self._view_frames[nome] = frame
+        frame.pack(fill="both", expand=True)
+        return frame
+
+    def _view_visibile(self, nome):
+        """True se la vista persistente `nome` è l'unico contenuto attualmente mostrato"""
+        frame = self._view_frames.get(nome)
+        if frame is None or not frame.winfo_exists() or frame.winfo_manager() != "pack":
+            return False
+        # Altre schermate possono aver disegnato nel contenuto senza nascondere la vista
+        return self.tab_content_frame.pack_slaves() == [frame]
+
+    def _build_lista_bici_ricondizionate_view(self, view):
+        """Costruisce la cornice fissa della lista bici ricondizionate (titolo, corpo, pulsanti)"""
+        # Titolo
+        view._title_label = ctk.CTkLabel(view, text="", font=self._font(24, "bold"))
+        view._title_label.pack(pady=20)
+
+        # Sottotitolo
+        view._subtitle_label = ctk.CTkLabel(view, text="", font=self._font(16))
+        view._subtitle_label.pack(pady=(0, 30))
+
+        # Corpo della lista, l'unica parte ricostruita a ogni visualizzazione
+        view._body_frame = ctk.CTkFrame(view, fg_color="transparent")
+        view._body_frame.pack(fill="both", expand=True)
+
+        # Pulsanti di controllo
+        button_frame = ctk.CTkFrame(view, fg_color="transparent")
+        button_frame.pack(pady=20)
+
+        # Pulsante Torna Indietro
+        back_btn = ctk.CTkButton(
+            button_frame,
+            text="⬅️ Torna Indietro",
+            command=self._seleziona_bici_ricondizionate,
+            width=200,
+            height=40,
+            font=self._font(14, "bold"),
+            fg_color="#6B7280",
+            hover_color="#4B5563"
+        )
+        back_btn.pack(side="left", padx=10)
+
+        # Pulsante Chiudi Tab
+        close_btn = ctk.CTkButton(
+            button_frame,
+            text="❌ Chiudi Tab",
+            command=partial(self.tab_manager.close_tab, "nuovo_lavoro"),
+            width=200,
+            height=40,
+            font=self._font(14, "bold"),
+            fg_color="#DC2626",
+            hover_color="#B91C1C"
+        )
+        close_btn.pack(side="left", padx=10)
 
     def _mostra_lista_bici_ricondizionate(self, biciclette, titolo, sottotitolo):
         """Mostra una lista di biciclette ricondizionate"""
         try:
-            # Pulisce il frame del contenuto
-            for widget in self.tab_content_frame.winfo_children():
-                widget.destroy()
+            # Stessa vista vuota ancora a schermo: niente da ricostruire
+            if (not biciclette and self._last_lista_count == 0
+                    and titolo == self._last_lista_titolo
+                    and self._view_visibile("lista_bici_ricondizionate")):
+                return
 
-            # Titolo
-            title_label = ctk.CTkLabel(
-                self.tab_content_frame,
-                text=titolo,
-                font=ctk.CTkFont(size=24, weight="bold")
-            )
-            title_label.pack(pady=20)
+            # Vista persistente: titolo, sottotitolo e pulsanti vengono creati una volta
+            view = self._mostra_view("lista_bici_ricondizionate", self._build_lista_bici_ricondizionate_view)
+            view._title_label.configure(text=titolo)
+            view._subtitle_label.configure(text=sottotitolo)
+            self._last_lista_titolo = titolo
+            self._last_lista_count = len(biciclette)
+
+            # Lista virtualizzata già nel corpo: si sostituiscono i dati riciclando le righe
+            stato = self._lista_virtuale
+            if biciclette and stato is not None and stato['frame'].winfo_exists():
+                stato['elementi'] = biciclette
+                stato['first'] = 0
+                self._ridimensiona_lista_virtuale(stato, stato['altezza'])
+                return
 
-            # Sottotitolo
-            subtitle_label = ctk.CTkLabel(
-                self.tab_content_frame,
-                text=sottotitolo,
-                font=ctk.CTkFont(size=16)
-            )
-            subtitle_label.pack(pady=(0, 30))
+            # Ricostruisce solo il corpo della lista
+            body = view._body_frame
+            for widget in body.winfo_children():
+                widget.destroy()
+            self._lista_virtuale = None
 
             if not biciclette:
                 # Nessuna bicicletta
                 no_bici_label = ctk.CTkLabel(
-                    self.tab_content_frame,
+                    body,
                     text="Nessuna bicicletta trovata",
-                    font=ctk.CTkFont(size=16),
+                    font=self._font(16),
                     text_color="#6B7280"
                 )
                 no_bici_label.pack(pady=50)
             else:
-                # Frame scrollabile per la lista
-                scroll_frame = ctk.CTkScrollableFrame(self.tab_content_frame, height=400)
-                scroll_frame.pack(fill="both", expand=True, padx=20, pady=20)
-
-                # Mostra ogni bicicletta
-                for bici in biciclette:
-                    self._create_bici_ricondizionata_widget(scroll_frame, bici)
-
-            # Pulsanti di controllo
-            button_frame = ctk.CTkFrame(self.tab_content_frame, fg_color="transparent")
-            button_frame.pack(pady=20)
-
-            # Pulsante Torna Indietro
-            back_btn = ctk.CTkButton(
-                button_frame,
-                text="⬅️ Torna Indietro",
-                command=self._seleziona_bici_ricondizionate,
-                width=200,
-                height=40,
-                font=ctk.CTkFont(size=14, weight="bold"),
-                fg_color="#6B7280",
-                hover_color="#4B5563"
-            )
-            back_btn.pack(side="left", padx=10)
-
-            # Pulsante Chiudi Tab
-            close_btn = ctk.CTkButton(
-                button_frame,
-                text="❌ Chiudi Tab",
-                command=lambda: self.tab_manager.close_tab("nuovo_lavoro"),
-                width=200,
-                height=40,
-                font=ctk.CTkFont(size=14, weight="bold"),
-                fg_color="#DC2626",
-                hover_color="#B91C1C"
-            )
-            close_btn.pack(side="left", padx=10)
+                # Lista virtualizzata: solo le righe visibili vengono create
+                self._crea_lista_virtuale_bici(body, biciclette)
 
         except Exception as e:
             logger.error(f"Errore mostrazione lista bici ricondizionate: {e}")
             messagebox.showerror("Errore", f"Errore nella visualizzazione: {e}")
 
-    def _create_bici_ricondizionata_widget(self, parent, bici):
-        """Crea un widget per una bicicletta ricondizionata"""
-        try:
-            # Frame per la bicicletta
-            bici_frame = ctk.CTkFrame(parent)
-            bici_frame.pack(fill="x", padx=10, pady=10)
-
-            # Informazioni principali
-            info_frame = ctk.CTkFrame(bici_frame, fg_color="transparent")
-            info_frame.pack(fill="x", padx=15, pady=10)
-
-            # Marca e modello
-            marca_modello = ctk.CTkLabel(
-                info_frame,
-                text=f"{bici['marca']} {bici['modello']}",
-                font=ctk.CTkFont(size=16, weight="bold")
-            )
-            marca_modello.pack(anchor="w")
-
-            # Codice e stato
-            codice_stato = ctk.CTkLabel(
-                info_frame,
-                text=f"Codice: {bici['codice']} | Stato: {bici.get('stato_ricondizionamento', 'N/A')}",
-                font=ctk.CTkFont(size=12)
-            )
-            codice_stato.pack(anchor="w")
-
-            # Dettagli
-            dettagli = []
-            if bici.get('anno'):
-                dettagli.append(f"Anno: {bici['anno']}")
-            if bici.get('colore'):
-                dettagli.append(f"Colore: {bici['colore']}")
-            if bici.get('taglia'):
-                dettagli.append(f"Taglia: {bici['taglia']}")
-            
-            if dettagli:
-                dettagli_label = ctk.CTkLabel(
-                    info_frame,
-                    text=" | ".join(dettagli),
-                    font=ctk.CTkFont(size=11),
-                    text_color="#6B7280"
-                )
-                dettagli_label.pack(anchor="w")
+    def _crea_lista_virtuale_bici(self, parent, biciclette):
+        """Crea la lista bici virtualizzata della vista ricondizionate"""
+        self._lista_virtuale = self._crea_lista_virtuale(
+            parent, biciclette, _RIGA_BICI_SLOT,
+            self._create_bici_ricondizionata_row, self._popola_bici_ricondizionata_row
+        )
 
-            # Costi
-            costi_frame = ctk.CTkFrame(bici_frame, fg_color="transparent")
-            costi_frame.pack(fill="x", padx=15, pady=(0, 10))
+    def _crea_lista_virtuale(self, parent, elementi, slot, crea_riga, popola_riga):
+        """Crea una lista virtualizzata: esistono solo le righe visibili, riciclate allo scroll"""
+        container = ctk.CTkFrame(parent, height=400)
+        container.pack(fill="both", expand=True, padx=20, pady=20)
+
+        stato = {
+            'elementi': elementi,
+            'first': 0,
+            'rows': [],
+            'slot': slot,
+            'crea_riga': crea_riga,
+            'popola_riga': popola_riga
+        }
+
+        scrollbar = ctk.CTkScrollbar(container, command=partial(self._scroll_lista_virtuale, stato))
+        scrollbar.pack(side="right", fill="y")
+
+        rows_frame = ctk.CTkFrame(container, fg_color="transparent")
+        rows_frame.pack(side="left", fill="both", expand=True)
+
+        stato['frame'] = rows_frame
+        stato['scrollbar'] = scrollbar
+        rows_frame.bind("<Configure>", lambda event: self._ridimensiona_lista_virtuale(stato, event.height))
+        self._bind_wheel_lista_virtuale(stato, rows_frame)
+        self._ridimensiona_lista_virtuale(stato, 400)
+        return stato
+
+    def _ridimensiona_lista_virtuale(self, stato, altezza):
+        """Adegua il pool di righe all'altezza disponibile e ridisegna la finestra visibile"""
+        try:
+            if not stato['frame'].winfo_exists():
+                return
+            stato['altezza'] = altezza
+            rows = stato['rows']
+            visibili = min(len(stato['elementi']), max(1, altezza // stato['slot']))
+            while len(rows) < visibili:
+                rows.append(stato['crea_riga'](stato['frame'], stato))
+            while len(rows) > visibili:
+                rows.pop()['frame'].destroy()
+            self._mostra_finestra_lista_virtuale(stato, stato['first'])
+        except Exception as e:
+            logger.error(f"Errore ridimensionamento lista virtualizzata: {e}")
+
+    def _mostra_finestra_lista_virtuale(self, stato, first):
+        """Ripopola le righe del pool a partire dall'indice first"""
+        elementi = stato['elementi']
+        rows = stato['rows']
+        totale = len(elementi)
+        first = max(0, min(first, totale - len(rows)))
+        stato['first'] = first
+        for offset, row in enumerate(rows):
+            stato['popola_riga'](row, elementi[first + offset])
+        stato['scrollbar'].set(first / totale, (first + len(rows)) / totale)
+
+    def _scroll_lista_virtuale(self, stato, azione, valore, unita="units"):
+        """Comando della scrollbar: sposta la finestra di righe visibili"""
+        try:
+            if azione == "moveto":
+                first = round(float(valore) * len(stato['elementi']))
+            else:
+                passo = len(stato['rows']) if unita == "pages" else 1
+                first = stato['first'] + int(valore) * passo
+            self._mostra_finestra_lista_virtuale(stato, first)
+        except Exception as e:
+            logger.error(f"Errore scroll lista virtualizzata: {e}")
+
+    def _on_wheel_lista_virtuale(self, stato, event):
+        """Rotella del mouse sulla lista virtualizzata: una riga per scatto"""
+        passo = -1 if event.num == 4 or event.delta > 0 else 1
+        self._scroll_lista_virtuale(stato, "scroll", passo)
+
+    def _bind_wheel_lista_virtuale(self, stato, widget):
+        """Collega la rotella del mouse (Windows/macOS e X11) alla lista virtualizzata"""
+        on_wheel = partial(self._on_wheel_lista_virtuale, stato)
+        for sequenza in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            widget.bind(sequenza, on_wheel)
+
+    def _create_bici_ricondizionata_row(self, parent, stato):
+        """Crea una riga riciclabile della lista bici ricondizionate (senza dati)"""
+        row = {'bici': None}
+
+        # Frame per la bicicletta, ad altezza fissa per la virtualizzazione
+        bici_frame = ctk.CTkFrame(parent, height=_RIGA_BICI_ALTEZZA)
+        bici_frame.pack(fill="x", padx=10, pady=_RIGA_BICI_PADY)
+        bici_frame.pack_propagate(False)
+        row['frame'] = bici_frame
+
+        # Informazioni principali
+        info_frame = ctk.CTkFrame(bici_frame, fg_color="transparent")
+        info_frame.pack(fill="x", padx=15, pady=10)
+
+        # Marca e modello
+        row['marca_modello'] = ctk.CTkLabel(info_frame, text="", font=self._font(16, "bold"))
+        row['marca_modello'].pack(anchor="w")
+
+        # Codice e stato
+        row['codice_stato'] = ctk.CTkLabel(info_frame, text="", font=self._font(12))
+        row['codice_stato'].pack(anchor="w")
+
+        # Dettagli (vuoto se la bici non ne ha)
+        row['dettagli'] = ctk.CTkLabel(
+            info_frame,
+            text="",
+            font=self._font(11),
+            text_color="#6B7280"
+        )
+        row['dettagli'].pack(anchor="w")
+
+        # Costi
+        costi_frame = ctk.CTkFrame(bici_frame, fg_color="transparent")
+        costi_frame.pack(fill="x", padx=15, pady=(0, 10))
+
+        row['costi'] = ctk.CTkLabel(costi_frame, text="", font=self._font(11, "bold"))
+        row['costi'].pack(anchor="w")
+
+        # Pulsanti azione: leggono la bici corrente della riga al click
+        actions_frame = ctk.CTkFrame(bici_frame, fg_color="transparent")
+        actions_frame.pack(fill="x", padx=15, pady=(0, 10))
+
+        # Pulsante Dettagli
+        ctk.CTkButton(
+            actions_frame,
+            text="📋 Dettagli",
+            command=lambda: self._mostra_dettagli_bici_ricondizionata(row['bici']),
+            width=100,
+            height=30,
+            font=self._font(11)
+        ).pack(side="left", padx=5)
+
+        # Pulsante Modifica
+        ctk.CTkButton(
+            actions_frame,
+            text="✏️ Modifica",
+            command=lambda: self._modifica_bici_ricondizionata(row['bici']),
+            width=100,
+            height=30,
+            font=self._font(11)
+        ).pack(side="left", padx=5)
+
+        # Pulsante Elimina
+        ctk.CTkButton(
+            actions_frame,
+            text="🗑️ Elimina",
+            command=lambda: self._elimina_bici_ricondizionata(row['bici']),
+            width=100,
+            height=30,
+            font=self._font(11),
+            fg_color="#DC2626",
+            hover_color="#B91C1C"
+        ).pack(side="left", padx=5)
 
-            costo_acquisto = bici.get('prezzo_acquisto', 0)
-            costo_totale = bici.get('costo_totale', 0)
-            prezzo_vendita = bici.get('prezzo_vendita', 0)
+        for widget in (bici_frame, info_frame, costi_frame, actions_frame,
+                       row['marca_modello'], row['codice_stato'], row['dettagli'], row['costi']):
+            self._bind_wheel_lista_virtuale(stato, widget)
 
-            ctk.CTkLabel(
-                costi_frame,
-                text=f"Acquisto: €{costo_acquisto:.2f} | Totale: €{costo_totale:.2f} | Vendita: €{prezzo_vendita:.2f}",
-                font=ctk.CTkFont(size=11, weight="bold")
-            ).pack(anchor="w")
+        return row
 
-            # Pulsanti azione
-            actions_frame = ctk.CTkFrame(bici_frame, fg_color="transparent")
-            actions_frame.pack(fill="x", padx=15, pady=(0, 10))
+    def _popola_bici_ricondizionata_row(self, row, bici):
+        """Aggiorna testi della riga con i dati della bici (i comandi leggono row['bici'])"""
+        if row['bici'] is bici:
+            return
+        row['bici'] = bici
 
-            # Pulsante Dettagli
-            dettagli_btn = ctk.CTkButton(
-                actions_frame,
-                text="📋 Dettagli",
-                command=lambda: self._mostra_dettagli_bici_ricondizionata(bici),
-                width=100,
-                height=30,
-                font=ctk.CTkFont(size=11)
-            )
-            dettagli_btn.pack(side="left", padx=5)
-
-            # Pulsante Modifica
-            modifica_btn = ctk.CTkButton(
-                actions_frame,
-                text="✏️ Modifica",
-                command=lambda: self._modifica_bici_ricondizionata(bici),
-                width=100,
-                height=30,
-                font=ctk.CTkFont(size=11)
-            )
-            modifica_btn.pack(side="left", padx=5)
-
-            # Pulsante Elimina
-            elimina_btn = ctk.CTkButton(
-                actions_frame,
-                text="🗑️ Elimina",
-                command=lambda: self._elimina_bici_ricondizionata(bici),
-                width=100,
-                height=30,
-                font=ctk.CTkFont(size=11),
-                fg_color="#DC2626",
-                hover_color="#B91C1C"
-            )
-            elimina_btn.pack(side="left", padx=5)
-
-        except Exception as e:
-            logger.error(f"Errore creazione widget bici ricondizionata: {e}")
+        # Testi precalcolati al caricamento del record: solo letture di attributi
+        testi = bici.get('_display')
+        if testi is None:
+            testi = _prepara_testi_bici(bici)['_display']
+        row['marca_modello'].configure(text=testi.titolo)
+        row['codice_stato'].configure(text=testi.codice_stato)
+        row['dettagli'].configure(text=testi.dettagli)
+        row['costi'].configure(text=testi.costi)
 
     def _mostra_dettagli_bici_ricondizionata(self, bici):
         """Mostra i dettagli di una bicicletta ricondizionata"""
@@ -2367,15 +2901,10 @@ Margine: €{calcolo['margine']:.2f}
             # Crea finestra dettagli
             dialog = ctk.CTkToplevel(self.root)
             dialog.title("Dettagli Bicicletta Ricondizionata")
-            dialog.geometry("600x500")
+            dialog.geometry(self._geometria_centrata(600, 500))
             dialog.transient(self.root)
             dialog.grab_set()
             
-            # Centra la finestra
-            x = (dialog.winfo_screenwidth() // 2) - (600 // 2)
-            y = (dialog.winfo_screenheight() // 2) - (500 // 2)
-            dialog.geometry(f"600x500+{x}+{y}")
-            
             # Titolo
             title_label = ctk.CTkLabel(
                 dialog,
@@ -2388,37 +2917,18 @@ Margine: €{calcolo['margine']:.2f}
             details_frame = ctk.CTkScrollableFrame(dialog, height=350)
             details_frame.pack(fill="both", expand=True, padx=15, pady=10)
             
-            # Informazioni dettagliate
-            info_text = f"""
-Codice: {bici['codice']}
-Marca: {bici['marca']}
-Modello: {bici['modello']}
-Anno: {bici.get('anno', 'N/A')}
-Colore: {bici.get('colore', 'N/A')}
-Taglia: {bici.get('taglia', 'N/A')}
-Telaio: {bici.get('telaio', 'N/A')}
-
-Stato Ricondizionamento: {bici.get('stato_ricondizionamento', 'N/A')}
-Descrizione: {bici.get('descrizione', 'N/A')}
-
-Prezzo Acquisto: €{bici.get('prezzo_acquisto', 0):.2f}
-Costo Ricambi: €{bici.get('costo_ricambi', 0):.2f}
-Costo Manodopera: €{bici.get('costo_manodopera', 0):.2f}
-Costo Totale: €{bici.get('costo_totale', 0):.2f}
-Prezzo Vendita: €{bici.get('prezzo_vendita', 0):.2f}
-Margine: €{bici.get('margine', 0):.2f}
-
-Data Acquisto: {bici.get('data_acquisto', 'N/A')}
-Data Inizio: {bici.get('data_inizio_ricondizionamento', 'N/A')}
-Data Fine: {bici.get('data_fine_ricondizionamento', 'N/A')}
-Completato: {'Sì' if bici.get('completato') else 'No'}
-
-Note: {bici.get('note', 'N/A')}
-            """
+            # Informazioni dettagliate: un gruppo di righe per sezione
+            info_text = "\n\n".join(
+                "\n".join(
+                    f"{etichetta}: {formatta(bici.get(chiave, default))}"
+                    for etichetta, chiave, default, formatta in gruppo
+                )
+                for gruppo in _DETTAGLI_BICI_RICONDIZIONATA
+            )
             
             details_label = ctk.CTkLabel(
                 details_frame,
-                text=info_text.strip(),
+                text=info_text,
                 font=ctk.CTkFont(size=12),
                 justify="left"
             )
@@ -2452,22 +2962,30 @@ Note: {bici.get('note', 'N/A')}
             )
             
             if result:
-                # Inizializza controller se non esiste
-                if not hasattr(self, 'bici_ricondizionate_controller'):
-                    from src.modules.biciclette.bici_ricondizionate_controller import BiciRicondizionateController
-                    self.bici_ricondizionate_controller = BiciRicondizionateController("data")
-                
-                success = self.bici_ricondizionate_controller.elimina_bicicletta(bici['id'])
+                success = self._get_ricond_controller().elimina_bicicletta(bici['id'])
                 if success:
+                    self._invalida_cache_bici()
                     messagebox.showinfo("Successo", "Bicicletta eliminata con successo!")
-                    # Ricarica la lista
-                    self._mostra_bici_in_sospeso()  # O il metodo appropriato
+                    # Ricarica solo la vista corrente, accorpando eliminazioni ravvicinate
+                    self._schedula_refresh_ricond()
                 else:
                     messagebox.showerror("Errore", "Errore nell'eliminazione della bicicletta")
         except Exception as e:
             logger.error(f"Errore eliminazione bici ricondizionata: {e}")
             messagebox.showerror("Errore", f"Errore nell'eliminazione: {e}")
 
+    def _schedula_refresh_ricond(self):
+        """Pianifica il ricaricamento della vista ricondizionate corrente (debounce 100 ms)"""
+        if self._refresh_ricond_after_id is not None:
+            self.root.after_cancel(self._refresh_ricond_after_id)
+        self._refresh_ricond_after_id = self.root.after(100, self._refresh_ricond_view)
+
+    def _refresh_ricond_view(self):
+        """Ricarica la vista ricondizionate mostrata per ultima"""
+        self._refresh_ricond_after_id = None
+        if self._current_ricond_view:
+            self._mostra_bici_ricond(self._current_ricond_view)
+
     def _torna_al_workflow_ricondizionate(self):
         """Torna al workflow delle biciclette"""
         try:
@@ -2553,7 +3071,7 @@ Note: {bici.get('note', 'N/A')}
             codice_label = ctk.CTkLabel(
                 header_frame,
                 text=f"#{bici['codice']}",
-                font=ctk.CTkFont(size=14, weight="bold"),
+                font=self._font(14, "bold"),
                 text_color="#059669"
             )
             codice_label.pack(side="left")
@@ -2561,7 +3079,7 @@ Note: {bici.get('note', 'N/A')}
             stato_label = ctk.CTkLabel(
                 header_frame,
                 text="🟢 Disponibile" if not bici['venduta'] else "🔴 Venduta",
-                font=ctk.CTkFont(size=12),
+                font=self._font(12),
                 text_color="#059669" if not bici['venduta'] else "#DC2626"
             )
             stato_label.pack(side="right")
@@ -2570,7 +3088,7 @@ Note: {bici.get('note', 'N/A')}
             marca_modello = ctk.CTkLabel(
                 info_frame,
                 text=f"{bici['marca']} {bici['modello']}",
-                font=ctk.CTkFont(size=16, weight="bold")
+                font=self._font(16, "bold")
             )
             marca_modello.pack(anchor="w", pady=(5, 0))
             
@@ -2589,7 +3107,7 @@ Note: {bici.get('note', 'N/A')}
                 dettagli_label = ctk.CTkLabel(
                     info_frame,
                     text=" • ".join(dettagli),
-                    font=ctk.CTkFont(size=12),
+                    font=self._font(12),
                     text_color="#6B7280"
                 )
                 dettagli_label.pack(anchor="w", pady=(2, 0))
@@ -2601,14 +3119,14 @@ Note: {bici.get('note', 'N/A')}
             costo_acquisto = ctk.CTkLabel(
                 costi_frame,
                 text=f"Acquisto: €{bici['prezzo_acquisto']:.2f}",
-                font=ctk.CTkFont(size=12)
+                font=self._font(12)
             )
             costo_acquisto.pack(side="left")
             
             costo_totale = ctk.CTkLabel(
                 costi_frame,
                 text=f"Totale: €{bici['costo_totale']:.2f}",
-                font=ctk.CTkFont(size=12, weight="bold"),
+                font=self._font(12, "bold"),
                 text_color="#059669"
             )
             costo_totale.pack(side="right")
@@ -2624,7 +3142,7 @@ Note: {bici.get('note', 'N/A')}
                 command=lambda: self._gestisci_lavori_bici(bici['id']),
                 width=80,
                 height=30,
-                font=ctk.CTkFont(size=10)
+                font=self._font(10)
             )
             lavori_btn.pack(side="left", padx=2)
             
@@ -2635,7 +3153,7 @@ Note: {bici.get('note', 'N/A')}
                 command=lambda: self._crea_preventivo_bici(bici['id']),
                 width=80,
                 height=30,
-                font=ctk.CTkFont(size=10)
+                font=self._font(10)
             )
             preventivo_btn.pack(side="left", padx=2)
             
@@ -2646,7 +3164,7 @@ Note: {bici.get('note', 'N/A')}
                 command=lambda: self._modifica_bici_usata(bici['id']),
                 width=80,
                 height=30,
-                font=ctk.CTkFont(size=10)
+                font=self._font(10)
             )
             modifica_btn.pack(side="left", padx=2)
             
@@ -2657,7 +3175,7 @@ Note: {bici.get('note', 'N/A')}
                 command=lambda: self._elimina_bici_usata(bici['id']),
                 width=80,
                 height=30,
-                font=ctk.CTkFont(size=10),
+                font=self._font(10),
                 fg_color="#DC2626",
                 hover_color="#B91C1C"
             )
@@ -2723,28 +3241,29 @@ Note: {bici.get('note', 'N/A')}
 
     def _show_riparazioni_submenu(self):
         """Mostra il sottomenu per le riparazioni"""
-        # Pulisce il frame del contenuto
-        for widget in self.tab_content_frame.winfo_children():
-            widget.destroy()
+        # Il sottomenu è statico: costruito una volta e poi solo rimostrato
+        self._mostra_view("riparazioni_submenu", self._build_riparazioni_submenu)
 
+    def _build_riparazioni_submenu(self, parent):
+        """Costruisce i widget del sottomenu riparazioni nel frame della vista"""
         # Titolo
         title_label = ctk.CTkLabel(
-            self.tab_content_frame,
+            parent,
             text="🔧 Gestione Riparazioni",
-            font=ctk.CTkFont(size=24, weight="bold")
+            font=self._font(24, "bold")
         )
         title_label.pack(pady=20)
 
         # Sottotitolo
         subtitle_label = ctk.CTkLabel(
-            self.tab_content_frame,
+            parent,
             text="Scegli l'operazione da effettuare:",
-            font=ctk.CTkFont(size=14)
+            font=self._font(14)
         )
         subtitle_label.pack(pady=(0, 30))
 
         # Container per i pulsanti principali
-        main_buttons_frame = ctk.CTkFrame(self.tab_content_frame, fg_color="transparent")
+        main_buttons_frame = ctk.CTkFrame(parent, fg_color="transparent")
         main_buttons_frame.pack(expand=True, fill="both", padx=50)
 
         # Pulsante Gestione Clienti
@@ -2752,12 +3271,9 @@ Note: {bici.get('note', 'N/A')}
             main_buttons_frame,
             text="👥 GESTIONE CLIENTI\n\nVisualizza e gestisci\nla lista dei clienti",
             command=self.apri_gestione_clienti,
-            width=300,
-            height=120,
-            font=ctk.CTkFont(size=16, weight="bold"),
-            fg_color="#059669",
-            hover_color="#047857",
-            corner_radius=15
+            font=self._font(16, "bold"),
+            **_STILE_SUCCESS,
+            **_STILE_MENU
         )
         clienti_btn.pack(pady=20)
 
@@ -2766,29 +3282,25 @@ Note: {bici.get('note', 'N/A')}
             main_buttons_frame,
             text="🔧 NUOVA RIPARAZIONE\n\nCrea un nuovo lavoro\ndi riparazione",
             command=self._apri_nuova_riparazione,
-            width=300,
-            height=120,
-            font=ctk.CTkFont(size=16, weight="bold"),
-            fg_color="#DC2626",
-            hover_color="#B91C1C",
-            corner_radius=15
+            font=self._font(16, "bold"),
+            **_STILE_DANGER,
+            **_STILE_MENU
         )
         nuova_riparazione_btn.pack(pady=20)
 
         # Container per i pulsanti di navigazione
-        nav_buttons_frame = ctk.CTkFrame(self.tab_content_frame, fg_color="transparent")
+        nav_buttons_frame = ctk.CTkFrame(parent, fg_color="transparent")
         nav_buttons_frame.pack(fill="x", padx=50, pady=(30, 20))
 
         # Pulsante Torna al Nuovo Lavoro
         back_btn = ctk.CTkButton(
             nav_buttons_frame,
             text="← Torna al Nuovo Lavoro",
-            command=lambda: self.tab_manager.close_tab("nuovo_lavoro"),
+            command=partial(self.tab_manager.close_tab, "nuovo_lavoro"),
             width=200,
             height=50,
-            font=ctk.CTkFont(size=14, weight="bold"),
-            fg_color="#6B7280",
-            hover_color="#4B5563",
+            font=self._font(14, "bold"),
+            **_STILE_BACK,
             corner_radius=10
         )
         back_btn.pack(side="left", padx=10)
@@ -2800,9 +3312,8 @@ Note: {bici.get('note', 'N/A')}
             command=lambda: self.guida_manager.mostra_guida_riparazioni() if self.guida_manager else None,
             width=200,
             height=50,
-            font=ctk.CTkFont(size=14, weight="bold"),
-            fg_color="#059669",
-            hover_color="#047857",
+            font=self._font(14, "bold"),
+            **_STILE_SUCCESS,
             corner_radius=10
         )
         guida_btn.pack(side="right", padx=10)
@@ -2815,79 +3326,100 @@ Note: {bici.get('note', 'N/A')}
     def _create_riparazione_content(self):
         """Crea il contenuto per la tab riparazione"""
         try:
-            # Pulisce il frame del contenuto
-            for widget in self.tab_content_frame.winfo_children():
-                widget.destroy()
-            
-            # Crea la GUI riparazioni integrata
-            riparazioni_gui = RiparazioniGUI(
-                parent=self.tab_content_frame,
-                controller=self.riparazioni_controller,
-                inventario_callback=self._apri_inventario_per_ricambi
-            )
-            
-            # Crea il contenuto della riparazione direttamente nel frame
-            riparazioni_gui.create_riparazione_content()
-            
-            # Aggiungi pulsante per chiudere la tab
-            self._add_chiudi_tab_button()
+            # Vista persistente: la GUI riparazioni viene creata una volta e poi rimostrata
+            self._mostra_view("riparazione", self._build_riparazione_view)
             
         except Exception as e:
             logger.error(f"Errore creazione contenuto riparazione: {e}")
             messagebox.showerror("Errore", f"Errore nella creazione del contenuto: {e}")
     
-    def _add_chiudi_tab_button(self):
+    def _build_riparazione_view(self, view):
+        """Crea la GUI riparazioni integrata nel frame della vista"""
+        self.riparazioni_gui = RiparazioniGUI(
+            parent=view,
+            controller=self.riparazioni_controller,
+            inventario_callback=self._apri_inventario_per_ricambi
+        )
+        
+        # Crea il contenuto della riparazione direttamente nel frame
+        self.riparazioni_gui.create_riparazione_content()
+        
+        # Aggiungi pulsante per chiudere la tab
+        self._add_chiudi_tab_button(view)
+    
+    def _add_chiudi_tab_button(self, parent=None):
         """Aggiunge un pulsante per chiudere la tab riparazione"""
         try:
-            # Crea un frame per i pulsanti di controllo
-            control_frame = ctk.CTkFrame(self.tab_content_frame)
+            # Crea un frame per i pulsanti di controllo (una volta per vista: la vista riparazione è persistente)
+            control_frame = ctk.CTkFrame(parent or self.tab_content_frame)
             control_frame.pack(fill="x", padx=20, pady=10, side="bottom")
             
             # Pulsante Chiudi Tab
             chiudi_btn = ctk.CTkButton(
                 control_frame,
                 text="❌ Chiudi Tab",
-                command=lambda: self.tab_manager.close_tab("nuova_riparazione"),
+                command=self._chiudi_tab_riparazione,
                 width=120,
                 height=40,
-                font=ctk.CTkFont(size=12, weight="bold"),
-                fg_color="#DC2626",
-                hover_color="#B91C1C"
+                font=self._font(12, "bold"),
+                **_STILE_DANGER
             )
             chiudi_btn.pack(side="right", padx=10, pady=5)
             
         except Exception as e:
             logger.error(f"Errore aggiunta pulsante chiudi tab: {e}")
     
+    def _chiudi_tab_riparazione(self):
+        """Chiude la tab riparazione e rilascia la GUI riparazioni persistente"""
+        try:
+            self.tab_manager.close_tab("nuova_riparazione")
+        finally:
+            self._release_riparazioni_gui()
+
+    def _release_riparazioni_gui(self):
+        """Distrugge la vista riparazione e scarta il riferimento a RiparazioniGUI"""
+        gui, self.riparazioni_gui = self.riparazioni_gui, None
+        try:
+            # La GUI può esporre dispose() per rimuovere trace e callback sulle variabili Tk
+            dispose = getattr(gui, 'dispose', None)
+            if dispose is not None:
+                dispose()
+            view = self._view_frames.pop("riparazione", None)
+            if view is not None and view.winfo_exists():
+                view.destroy()
+        except Exception as e:
+            logger.error(f"Errore rilascio GUI riparazioni: {e}")
+
     def _apri_inventario_per_ricambi(self, callback):
         """Metodo legacy - ora i ricambi sono caricati direttamente nella tab riparazione"""
         pass
 
     def _show_riparazioni_content(self):
         """Mostra il contenuto per le riparazioni"""
-        # Pulisce il frame del contenuto
-        for widget in self.tab_content_frame.winfo_children():
-            widget.destroy()
+        # Vista statica: costruita una volta e poi solo rimostrata
+        self._mostra_view("riparazioni", self._build_riparazioni_view)
 
+    def _build_riparazioni_view(self, view):
+        """Costruisce la scelta del tipo di cliente nel frame della vista"""
         # Titolo
         title_label = ctk.CTkLabel(
-            self.tab_content_frame,
+            view,
             text="🔧 Gestione Riparazioni",
-            font=ctk.CTkFont(size=24, weight="bold")
+            font=self._font(24, "bold")
         )
         title_label.pack(pady=20)
 
         # Sottotitolo
         subtitle_label = ctk.CTkLabel(
-            self.tab_content_frame,
+            view,
             text="Seleziona il tipo di riparazione da eseguire",
-            font=ctk.CTkFont(size=16)
+            font=self._font(16)
         )
         subtitle_label.pack(pady=(0, 30))
 
         # Frame per il contenuto
         content_frame = ctk.CTkFrame(
-            self.tab_content_frame, fg_color="transparent")
+            view, fg_color="transparent")
         content_frame.pack(fill="both", expand=True, padx=20, pady=20)
 
         # Frame per la selezione tipo cliente
@@ -2898,7 +3430,7 @@ Note: {bici.get('note', 'N/A')}
         tipo_title = ctk.CTkLabel(
             tipo_frame,
             text="👤 Tipo di Cliente",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self._font(16, "bold")
         )
         tipo_title.pack(pady=15, padx=15, anchor="w")
 
@@ -2909,34 +3441,28 @@ Note: {bici.get('note', 'N/A')}
         # Pulsante Cliente Esterno
         cliente_btn = ctk.CTkButton(
             cliente_buttons_frame,
-            text="👥 CLIENTE ESTERNO\n\nRiparazione per cliente esterno\n(Prezzo: Mano d'opera + Ricambi)",
-            command=lambda: self._seleziona_operazioni_cliente("esterno"),
-            width=250,
-            height=120,
-            font=ctk.CTkFont(size=14, weight="bold"),
-            fg_color="#059669",
-            hover_color="#047857",
-            corner_radius=15
+            text=TEXT_CLIENTE_EXT,
+            command=partial(self._seleziona_operazioni_cliente, "esterno"),
+            font=self._font(14, "bold"),
+            **_STILE_SUCCESS,
+            **_STILE_OPERAZIONE
         )
         cliente_btn.pack(side="left", padx=10, fill="both", expand=True)
 
         # Pulsante Officina Interna
         officina_btn = ctk.CTkButton(
             cliente_buttons_frame,
-            text="🏭 OFFICINA INTERNA\n\nRiparazione per officina interna\n(Prezzo: Ricambi × 2 + Aggiustamento)",
-            command=lambda: self._seleziona_operazioni_cliente("interna"),
-            width=250,
-            height=120,
-            font=ctk.CTkFont(size=14, weight="bold"),
-            fg_color="#DC2626",
-            hover_color="#B91C1C",
-            corner_radius=15
+            text=TEXT_OFFICINA_INT,
+            command=partial(self._seleziona_operazioni_cliente, "interna"),
+            font=self._font(14, "bold"),
+            **_STILE_DANGER,
+            **_STILE_OPERAZIONE
         )
         officina_btn.pack(side="left", padx=10, fill="both", expand=True)
 
         # Pulsanti di controllo
         button_frame = ctk.CTkFrame(
-            self.tab_content_frame, fg_color="transparent")
+            view, fg_color="transparent")
         button_frame.pack(pady=20)
 
         # Pulsante Torna alla selezione
@@ -2946,9 +3472,8 @@ Note: {bici.get('note', 'N/A')}
             command=self._nuovo_lavoro_tab_content,
             width=200,
             height=40,
-            font=ctk.CTkFont(size=14, weight="bold"),
-            fg_color="#6B7280",
-            hover_color="#4B5563",
+            font=self._font(14, "bold"),
+            **_STILE_BACK,
             corner_radius=10
         )
         back_btn.pack(side="left", padx=10)
@@ -2957,50 +3482,112 @@ Note: {bici.get('note', 'N/A')}
         close_btn = ctk.CTkButton(
             button_frame,
             text="❌ Chiudi Tab",
-            command=lambda: self.tab_manager.close_tab("nuovo_lavoro"),
+            command=partial(self.tab_manager.close_tab, "nuovo_lavoro"),
             width=200,
             height=40,
-            font=ctk.CTkFont(size=14, weight="bold"),
-            fg_color="#DC2626",
-            hover_color="#B91C1C"
+            font=self._font(14, "bold"),
+            **_STILE_DANGER
         )
         close_btn.pack(side="left", padx=10)
 
     def _seleziona_operazioni_cliente(self, tipo_cliente):
         """Seleziona le operazioni in base al tipo di cliente"""
         try:
-            # Pulisce il frame del contenuto
-            for widget in self.tab_content_frame.winfo_children():
-                widget.destroy()
+            nome = f"operazioni_{tipo_cliente}"
+            
+            # La vista resta valida finché il listino in cache è quello con cui è stata costruita
+            if self.officina_controller:
+                self._get_listino()
+            caricato = self._listino_cache['caricato']
+            view = self._view_frames.get(nome)
+            if view is not None and view.winfo_exists() and view._listino_caricato != caricato:
+                view.destroy()
+            
+            view = self._mostra_view(nome, partial(self._build_operazioni_view, tipo_cliente))
+            view._listino_caricato = caricato
 
-            # Titolo
-            tipo_text = "Cliente Esterno" if tipo_cliente == "esterno" else "Officina Interna"
-            title_label = ctk.CTkLabel(
-                self.tab_content_frame,
-                text=f"🔧 Operazioni per {tipo_text}",
-                font=ctk.CTkFont(size=24, weight="bold")
-            )
-            title_label.pack(pady=20)
+        except Exception as e:
+            logger.error(f"Errore selezione operazioni cliente: {e}")
+            messagebox.showerror("Errore", f"Errore nella selezione operazioni: {e}")
 
-            # Sottotitolo
-            subtitle_label = ctk.CTkLabel(
-                self.tab_content_frame,
-                text="Seleziona le operazioni da eseguire",
-                font=ctk.CTkFont(size=16)
-            )
-            subtitle_label.pack(pady=(0, 30))
+    def _build_operazioni_view(self, tipo_cliente, view):
+        """Costruisce titolo e operazioni del listino per il tipo di cliente"""
+        # Titolo
+        tipo_text = "Cliente Esterno" if tipo_cliente == "esterno" else "Officina Interna"
+        title_label = ctk.CTkLabel(
+            view,
+            text=f"🔧 Operazioni per {tipo_text}",
+            font=self._font(24, "bold")
+        )
+        title_label.pack(pady=20)
 
-            # Frame per il contenuto
-            content_frame = ctk.CTkFrame(
-                self.tab_content_frame, fg_color="transparent")
-            content_frame.pack(fill="both", expand=True, padx=20, pady=20)
+        # Sottotitolo
+        subtitle_label = ctk.CTkLabel(
+            view,
+            text="Seleziona le operazioni da eseguire",
+            font=self._font(16)
+        )
+        subtitle_label.pack(pady=(0, 30))
 
-            # Carica le operazioni dal database
-            self._carica_operazioni_riparazioni(content_frame, tipo_cliente)
+        # Frame per il contenuto
+        content_frame = ctk.CTkFrame(view, fg_color="transparent")
+        content_frame.pack(fill="both", expand=True, padx=20, pady=20)
 
-        except Exception as e:
-            logger.error(f"Errore selezione operazioni cliente: {e}")
-            messagebox.showerror("Errore", f"Errore nella selezione operazioni: {e}")
+        # Carica le operazioni dal database
+        self._carica_operazioni_riparazioni(content_frame, tipo_cliente)
+
+    def _get_listino(self):
+        """Restituisce (categorie, operazioni per categoria) del listino, rileggendoli solo se è cambiato"""
+        # Il lock serializza il riempimento con il prefetch: se è in corso si attende il suo risultato
+        with self._listino_lock:
+            cache = self._listino_cache
+            ver = getattr(self.officina_controller, 'listino_version', None)
+            if cache['operazioni'] is not None and ver == cache['ver']:
+                # Senza contatore di versione la cache vale solo per un breve intervallo
+                if ver is not None or time.monotonic() - cache['caricato'] < _LISTINO_CACHE_TTL:
+                    return cache['categorie'], cache['by_cat']
+            
+            get_listino_joined = getattr(self.officina_controller, 'get_listino_joined', None)
+            if get_listino_joined is not None:
+                categorie, by_cat = self._raggruppa_listino_joined(get_listino_joined())
+                operazioni = [operazione for ops in by_cat.values() for operazione in ops]
+            else:
+                operazioni = self.officina_controller.get_operazioni()
+                # Raggruppa le operazioni per categoria una sola volta, al riempimento della cache
+                by_cat = defaultdict(list)
+                for operazione in operazioni:
+                    by_cat[operazione['categoria_id']].append(operazione)
+                categorie = self.officina_controller.get_categorie_operazioni()
+            
+            cache['categorie'] = categorie
+            cache['operazioni'] = operazioni
+            self._prezzi_operazioni.clear()
+            cache['by_cat'] = dict(by_cat)
+            cache['ver'] = ver
+            cache['caricato'] = time.monotonic()
+            return cache['categorie'], cache['by_cat']
+
+    @staticmethod
+    def _raggruppa_listino_joined(righe):
+        """Raggruppa in un passaggio le righe della JOIN operazioni-categorie, già ordinate per categoria"""
+        categorie, by_cat = [], {}
+        for categoria_id, gruppo in itertools.groupby(righe, key=itemgetter('categoria_id')):
+            ops = [dict(riga, id=riga['op_id'], nome=riga['op_nome']) for riga in gruppo]
+            categorie.append({'id': categoria_id, 'nome': ops[0]['categoria_nome']})
+            by_cat[categoria_id] = ops
+        return categorie, by_cat
+
+    def _prefetch_listino(self):
+        """Riempie la cache del listino da un thread di background"""
+        try:
+            self._get_listino()
+        except Exception as e:
+            logger.error(f"Errore prefetch listino: {e}")
+
+    def invalida_cache_listino(self):
+        """Scarta il listino in cache (da chiamare dopo le modifiche in Impostazioni → Listino)"""
+        with self._listino_lock:
+            self._listino_cache['operazioni'] = None
 
     def _carica_operazioni_riparazioni(self, parent_frame, tipo_cliente):
         """Carica le operazioni di riparazione dal database"""
@@ -3010,101 +3597,134 @@ Note: {bici.get('note', 'N/A')}
                 no_controller_label = ctk.CTkLabel(
                     parent_frame,
                     text="⚠️ Controller officina non disponibile\n\nConfigura le operazioni nelle Impostazioni → Listino",
-                    font=ctk.CTkFont(size=14),
+                    font=self._font(14),
                     text_color="#DC2626"
                 )
                 no_controller_label.pack(pady=50)
                 return
 
-            # Ottieni categorie e operazioni
-            categorie = self.officina_controller.get_categorie_operazioni()
-            operazioni = self.officina_controller.get_operazioni()
+            # Ottieni categorie e operazioni (dalla cache del listino se ancora valida)
+            categorie, operazioni_per_categoria = self._get_listino()
 
-            if not categorie and not operazioni:
+            if not categorie and not operazioni_per_categoria:
                 # Messaggio se non ci sono operazioni
                 no_ops_label = ctk.CTkLabel(
                     parent_frame,
                     text="📝 Nessuna operazione configurata\n\nVai in Impostazioni → Listino per aggiungere operazioni",
-                    font=ctk.CTkFont(size=14),
+                    font=self._font(14),
                     text_color="#6B7280"
                 )
                 no_ops_label.pack(pady=50)
                 return
 
-            # Frame scrollabile per le operazioni
-            scroll_frame = ctk.CTkScrollableFrame(parent_frame, height=400)
-            scroll_frame.pack(fill="both", expand=True, padx=10, pady=10)
-
-            # Raggruppa operazioni per categoria
-            operazioni_per_categoria = {}
-            for operazione in operazioni:
-                cat_id = operazione['categoria_id']
-                if cat_id not in operazioni_per_categoria:
-                    operazioni_per_categoria[cat_id] = []
-                operazioni_per_categoria[cat_id].append(operazione)
-
-            # Mostra operazioni per categoria
+            # Righe piatte: titolo di ogni categoria seguito dalle sue operazioni
+            righe = []
             for categoria in categorie:
-                cat_id = categoria['id']
-                if cat_id in operazioni_per_categoria:
-                    # Titolo categoria
-                    cat_label = ctk.CTkLabel(
-                        scroll_frame,
-                        text=f"📁 {categoria['nome']}",
-                        font=ctk.CTkFont(size=16, weight="bold"),
-                        text_color="#2B5A27"
-                    )
-                    cat_label.pack(pady=(10, 5), padx=10, anchor="w")
-
-                    # Frame per le operazioni della categoria
-                    ops_frame = ctk.CTkFrame(scroll_frame, fg_color="transparent")
-                    ops_frame.pack(fill="x", padx=20, pady=(0, 10))
+                ops = operazioni_per_categoria.get(categoria['id'], ())
+                if ops:
+                    righe.append((categoria, None))
+                    righe.extend((categoria, operazione) for operazione in ops)
 
-                    for operazione in operazioni_per_categoria[cat_id]:
-                        self._create_operazione_widget(ops_frame, operazione, tipo_cliente)
+            # Lista virtualizzata: solo le righe visibili vengono create e poi riciclate
+            self._crea_lista_virtuale(
+                parent_frame, righe, _RIGA_OPERAZIONE_SLOT,
+                partial(self._create_operazione_widget, tipo_cliente=tipo_cliente),
+                self._popola_operazione_row
+            )
 
         except Exception as e:
             logger.error(f"Errore caricamento operazioni riparazioni: {e}")
             messagebox.showerror("Errore", f"Errore nel caricamento operazioni: {e}")
 
-    def _create_operazione_widget(self, parent_frame, operazione, tipo_cliente):
-        """Crea il widget per una singola operazione"""
-        try:
-            # Frame per l'operazione
-            op_frame = ctk.CTkFrame(parent_frame)
-            op_frame.pack(fill="x", pady=2, padx=5)
-
-            # Nome operazione
-            nome_label = ctk.CTkLabel(
-                op_frame,
-                text=f"⚙️ {operazione['nome']}",
-                font=ctk.CTkFont(size=12, weight="bold")
-            )
-            nome_label.pack(side="left", padx=10, pady=8)
-
-            # Prezzo (placeholder per ora)
-            prezzo_text = "€ --"  # TODO: Calcola prezzo in base al tipo cliente
-            prezzo_label = ctk.CTkLabel(
-                op_frame,
-                text=prezzo_text,
-                font=ctk.CTkFont(size=12),
-                text_color="#059669"
-            )
-            prezzo_label.pack(side="right", padx=10, pady=8)
-
-            # Pulsante seleziona
-            select_btn = ctk.CTkButton(
-                op_frame,
-                text="✅ Seleziona",
-                command=lambda: self._seleziona_operazione(operazione, tipo_cliente),
-                width=100,
-                height=30,
-                font=ctk.CTkFont(size=10)
-            )
-            select_btn.pack(side="right", padx=5, pady=8)
+    def _create_operazione_widget(self, parent_frame, stato, tipo_cliente):
+        """Crea una riga riciclabile della lista operazioni (titolo categoria o operazione)"""
+        row = {'riga': None, 'tipo_cliente': tipo_cliente}
+
+        # Slot ad altezza fissa per la virtualizzazione
+        slot_frame = ctk.CTkFrame(parent_frame, fg_color="transparent", height=_RIGA_OPERAZIONE_ALTEZZA)
+        slot_frame.pack(fill="x", pady=_RIGA_OPERAZIONE_PADY)
+        slot_frame.pack_propagate(False)
+        row['frame'] = slot_frame
+
+        # Titolo categoria (mostrato al posto dell'operazione sulle righe di intestazione)
+        row['cat_label'] = ctk.CTkLabel(
+            slot_frame,
+            text="",
+            font=self._font(16, "bold"),
+            text_color="#2B5A27"
+        )
 
-        except Exception as e:
-            logger.error(f"Errore creazione widget operazione: {e}")
+        # Frame per l'operazione: griglia a colonne fisse (nome | seleziona | prezzo)
+        op_frame = ctk.CTkFrame(slot_frame)
+        op_frame.grid_columnconfigure(0, weight=1)
+        op_frame.grid_columnconfigure(2, minsize=90)
+        op_frame.grid_rowconfigure(0, weight=1)
+        op_frame.grid_propagate(False)
+        row['op_frame'] = op_frame
+
+        # Nome operazione
+        row['nome_label'] = ctk.CTkLabel(op_frame, text="", font=self._font(12, "bold"))
+        row['nome_label'].grid(row=0, column=0, sticky="w", padx=10)
+
+        # Prezzo in base al tipo cliente (impostato quando la riga mostra un'operazione)
+        prezzo_label = row['prezzo_label'] = ctk.CTkLabel(
+            op_frame,
+            text="",
+            font=self._font(12),
+            text_color="#059669"
+        )
+        prezzo_label.grid(row=0, column=2, sticky="e", padx=10)
+
+        # Pulsante seleziona: legge l'operazione corrente della riga al click
+        select_btn = ctk.CTkButton(
+            op_frame,
+            text="✅ Seleziona",
+            command=partial(self._seleziona_operazione_row, row, tipo_cliente),
+            width=100,
+            height=30,
+            font=self._font(10)
+        )
+        select_btn.grid(row=0, column=1, padx=5)
+
+        for widget in (slot_frame, row['cat_label'], op_frame, row['nome_label'], prezzo_label):
+            self._bind_wheel_lista_virtuale(stato, widget)
+
+        return row
+
+    def _popola_operazione_row(self, row, riga):
+        """Mostra nella riga il titolo di categoria o l'operazione, aggiornando solo i testi"""
+        if row['riga'] is riga:
+            return
+        precedente = row['riga']
+        row['riga'] = riga
+        categoria, operazione = riga
+
+        if operazione is None:
+            row['cat_label'].configure(text=f"📁 {categoria['nome']}")
+            if precedente is None or precedente[1] is not None:
+                row['op_frame'].pack_forget()
+                row['cat_label'].pack(padx=10, anchor="w", side="left")
+        else:
+            row['nome_label'].configure(text=f"⚙️ {operazione['nome']}")
+            row['prezzo_label'].configure(text=self._prezzo_operazione(operazione, row['tipo_cliente']))
+            if precedente is None or precedente[1] is None:
+                row['cat_label'].pack_forget()
+                row['op_frame'].pack(fill="both", expand=True, padx=(25, 5))
+
+    def _prezzo_operazione(self, operazione, tipo_cliente):
+        """Testo del prezzo di un'operazione per il tipo di cliente, calcolato una volta per listino"""
+        chiave = (operazione['id'], tipo_cliente)
+        testo = self._prezzi_operazioni.get(chiave)
+        if testo is None:
+            # Il calcolo spetta al controller officina; senza, resta il segnaposto
+            calcola = getattr(self.officina_controller, 'prezzo', None)
+            prezzo = calcola(operazione['id'], tipo_cliente) if calcola else None
+            testo = self._prezzi_operazioni[chiave] = "€ --" if prezzo is None else _euro(prezzo)
+        return testo
+
+    def _seleziona_operazione_row(self, row, tipo_cliente):
+        """Seleziona l'operazione mostrata al momento nella riga riciclata"""
+        self._seleziona_operazione(row['riga'][1], tipo_cliente)
 
     def _seleziona_operazione(self, operazione, tipo_cliente):
         """Seleziona un'operazione specifica"""
@@ -3121,30 +3741,33 @@ Note: {bici.get('note', 'N/A')}
 
     def _inventario_tab_content(self):
         """Contenuto della tab inventario"""
-        # Pulisce il frame del contenuto
-        for widget in self.tab_content_frame.winfo_children():
-            widget.destroy()
+        # Vista persistente: l'inventario viene costruito una volta e poi rimostrato
+        self._mostra_view("inventario", self._build_inventario_view)
+        
+        # Configura il ridimensionamento per il tab_content_frame
+        self.tab_content_frame.pack_propagate(False)
 
+    def _build_inventario_view(self, view):
+        """Costruisce titolo e contenuto dell'inventario nel frame della vista"""
         # Titolo
         title_label = ctk.CTkLabel(
-            self.tab_content_frame,
+            view,
             text="📦 Gestione Inventario",
             font=ctk.CTkFont(size=20, weight="bold")
         )
         title_label.pack(pady=10)
 
         # Frame principale - RESPONSIVE
-        main_frame = ctk.CTkFrame(
-            self.tab_content_frame, fg_color="transparent")
+        main_frame = ctk.CTkFrame(view, fg_color="transparent")
         main_frame.pack(fill="both", expand=True, padx=5, pady=5)
-        
-        # Configura il ridimensionamento per il tab_content_frame
-        self.tab_content_frame.pack_propagate(False)
 
         # Inizializza la GUI inventario se non esiste
-        if not hasattr(self, 'inventario_gui'):
-            from src.gui.inventario_gui import InventarioGUI
-            self.inventario_gui = InventarioGUI(self, self.guida_manager if self.guida_manager else None)
+        if self.inventario_gui is None:
+            if self._InventarioGUI is None:
+                # Import anticipato non ancora eseguito (o fallito): import diretto
+                from src.gui.inventario_gui import InventarioGUI
+                self._InventarioGUI = InventarioGUI
+            self.inventario_gui = self._InventarioGUI(self, self.guida_manager if self.guida_manager else None)
         
         # Mostra il contenuto dell'inventario
         self.inventario_gui.mostra_inventario_content(main_frame)
@@ -8,7 +8,10 @@ Versione: 1.0.0
 Data: 2024
 """
 
+import atexit
 import gc
+import os
+import numpy as np
 import psutil
 import threading
 import time
@@ -18,6 +21,69 @@ from dataclasses import dataclass
 from pathlib import Path
 import sqlite3
 import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+
+# Figlio del logger "gestionale": i messaggi finiscono negli stessi handler dell'applicazione
+logger = logging.getLogger("gestionale.performance")
+
+# Database dell'applicazione gestiti dall'ottimizzatore
+DB_FILES = [
+    "data/gestionale.db",
+    "data/biciclette_usate.db",
+    "data/biciclette_restaurate.db",
+    "data/biciclette_artigianali.db",
+    "data/pricing.db"
+]
+
+# Pagine liberate al massimo da ogni incremental_vacuum automatico
+INCREMENTAL_VACUUM_PAGES = 256
+
+# Campioni di metriche mantenuti nello storico
+MAX_METRICS_HISTORY = 100
+# Uno slot in più: quello in scrittura non fa mai parte dei campioni pubblicati
+_RING_SIZE = MAX_METRICS_HISTORY + 1
+
+# Campioni tra due letture dell'occupazione del disco
+# (12 x 5 s = un minuto: solo il controllo delle soglie disco usa questo valore)
+DISK_SAMPLE_EVERY = 12
+
+# Secondi minimi tra due garbage collection esplicite
+GC_MIN_INTERVAL = 2.0
+
+# Secondi tra due campioni (e dopo un errore di campionamento)
+MONITORING_INTERVAL = 5
+MONITORING_ERROR_INTERVAL = 10
+
+# Campi di PerformanceMetrics, ognuno con il proprio buffer circolare nello storico
+METRIC_FIELDS = (
+    'cpu_percent',
+    'memory_mb',
+    'memory_percent',
+    'disk_usage_percent',
+    'active_threads',
+    'gc_objects',
+    'timestamp'
+)
+
+# Cache lru_cache dei moduli dell'applicazione, per nome del modulo (ultima parte del
+# nome completo, così valgono sia gli import dalla radice sia quelli da src.*).
+# Sono registrate solo se il modulo è già caricato: l'ottimizzatore non importa nulla
+APP_LRU_CACHES = {
+    'translations': ('_render',),
+    'validation_mixin': (
+        '_check_email', '_check_phone', '_check_cf', '_check_partita_iva',
+        '_msg_required', '_msg_email', '_msg_phone'
+    ),
+    'theme_applier': (
+        '_button_style', '_card_style', '_input_style', '_modal_style',
+        '_color', '_font', '_spacing'
+    ),
+    'main': ('_stato_normalizzato',),
+    '__main__': ('_stato_normalizzato',),
+}
 
 
 @dataclass
@@ -28,7 +94,7 @@ class PerformanceMetrics:
     memory_percent: float
     disk_usage_percent: float
     active_threads: int
-    gc_objects: int
+    gc_objects: int  # allocazioni in attesa di garbage collection (somma di gc.get_count())
     timestamp: float
 
 
@@ -43,10 +109,42 @@ class PerformanceOptimizer:
             enable_monitoring: Se abilitare il monitoraggio automatico
         """
         self.enable_monitoring = enable_monitoring
-        self.metrics_history: List[PerformanceMetrics] = []
+        # Storico come buffer circolari per campo (ultimi MAX_METRICS_HISTORY campioni).
+        # Un solo scrittore (il thread di monitoraggio) pubblica i campioni incrementando
+        # _write_count; i lettori ne leggono il valore una volta, senza lock
+        self._buf: Dict[str, np.ndarray] = {
+            campo: np.zeros(_RING_SIZE) for campo in METRIC_FIELDS
+        }
+        self._write_count = 0
         self.optimization_rules: Dict[str, Callable] = {}
         self.monitoring_thread: Optional[threading.Thread] = None
         self.running = False
+        # Segnale di arresto: interrompe subito l'attesa tra un campione e l'altro
+        self._stop_evt = threading.Event()
+        
+        # Processo corrente: lo stesso handle serve a cpu_percent() per misurare tra due chiamate
+        self._proc = psutil.Process()
+        # Occupazione del disco: il totale non cambia, l'usato viene riletto ogni DISK_SAMPLE_EVERY campioni.
+        # Si misura il volume che contiene la directory corrente (dove stanno data/ e i file temporanei):
+        # psutil riporta il filesystem che contiene il percorso, anche se montato fuori dalla radice
+        self._disk_root = os.getcwd()
+        disk_usage = psutil.disk_usage(self._disk_root)
+        self._disk_total = disk_usage.total
+        self._disk_used = disk_usage.used
+        self._disk_tick = 0
+        
+        # Istante (monotonic) dell'ultima gc.collect() esplicita
+        self._last_gc = 0.0
+        
+        # Cache dell'applicazione (es. funzioni lru_cache) svuotate da _cleanup_caches
+        self._app_caches: List[Callable] = []
+        self._register_app_caches()
+        
+        # Connessioni SQLite riutilizzate tra un'ottimizzazione e l'altra
+        self._db_conns: Dict[str, sqlite3.Connection] = {}
+        # Un lock per database: apertura, uso e chiusura della connessione non si sovrappongono
+        # tra il thread di monitoraggio e chi chiama optimize_all
+        self._db_locks: Dict[str, threading.RLock] = {db_file: threading.RLock() for db_file in DB_FILES}
         
         # Soglie di performance
         self.thresholds = {
@@ -61,14 +159,27 @@ class PerformanceOptimizer:
         # Inizializza regole di ottimizzazione
         self._init_optimization_rules()
         
+        # Arresto deterministico all'uscita dell'interprete (non affidato al garbage collector)
+        atexit.register(self.stop_monitoring)
+        
         if self.enable_monitoring:
             self.start_monitoring()
     
+    def __enter__(self):
+        """Uso come context manager: il monitoraggio viene fermato all'uscita dal blocco"""
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Ferma il monitoraggio (stop_monitoring rimuove anche l'arresto registrato con atexit)"""
+        self.stop_monitoring()
+        return False
+    
     def _init_optimization_rules(self):
         """Inizializza le regole di ottimizzazione"""
         self.optimization_rules = {
-            'memory_cleanup': self._cleanup_memory,
-            'gc_collect': self._force_garbage_collection,
+            # Su richiesta esplicita (optimize_all) la raccolta copre tutte le generazioni
+            'memory_cleanup': partial(self._cleanup_memory, generation=2),
+            'gc_collect': partial(self._force_garbage_collection, generation=2),
             'database_optimize': self._optimize_databases,
             'cache_cleanup': self._cleanup_caches,
             'thread_cleanup': self._cleanup_threads,
@@ -77,7 +188,7 @@ class PerformanceOptimizer:
     
     def get_current_metrics(self) -> PerformanceMetrics:
         """Ottiene le metriche di performance correnti"""
-        process = psutil.Process()
+        process = self._proc
         
         # CPU
         cpu_percent = process.cpu_percent()
@@ -88,14 +199,16 @@ class PerformanceOptimizer:
         memory_percent = process.memory_percent()
         
         # Disco
-        disk_usage = psutil.disk_usage('/')
-        disk_usage_percent = (disk_usage.used / disk_usage.total) * 100
+        self._disk_tick = (self._disk_tick + 1) % DISK_SAMPLE_EVERY
+        if self._disk_tick == 0:
+            self._disk_used = psutil.disk_usage(self._disk_root).used
+        disk_usage_percent = (self._disk_used / self._disk_total) * 100
         
         # Thread
         active_threads = threading.active_count()
         
-        # Garbage Collection
-        gc_objects = len(gc.get_objects())
+        # Garbage Collection: contatori delle generazioni in O(1), senza elencare tutto l'heap
+        gc_objects = sum(gc.get_count())
         
         return PerformanceMetrics(
             cpu_percent=cpu_percent,
@@ -107,46 +220,89 @@ class PerformanceOptimizer:
             timestamp=time.time()
         )
     
+    def _record_metrics(self, metrics: PerformanceMetrics):
+        """Scrive un campione nello slot libero e lo pubblica (solo dal thread scrittore)"""
+        count = self._write_count
+        slot = count % _RING_SIZE
+        for campo in METRIC_FIELDS:
+            self._buf[campo][slot] = getattr(metrics, campo)
+        # Pubblicazione: un solo assegnamento di attributo, atomico sotto il GIL di CPython
+        self._write_count = count + 1
+    
+    def _snapshot(self) -> tuple:
+        """Copia coerente dei campioni pubblicati: (numero, {campo: valori dal più vecchio})"""
+        count = self._write_count
+        n = min(count, MAX_METRICS_HISTORY)
+        slots = np.arange(count - n, count) % _RING_SIZE
+        # L'indicizzazione con array copia i valori: lo scrittore può proseguire sullo slot libero
+        return n, {campo: self._buf[campo][slots] for campo in METRIC_FIELDS}
+    
+    @property
+    def metrics_history(self) -> List[PerformanceMetrics]:
+        """Storico come lista di PerformanceMetrics, dal più vecchio al più recente"""
+        n, valori = self._snapshot()
+        serie = {campo: valori[campo].tolist() for campo in METRIC_FIELDS}
+        return [
+            PerformanceMetrics(
+                cpu_percent=serie['cpu_percent'][i],
+                memory_mb=serie['memory_mb'][i],
+                memory_percent=serie['memory_percent'][i],
+                disk_usage_percent=serie['disk_usage_percent'][i],
+                active_threads=int(serie['active_threads'][i]),
+                gc_objects=int(serie['gc_objects'][i]),
+                timestamp=serie['timestamp'][i]
+            )
+            for i in range(n)
+        ]
+    
     def start_monitoring(self):
         """Avvia il monitoraggio automatico"""
         if self.running:
             return
         
         self.running = True
+        self._stop_evt.clear()
+        # Riavvio dopo uno stop: l'arresto all'uscita va registrato di nuovo (una sola volta)
+        atexit.unregister(self.stop_monitoring)
+        atexit.register(self.stop_monitoring)
         self.monitoring_thread = threading.Thread(
             target=self._monitoring_loop,
             daemon=True
         )
         self.monitoring_thread.start()
-        print("🔍 Monitoraggio performance avviato")
+        logger.info("🔍 Monitoraggio performance avviato")
     
     def stop_monitoring(self):
-        """Ferma il monitoraggio automatico"""
+        """Ferma il monitoraggio automatico (le chiamate successive non hanno effetto)"""
+        # L'arresto all'uscita non serve più: atexit smette anche di trattenere l'istanza
+        atexit.unregister(self.stop_monitoring)
+        if not self.running and self.monitoring_thread is None and not self._db_conns:
+            return
+        
         self.running = False
-        if self.monitoring_thread:
-            self.monitoring_thread.join(timeout=1)
-        print("⏹️ Monitoraggio performance fermato")
+        self._stop_evt.set()
+        thread, self.monitoring_thread = self.monitoring_thread, None
+        if thread:
+            thread.join(timeout=1)
+        self._close_db_connections()
+        logger.info("⏹️ Monitoraggio performance fermato")
     
     def _monitoring_loop(self):
         """Loop di monitoraggio continuo"""
         while self.running:
             try:
                 metrics = self.get_current_metrics()
-                self.metrics_history.append(metrics)
-                
-                # Mantieni solo gli ultimi 100 record
-                if len(self.metrics_history) > 100:
-                    self.metrics_history = self.metrics_history[-100:]
+                self._record_metrics(metrics)
                 
                 # Controlla soglie e applica ottimizzazioni
                 self._check_thresholds_and_optimize(metrics)
                 
-                # Pausa tra i controlli
-                time.sleep(5)
+                # Pausa tra i controlli (interrotta da stop_monitoring)
+                self._stop_evt.wait(MONITORING_INTERVAL)
                 
             except Exception as e:
-                print(f"❌ Errore monitoraggio: {e}")
-                time.sleep(10)
+                logger.error("❌ Errore monitoraggio: %s", e)
+                self._stop_evt.wait(MONITORING_ERROR_INTERVAL)
     
     def _check_thresholds_and_optimize(self, metrics: PerformanceMetrics):
         """Controlla le soglie e applica ottimizzazioni automatiche"""
@@ -174,7 +330,7 @@ class PerformanceOptimizer:
         # Controllo Disco
         if metrics.disk_usage_percent > self.thresholds['disk_critical']:
             self._cleanup_temp_files()
-            self._optimize_databases()
+            self._optimize_databases(reclaim_space=True)
             optimizations_applied.append('disk_critical')
         elif metrics.disk_usage_percent > self.thresholds['disk_warning']:
             self._cleanup_temp_files()
@@ -182,77 +338,143 @@ class PerformanceOptimizer:
         
         # Log ottimizzazioni applicate
         if optimizations_applied:
-            print(f"⚡ Ottimizzazioni applicate: {', '.join(optimizations_applied)}")
+            logger.info("⚡ Ottimizzazioni applicate: %s", ', '.join(optimizations_applied))
     
-    def _cleanup_memory(self):
+    def _cleanup_memory(self, generation: int = 0):
         """Pulizia memoria"""
         try:
             # Forza garbage collection
-            collected = gc.collect()
+            collected = self._collect(generation)
             
             # Pulisci cache Python
             if hasattr(sys, '_clear_type_cache'):
                 sys._clear_type_cache()
             
-            print(f"🧹 Memoria pulita: {collected} oggetti raccolti")
+            logger.info("🧹 Memoria pulita: %s oggetti raccolti", collected)
             return True
         except Exception as e:
-            print(f"❌ Errore pulizia memoria: {e}")
+            logger.error("❌ Errore pulizia memoria: %s", e)
             return False
     
-    def _force_garbage_collection(self):
+    def _force_garbage_collection(self, generation: int = 0):
         """Forza garbage collection"""
         try:
-            collected = gc.collect()
-            print(f"🗑️ Garbage collection: {collected} oggetti raccolti")
+            collected = self._collect(generation)
+            logger.info("🗑️ Garbage collection: %s oggetti raccolti", collected)
             return True
         except Exception as e:
-            print(f"❌ Errore garbage collection: {e}")
+            logger.error("❌ Errore garbage collection: %s", e)
             return False
     
-    def _optimize_databases(self):
-        """Ottimizza i database SQLite"""
+    def _collect(self, generation: int = 0) -> int:
+        """
+        gc.collect() limitata a una ogni GC_MIN_INTERVAL secondi (0 se saltata)
+        
+        Args:
+            generation: Generazione più vecchia da raccogliere (0 = solo oggetti giovani, 2 = heap intero)
+        """
+        now = time.monotonic()
+        if now - self._last_gc < GC_MIN_INTERVAL:
+            return 0
+        self._last_gc = now
+        return gc.collect(generation)
+    
+    def _optimize_databases(self, reclaim_space: bool = False):
+        """
+        Ottimizza i database SQLite senza riscriverli
+        
+        Args:
+            reclaim_space: Se liberare anche un numero limitato di pagine libere
+        """
         try:
-            db_files = [
-                "data/gestionale.db",
-                "data/biciclette_usate.db",
-                "data/biciclette_restaurate.db",
-                "data/biciclette_artigianali.db",
-                "data/pricing.db"
-            ]
+            db_files = [db_file for db_file in DB_FILES if Path(db_file).exists()]
             
-            optimized_count = 0
-            for db_file in db_files:
-                if Path(db_file).exists():
-                    conn = sqlite3.connect(db_file)
-                    conn.execute("VACUUM")
-                    conn.execute("ANALYZE")
-                    conn.close()
-                    optimized_count += 1
+            # Un file per worker: le attese di I/O dei diversi database si sovrappongono
+            with ThreadPoolExecutor(max_workers=max(1, len(db_files))) as executor:
+                list(executor.map(lambda db_file: self._optimize_one(db_file, reclaim_space), db_files))
+            
+            logger.info("🗄️ Database ottimizzati: %s", len(db_files))
+            return True
+        except Exception as e:
+            logger.error("❌ Errore ottimizzazione database: %s", e)
+            return False
+    
+    def _optimize_one(self, db_file: str, reclaim_space: bool):
+        """Ottimizza un singolo database con la sua connessione persistente"""
+        with self._db_locks[db_file]:
+            conn = self._get_db_connection(db_file)
+            if conn is None:
+                return
+            # Aggiorna solo le statistiche che servono al query planner
+            conn.execute("PRAGMA optimize")
+            if reclaim_space:
+                # Efficace sui database con auto_vacuum=INCREMENTAL
+                conn.execute(f"PRAGMA incremental_vacuum({INCREMENTAL_VACUUM_PAGES})")
+    
+    def vacuum_databases(self):
+        """Manutenzione completa dei database (VACUUM + ANALYZE), solo su richiesta esplicita"""
+        try:
+            vacuumed_count = 0
+            for db_file in DB_FILES:
+                with self._db_locks[db_file]:
+                    conn = self._get_db_connection(db_file)
+                    if conn is not None:
+                        # Il VACUUM rende effettivo anche auto_vacuum=INCREMENTAL sui database esistenti
+                        conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+                        conn.execute("VACUUM")
+                        conn.execute("ANALYZE")
+                        vacuumed_count += 1
             
-            print(f"🗄️ Database ottimizzati: {optimized_count}")
+            logger.info("🗄️ Database compattati: %s", vacuumed_count)
             return True
         except Exception as e:
-            print(f"❌ Errore ottimizzazione database: {e}")
+            logger.error("❌ Errore compattazione database: %s", e)
             return False
     
+    def _get_db_connection(self, db_file: str) -> Optional[sqlite3.Connection]:
+        """Restituisce la connessione persistente al database, aprendola al primo uso"""
+        with self._db_locks[db_file]:
+            conn = self._db_conns.get(db_file)
+            if conn is None:
+                if not Path(db_file).exists():
+                    return None
+                # Autocommit: i PRAGMA di manutenzione non devono aprire transazioni
+                conn = sqlite3.connect(db_file, isolation_level=None, check_same_thread=False)
+                # Analisi limitata all'apertura, come raccomandato per connessioni di lunga durata
+                conn.execute("PRAGMA optimize=0x10002")
+                self._db_conns[db_file] = conn
+            return conn
+    
+    def _close_db_connections(self):
+        """Chiude le connessioni persistenti ai database, attendendo che non siano in uso"""
+        for db_file, lock in self._db_locks.items():
+            with lock:
+                conn = self._db_conns.pop(db_file, None)
+                if conn is None:
+                    continue
+                try:
+                    conn.close()
+                except Exception as e:
+                    logger.error("❌ Errore chiusura database: %s", e)
+    
     def _cleanup_caches(self):
         """Pulisce le cache dell'applicazione"""
         try:
-            # Pulisci cache di import
-            if hasattr(sys, 'modules'):
-                modules_to_remove = []
-                for module_name, module in sys.modules.items():
-                    if module_name.startswith('_') and hasattr(module, '__file__'):
-                        modules_to_remove.append(module_name)
-                
-                for module_name in modules_to_remove:
-                    del sys.modules[module_name]
+            # Svuota solo le cache registrate dall'applicazione (i moduli importati non si toccano);
+            # prima si registrano quelle dei moduli caricati dopo la creazione dell'ottimizzatore
+            self._register_app_caches()
+            cleared = 0
+            for cache in self._app_caches:
+                try:
+                    cache.cache_clear()
+                    cleared += 1
+                except Exception as e:
+                    logger.error("❌ Errore pulizia cache %r: %s", cache, e)
             
-            print("🧹 Cache pulite")
+            logger.info("🧹 Cache pulite: %s", cleared)
             return True
         except Exception as e:
-            print(f"❌ Errore pulizia cache: {e}")
+            logger.error("❌ Errore pulizia cache: %s", e)
             return False
     
     def _cleanup_threads(self):
@@ -265,10 +487,10 @@ class PerformanceOptimizer:
             if active_threads > 20:
                 self._force_garbage_collection()
             
-            print(f"🧵 Thread attivi: {active_threads}")
+            logger.info("🧵 Thread attivi: %s", active_threads)
             return True
         except Exception as e:
-            print(f"❌ Errore pulizia thread: {e}")
+            logger.error("❌ Errore pulizia thread: %s", e)
             return False
     
     def _cleanup_temp_files(self):
@@ -281,161 +503,170 @@ class PerformanceOptimizer:
             ]
             
             cleaned_files = 0
+            # Elimina file più vecchi di 7 giorni
+            cutoff = time.time() - (7 * 24 * 3600)
             for temp_dir in temp_dirs:
-                if Path(temp_dir).exists():
-                    for file_path in Path(temp_dir).glob("*"):
-                        if file_path.is_file():
-                            # Elimina file più vecchi di 7 giorni
-                            if file_path.stat().st_mtime < time.time() - (7 * 24 * 3600):
-                                file_path.unlink()
+                if os.path.isdir(temp_dir):
+                    # DirEntry riusa tipo e stat letti con la directory: niente syscall extra per file
+                    with os.scandir(temp_dir) as entries:
+                        for entry in entries:
+                            if entry.is_file() and entry.stat().st_mtime < cutoff:
+                                os.unlink(entry.path)
                                 cleaned_files += 1
             
-            print(f"🗂️ File temporanei puliti: {cleaned_files}")
+            logger.info("🗂️ File temporanei puliti: %s", cleaned_files)
             return True
         except Exception as e:
-            print(f"❌ Errore pulizia file temporanei: {e}")
+            logger.error("❌ Errore pulizia file temporanei: %s", e)
             return False
     
     def optimize_all(self) -> Dict[str, bool]:
         """Applica tutte le ottimizzazioni"""
         results = {}
         
-        print("⚡ Avvio ottimizzazione completa...")
+        logger.info("⚡ Avvio ottimizzazione completa...")
         
         for rule_name, rule_func in self.optimization_rules.items():
             try:
                 result = rule_func()
                 results[rule_name] = result
-                print(f"✅ {rule_name}: {'OK' if result else 'FALLITO'}")
+                logger.info("✅ %s: %s", rule_name, 'OK' if result else 'FALLITO')
             except Exception as e:
                 results[rule_name] = False
-                print(f"❌ {rule_name}: ERRORE - {e}")
+                logger.error("❌ %s: ERRORE - %s", rule_name, e)
         
-        print("🎯 Ottimizzazione completata!")
+        logger.info("🎯 Ottimizzazione completata!")
         return results
     
     def get_performance_report(self) -> Dict:
         """Ottiene un report completo delle performance"""
-        if not self.metrics_history:
+        samples_count, serie = self._snapshot()
+        if not samples_count:
             return {"error": "Nessuna metrica disponibile"}
         
-        latest_metrics = self.metrics_history[-1]
-        
-        # Calcola medie
-        cpu_values = [m.cpu_percent for m in self.metrics_history]
-        memory_values = [m.memory_percent for m in self.metrics_history]
-        
-        avg_cpu = sum(cpu_values) / len(cpu_values)
-        avg_memory = sum(memory_values) / len(memory_values)
+        # Ultimo campione pubblicato
+        latest = {campo: serie[campo][-1].item() for campo in METRIC_FIELDS}
         
-        # Identifica picchi
-        max_cpu = max(cpu_values)
-        max_memory = max(memory_values)
+        # Medie e picchi: riduzioni vettoriali sui campioni pubblicati
+        cpu_values = serie['cpu_percent']
+        memory_values = serie['memory_percent']
         
         # Valuta stato generale
         status = "OK"
-        if (latest_metrics.cpu_percent > self.thresholds['cpu_critical'] or 
-            latest_metrics.memory_percent > self.thresholds['memory_critical']):
+        if (latest['cpu_percent'] > self.thresholds['cpu_critical'] or 
+            latest['memory_percent'] > self.thresholds['memory_critical']):
             status = "CRITICO"
-        elif (latest_metrics.cpu_percent > self.thresholds['cpu_warning'] or 
-              latest_metrics.memory_percent > self.thresholds['memory_warning']):
+        elif (latest['cpu_percent'] > self.thresholds['cpu_warning'] or 
+              latest['memory_percent'] > self.thresholds['memory_warning']):
             status = "ATTENZIONE"
         
         return {
             "status": status,
             "current": {
-                "cpu_percent": latest_metrics.cpu_percent,
-                "memory_mb": latest_metrics.memory_mb,
-                "memory_percent": latest_metrics.memory_percent,
-                "disk_usage_percent": latest_metrics.disk_usage_percent,
-                "active_threads": latest_metrics.active_threads,
-                "gc_objects": latest_metrics.gc_objects
+                "cpu_percent": latest['cpu_percent'],
+                "memory_mb": latest['memory_mb'],
+                "memory_percent": latest['memory_percent'],
+                "disk_usage_percent": latest['disk_usage_percent'],
+                "active_threads": int(latest['active_threads']),
+                "gc_objects": int(latest['gc_objects'])
             },
             "averages": {
-                "cpu_percent": avg_cpu,
-                "memory_percent": avg_memory
+                "cpu_percent": cpu_values.mean().item(),
+                "memory_percent": memory_values.mean().item()
             },
             "peaks": {
-                "cpu_percent": max_cpu,
-                "memory_percent": max_memory
+                "cpu_percent": cpu_values.max().item(),
+                "memory_percent": memory_values.max().item()
             },
             "thresholds": self.thresholds,
-            "samples_count": len(self.metrics_history)
+            "samples_count": samples_count
         }
     
     def set_threshold(self, metric: str, value: float):
         """Imposta una soglia personalizzata"""
         if metric in self.thresholds:
             self.thresholds[metric] = value
-            print(f"📊 Soglia {metric} impostata a {value}")
+            logger.info("📊 Soglia %s impostata a %s", metric, value)
         else:
-            print(f"❌ Soglia {metric} non valida")
+            logger.warning("❌ Soglia %s non valida", metric)
+    
+    def register_cache(self, cache: Callable):
+        """Registra una cache dell'applicazione (con cache_clear()) da svuotare sotto pressione di memoria"""
+        if cache not in self._app_caches:
+            self._app_caches.append(cache)
+    
+    def _register_app_caches(self):
+        """Registra le cache di APP_LRU_CACHES dei moduli dell'applicazione già caricati"""
+        for module_name, module in list(sys.modules.items()):
+            cache_names = APP_LRU_CACHES.get(module_name.rpartition('.')[2])
+            if not cache_names or module is None:
+                continue
+            for cache_name in cache_names:
+                cache = getattr(module, cache_name, None)
+                if callable(getattr(cache, 'cache_clear', None)):
+                    self.register_cache(cache)
     
     def add_custom_optimization(self, name: str, func: Callable):
         """Aggiunge una regola di ottimizzazione personalizzata"""
         self.optimization_rules[name] = func
-        print(f"➕ Regola personalizzata aggiunta: {name}")
+        logger.info("➕ Regola personalizzata aggiunta: %s", name)
     
     def remove_optimization(self, name: str):
         """Rimuove una regola di ottimizzazione"""
         if name in self.optimization_rules:
             del self.optimization_rules[name]
-            print(f"➖ Regola rimossa: {name}")
+            logger.info("➖ Regola rimossa: %s", name)
         else:
-            print(f"❌ Regola {name} non trovata")
+            logger.warning("❌ Regola %s non trovata", name)
     
     def export_metrics(self, filename: str = "performance_metrics.json"):
         """Esporta le metriche in un file JSON"""
         try:
-            metrics_data = []
-            for metric in self.metrics_history:
-                metrics_data.append({
-                    "cpu_percent": metric.cpu_percent,
-                    "memory_mb": metric.memory_mb,
-                    "memory_percent": metric.memory_percent,
-                    "disk_usage_percent": metric.disk_usage_percent,
-                    "active_threads": metric.active_threads,
-                    "gc_objects": metric.gc_objects,
-                    "timestamp": metric.timestamp
-                })
+            # Colonne convertite in blocco dai buffer, poi ricomposte in record
+            _, valori = self._snapshot()
+            serie = [valori[campo].tolist() for campo in METRIC_FIELDS]
+            metrics_data = [dict(zip(METRIC_FIELDS, valori)) for valori in zip(*serie)]
+            for record in metrics_data:
+                record['active_threads'] = int(record['active_threads'])
+                record['gc_objects'] = int(record['gc_objects'])
             
+            # JSON compatto: niente indentazione per campione
             with open(filename, 'w') as f:
-                json.dump(metrics_data, f, indent=2)
+                json.dump(metrics_data, f, separators=(',', ':'))
             
-            print(f"📊 Metriche esportate in {filename}")
+            logger.info("📊 Metriche esportate in %s", filename)
             return True
         except Exception as e:
-            print(f"❌ Errore esportazione metriche: {e}")
+            logger.error("❌ Errore esportazione metriche: %s", e)
             return False
-    
-    def __del__(self):
-        """Distruttore - ferma il monitoraggio"""
-        self.stop_monitoring()
 
 
 if __name__ == "__main__":
-    # Test del performance optimizer
+    # Test del performance optimizer (log informativi su console)
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     optimizer = PerformanceOptimizer()
     
-    print("🔍 Test Performance Optimizer")
-    print("=" * 40)
-    
-    # Mostra metriche correnti
+    # Metriche correnti, ottimizzazioni e report: l'output viene scritto una sola volta
     metrics = optimizer.get_current_metrics()
-    print(f"CPU: {metrics.cpu_percent:.1f}%")
-    print(f"Memoria: {metrics.memory_mb:.1f} MB ({metrics.memory_percent:.1f}%)")
-    print(f"Disco: {metrics.disk_usage_percent:.1f}%")
-    print(f"Thread: {metrics.active_threads}")
-    print(f"Oggetti GC: {metrics.gc_objects}")
-    
-    # Applica ottimizzazioni
-    print("\n⚡ Applicazione ottimizzazioni...")
     results = optimizer.optimize_all()
-    
-    # Mostra report
-    print("\n📊 Report Performance:")
     report = optimizer.get_performance_report()
-    print(json.dumps(report, indent=2))
+    esiti = "".join(
+        f"  {nome}: {'OK' if esito else 'FALLITO'}\n" for nome, esito in results.items()
+    )
+    
+    sys.stdout.write(
+        "🔍 Test Performance Optimizer\n"
+        f"{'=' * 40}\n"
+        f"CPU: {metrics.cpu_percent:.1f}%\n"
+        f"Memoria: {metrics.memory_mb:.1f} MB ({metrics.memory_percent:.1f}%)\n"
+        f"Disco: {metrics.disk_usage_percent:.1f}%\n"
+        f"Thread: {metrics.active_threads}\n"
+        f"Oggetti GC in attesa: {metrics.gc_objects}\n"
+        "\n⚡ Ottimizzazioni applicate:\n"
+        f"{esiti}"
+        "\n📊 Report Performance:\n"
+        f"{json.dumps(report, indent=2)}\n"
+    )
     
     # Ferma il monitoraggio
     optimizer.stop_monitoring()
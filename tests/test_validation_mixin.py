@@ -0,0 +1,18 @@
+"""
+Test di coerenza tra validazione P.IVA singola e vettoriale.
+"""
+
+import pytest
+
+pytest.importorskip("numpy")
+validation_mixin = pytest.importorskip("validation_mixin")
+
+
+def test_batch_partita_iva_coerente_con_validazione_singola():
+    validator = validation_mixin.ValidationMixin()
+    pive = ['', None, '   ', '\t', ' 12345678903 ', '12345678903', '12345678901']
+    
+    risultati = validator.validate_partita_iva_batch(pive)
+    
+    assert list(risultati) == [validator.validate_partita_iva(piva) for piva in pive]
+    assert list(risultati[:5]) == [True, True, False, False, True]
@@ -9,37 +9,138 @@ Data: 2024
 """
 
 import customtkinter as ctk
+from functools import lru_cache
 from typing import Dict, Any, Optional
 from src.design.design_system import DesignSystem, IconSystem
 
 
+# Lookup del design system memorizzati: ogni combinazione viene costruita una sola volta.
+# Sono pigri (non calcolati all'import) perché i font CTk richiedono una root Tk esistente.
+
+@lru_cache(maxsize=64)
+def _button_style(variant: str, size: str) -> Dict[str, Any]:
+    """Stile pulsante condiviso per (variant, size)"""
+    return DesignSystem.get_button_style(variant, size)
+
+
+@lru_cache(maxsize=16)
+def _card_style(variant: str) -> Dict[str, Any]:
+    """Stile card condiviso per variante"""
+    return DesignSystem.get_card_style(variant)
+
+
+@lru_cache(maxsize=1)
+def _input_style() -> Dict[str, Any]:
+    """Stile dei campi di input condiviso"""
+    return DesignSystem.get_input_style()
+
+
+@lru_cache(maxsize=1)
+def _modal_style() -> Dict[str, Any]:
+    """Stile delle modali condiviso"""
+    return DesignSystem.get_modal_style()
+
+
+@lru_cache(maxsize=128)
+def _color(name: str, shade: str) -> str:
+    """Colore del design system per (nome, tonalità)"""
+    return DesignSystem.get_color(name, shade)
+
+
+@lru_cache(maxsize=64)
+def _font(size: str, weight: Optional[str] = None):
+    """Font del design system condiviso per (size, weight)"""
+    if weight is None:
+        return DesignSystem.get_font(size)
+    return DesignSystem.get_font(size, weight)
+
+
+@lru_cache(maxsize=16)
+def _spacing(name: str):
+    """Spaziatura del design system per nome"""
+    return DesignSystem.get_spacing(name)
+
+
+# Getter degli stili per tipo di componente
+_STYLE_GETTERS = {
+    'button': _button_style,
+    'card': _card_style,
+    'input': _input_style,
+    'modal': _modal_style
+}
+
+# Stili già ristretti alle opzioni accettate, per (classe del widget, tipo, argomenti)
+_FILTERED_STYLES: Dict[tuple, Dict[str, Any]] = {}
+
+
+def _supports_option(widget, option: str) -> bool:
+    """True se il widget espone l'opzione (cget solleva per quelle sconosciute)"""
+    try:
+        widget.cget(option)
+        return True
+    except Exception:
+        return False
+
+
+def _style_for(widget, kind: str, *args) -> Dict[str, Any]:
+    """Stile del design system ristretto, una volta per classe di widget, alle opzioni che accetta"""
+    key = (type(widget), kind, args)
+    style = _FILTERED_STYLES.get(key)
+    if style is None:
+        full_style = _STYLE_GETTERS[kind](*args)
+        style = _FILTERED_STYLES[key] = {
+            prop: value for prop, value in full_style.items() if _supports_option(widget, prop)
+        }
+    return style
+
+
+def _configure_style(widget, kind: str, *args):
+    """Applica lo stile con un'unica configure() (le opzioni non supportate sono già escluse)"""
+    if not hasattr(widget, 'configure'):
+        return
+    style = _style_for(widget, kind, *args)
+    if not style:
+        return
+    try:
+        widget.configure(**style)
+    except Exception:
+        # Un valore rifiutato non deve far perdere le altre opzioni: si applicano una per una
+        for prop, value in style.items():
+            try:
+                widget.configure(**{prop: value})
+            except Exception:
+                pass
+
+
 class ThemeApplier:
     """Applicatore di temi per componenti esistenti"""
     
+    # Icone e colori degli indicatori di stato, calcolati una volta al caricamento della classe
+    _STATUS_ICONS = {
+        'success': '✅',
+        'warning': '⚠️',
+        'error': '❌',
+        'info': 'ℹ️'
+    }
+    _STATUS_COLORS = {
+        status: _color(palette, '600')
+        for status, palette in (
+            ('success', 'success'),
+            ('warning', 'warning'),
+            ('error', 'danger'),
+            ('info', 'info')
+        )
+    }
+    
     @staticmethod
     def apply_button_theme(button: ctk.CTkButton, variant: str = "primary", size: str = "md"):
         """Applica il tema a un pulsante esistente"""
-        style = DesignSystem.get_button_style(variant, size)
-        
-        # Applica le proprietà di stile
-        for prop, value in style.items():
-            if hasattr(button, 'configure'):
-                try:
-                    button.configure(**{prop: value})
-                except Exception:
-                    pass  # Ignora proprietà non supportate
+        _configure_style(button, 'button', variant, size)
     
     @staticmethod
     def apply_frame_theme(frame: ctk.CTkFrame, variant: str = "default"):
         """Applica il tema a un frame esistente"""
-        style = DesignSystem.get_card_style(variant)
-        
-        for prop, value in style.items():
-            if hasattr(frame, 'configure'):
-                try:
-                    frame.configure(**{prop: value})
-                except Exception:
-                    pass
+        _configure_style(frame, 'card', variant)
     
     @staticmethod
     def apply_label_theme(
@@ -49,38 +150,24 @@ class ThemeApplier:
         color: Optional[str] = None
     ):
         """Applica il tema a un'etichetta esistente"""
-        font = DesignSystem.get_font(size, weight)
+        font = _font(size, weight)
         
         if hasattr(label, 'configure'):
             label.configure(font=font)
             
             if color:
-                text_color = DesignSystem.get_color(color.split('_')[0], color.split('_')[1] if '_' in color else '600')
+                text_color = _color(color.split('_')[0], color.split('_')[1] if '_' in color else '600')
                 label.configure(text_color=text_color)
     
     @staticmethod
     def apply_entry_theme(entry: ctk.CTkEntry):
         """Applica il tema a un campo di input esistente"""
-        style = DesignSystem.get_input_style()
-        
-        for prop, value in style.items():
-            if hasattr(entry, 'configure'):
-                try:
-                    entry.configure(**{prop: value})
-                except Exception:
-                    pass
+        _configure_style(entry, 'input')
     
     @staticmethod
     def apply_modal_theme(modal: ctk.CTkToplevel):
         """Applica il tema a una modale esistente"""
-        style = DesignSystem.get_modal_style()
-        
-        for prop, value in style.items():
-            if hasattr(modal, 'configure'):
-                try:
-                    modal.configure(**{prop: value})
-                except Exception:
-                    pass
+        _configure_style(modal, 'modal')
     
     @staticmethod
     def create_icon_label(parent, icon: str, text: str = "", **kwargs) -> ctk.CTkLabel:
@@ -97,7 +184,7 @@ class ThemeApplier:
     @staticmethod
     def create_section_header(parent, title: str, icon: Optional[str] = None) -> ctk.CTkFrame:
         """Crea un header di sezione"""
-        header = ctk.CTkFrame(parent, fg_color=DesignSystem.get_color('primary', '50'))
+        header = ctk.CTkFrame(parent, fg_color=_color('primary', '50'))
         
         title_text = title
         if icon:
@@ -106,37 +193,37 @@ class ThemeApplier:
         title_label = ctk.CTkLabel(
             header,
             text=title_text,
-            font=DesignSystem.get_font('lg', 'bold'),
-            text_color=DesignSystem.get_color('primary', '800')
+            font=_font('lg', 'bold'),
+            text_color=_color('primary', '800')
         )
-        title_label.pack(padx=DesignSystem.get_spacing('md'), pady=DesignSystem.get_spacing('sm'))
+        title_label.pack(padx=_spacing('md'), pady=_spacing('sm'))
         
         return header
     
     @staticmethod
     def create_info_panel(parent, title: str, content: str, icon: Optional[str] = None) -> ctk.CTkFrame:
         """Crea un pannello informativo"""
-        panel = ctk.CTkFrame(parent, **DesignSystem.get_card_style('default'))
+        panel = ctk.CTkFrame(parent, **_card_style('default'))
         
         # Header
         if title or icon:
             header = ctk.CTkFrame(panel, fg_color="transparent")
-            header.pack(fill="x", padx=DesignSystem.get_spacing('md'), pady=DesignSystem.get_spacing('sm'))
+            header.pack(fill="x", padx=_spacing('md'), pady=_spacing('sm'))
             
             if icon:
                 icon_label = ctk.CTkLabel(
                     header,
                     text=IconSystem.get_icon(icon),
-                    font=DesignSystem.get_font('lg')
+                    font=_font('lg')
                 )
-                icon_label.pack(side="left", padx=(0, DesignSystem.get_spacing('sm')))
+                icon_label.pack(side="left", padx=(0, _spacing('sm')))
             
             if title:
                 title_label = ctk.CTkLabel(
                     header,
                     text=title,
-                    font=DesignSystem.get_font('md', 'bold'),
-                    text_color=DesignSystem.get_color('primary', '700')
+                    font=_font('md', 'bold'),
+                    text_color=_color('primary', '700')
                 )
                 title_label.pack(side="left")
         
@@ -145,45 +232,31 @@ class ThemeApplier:
             content_label = ctk.CTkLabel(
                 panel,
                 text=content,
-                font=DesignSystem.get_font('sm'),
-                text_color=DesignSystem.get_color('neutral', '600'),
+                font=_font('sm'),
+                text_color=_color('neutral', '600'),
                 wraplength=300
             )
-            content_label.pack(padx=DesignSystem.get_spacing('md'), pady=(0, DesignSystem.get_spacing('sm')))
+            content_label.pack(padx=_spacing('md'), pady=(0, _spacing('sm')))
         
         return panel
     
     @staticmethod
     def create_status_indicator(parent, status: str, text: str) -> ctk.CTkFrame:
         """Crea un indicatore di stato"""
-        status_colors = {
-            'success': DesignSystem.get_color('success', '600'),
-            'warning': DesignSystem.get_color('warning', '600'),
-            'error': DesignSystem.get_color('danger', '600'),
-            'info': DesignSystem.get_color('info', '600')
-        }
-        
-        status_icons = {
-            'success': '✅',
-            'warning': '⚠️',
-            'error': '❌',
-            'info': 'ℹ️'
-        }
-        
         indicator = ctk.CTkFrame(parent, fg_color="transparent")
         
         icon_label = ctk.CTkLabel(
             indicator,
-            text=status_icons.get(status, ''),
-            font=DesignSystem.get_font('md')
+            text=ThemeApplier._STATUS_ICONS.get(status, ''),
+            font=_font('md')
         )
-        icon_label.pack(side="left", padx=(0, DesignSystem.get_spacing('sm')))
+        icon_label.pack(side="left", padx=(0, _spacing('sm')))
         
         text_label = ctk.CTkLabel(
             indicator,
             text=text,
-            font=DesignSystem.get_font('sm', 'medium'),
-            text_color=status_colors.get(status, DesignSystem.get_color('neutral', '600'))
+            font=_font('sm', 'medium'),
+            text_color=ThemeApplier._STATUS_COLORS.get(status) or _color('neutral', '600')
         )
         text_label.pack(side="left")
         
@@ -204,16 +277,31 @@ class ThemeApplier:
         spinner_label = ctk.CTkLabel(
             spinner_frame,
             text="⏳",
-            font=DesignSystem.get_font('lg')
+            font=_font('lg')
         )
-        spinner_label.pack(side="left", padx=(0, DesignSystem.get_spacing('sm')))
+        spinner_label.pack(side="left", padx=(0, _spacing('sm')))
         
         text_label = ctk.CTkLabel(
             spinner_frame,
             text=text,
-            font=DesignSystem.get_font('sm'),
-            text_color=DesignSystem.get_color('neutral', '600')
+            font=_font('sm'),
+            text_color=_color('neutral', '600')
         )
         text_label.pack(side="left")
         
         return spinner_frame
+
+
+# Accesso diretto come funzioni di modulo (senza passare dall'attributo di classe ad ogni chiamata),
+# es. `from theme_applier import apply_button_theme`; ThemeApplier resta per compatibilità
+apply_button_theme = ThemeApplier.apply_button_theme
+apply_frame_theme = ThemeApplier.apply_frame_theme
+apply_label_theme = ThemeApplier.apply_label_theme
+apply_entry_theme = ThemeApplier.apply_entry_theme
+apply_modal_theme = ThemeApplier.apply_modal_theme
+create_icon_label = ThemeApplier.create_icon_label
+create_section_header = ThemeApplier.create_section_header
+create_info_panel = ThemeApplier.create_info_panel
+create_status_indicator = ThemeApplier.create_status_indicator
+create_progress_bar = ThemeApplier.create_progress_bar
+create_loading_spinner = ThemeApplier.create_loading_spinner
@@ -10,13 +10,170 @@ Data: 2024
 """
 
 import re
-from typing import Dict, List, Any, Optional, Tuple
+import string
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple, Iterable, Callable
 from src.utils.logger import logger
 
+# Import condizionale: Numba compila il controllo P.IVA per le importazioni massive
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Import condizionale: google-re2 (motore DFA) velocizza la validazione massiva delle email
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+# Import condizionale: senza Tk gli errori di validazione vanno solo nel log
+try:
+    import tkinter.messagebox as _messagebox
+except ImportError:
+    _messagebox = None
+
+
+# Pattern compilati una sola volta al caricamento del modulo
+# Senza ancore e usato con fullmatch: re e re2 trattano allo stesso modo un a capo finale
+_EMAIL_PATTERN = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
+_EMAIL_RE = re2.compile(_EMAIL_PATTERN) if RE2_AVAILABLE else re.compile(_EMAIL_PATTERN)
+
+# I telefoni sono solo ASCII: con re.ASCII \d equivale a [0-9], senza tabelle Unicode
+_PHONE_STRIP_RE = re.compile(r'[^\d+]', re.ASCII)
+
+# Telefoni italiani: +39xxxxxxxxxx, 39xxxxxxxxxx, 0xxxxxxxxx o 0xxxxxxxxxx, xxxxxxxxxx
+_PHONE_RE = re.compile(r'^(?:\+39\d{10}|39\d{10}|0\d{9,10}|\d{10})$', re.ASCII)
+
+# Forma del Codice Fiscale: 6 lettere + 2 cifre + 1 lettera + 2 cifre + 1 lettera + 3 cifre + 1 lettera
+_CF_SHAPE = "LLLLLLDDLDDLDDDL"
+
+
+def _build_cf_checker():
+    """Genera una funzione che controlla in linea, byte per byte, la forma del Codice Fiscale"""
+    checks = " and ".join(
+        f"65 <= b[{i}] <= 90" if kind == "L" else f"48 <= b[{i}] <= 57"
+        for i, kind in enumerate(_CF_SHAPE)
+    )
+    source = f"def _cf_ok(b):\n    return len(b) == {len(_CF_SHAPE)} and {checks}\n"
+    namespace = {}
+    exec(source, namespace)
+    return namespace["_cf_ok"]
+
+
+_cf_ok = _build_cf_checker()
+
+# Esito positivo condiviso dai validatori (bool, messaggio): le tuple sono immutabili
+_OK = (True, "")
+
+
+# Messaggi di errore per campo, costruiti una volta per nome campo
+@lru_cache(maxsize=256)
+def _msg_required(field_name: str) -> str:
+    return f"Il campo '{field_name}' è obbligatorio"
+
+
+@lru_cache(maxsize=256)
+def _msg_email(field_name: str) -> str:
+    return f"Email non valida per il campo '{field_name}'"
+
+
+@lru_cache(maxsize=256)
+def _msg_phone(field_name: str) -> str:
+    return f"Telefono non valido per il campo '{field_name}'"
+
+
+# Tabella che elimina lettere, cifre, trattini e underscore: resta solo ciò che va controllato
+_ALNUM_DELETE = str.maketrans('', '', string.ascii_letters + string.digits + '-_')
+
+# Cifre di posizione dispari della P.IVA raddoppiate e ridotte a una cifra (2d oppure 2d - 9)
+_PIVA_DOUBLED = (0, 2, 4, 6, 8, 1, 3, 5, 7, 9)
+
+
+def _piva_checksum_ok(b: bytes) -> bool:
+    """Verifica la cifra di controllo sui codici ASCII delle 11 cifre della P.IVA"""
+    # Posizioni pari sommate, dispari (1, 3, 5, 7, 9) da tabella
+    somma = (
+        b[0] + b[2] + b[4] + b[6] + b[8] - 5 * 48
+        + _PIVA_DOUBLED[b[1] - 48] + _PIVA_DOUBLED[b[3] - 48] + _PIVA_DOUBLED[b[5] - 48]
+        + _PIVA_DOUBLED[b[7] - 48] + _PIVA_DOUBLED[b[9] - 48]
+    )
+    return (10 - somma % 10) % 10 == b[10] - 48
+
+
+if NUMBA_AVAILABLE:
+    try:
+        _piva_checksum_ok = njit(cache=True)(_piva_checksum_ok)
+    except RuntimeError:
+        pass  # Cache non disponibile (es. eseguibile PyInstaller): resta la versione Python
+
+
+# Validatori foglia memorizzati: durante la digitazione lo stesso testo viene rivalidato spesso
+@lru_cache(maxsize=512)
+def _check_email(email: str) -> bool:
+    """Valida formato email (vuota = valida, campo opzionale)"""
+    if not email:
+        return True  # Email opzionale
+    
+    # Scarti immediati prima della regex: manca la @ o lunghezza impossibile (minimo a@b.it, massimo RFC 5321)
+    if '@' not in email or len(email) < 6 or len(email) > 254:
+        return False
+    
+    return _EMAIL_RE.fullmatch(email) is not None
+
+
+@lru_cache(maxsize=512)
+def _check_phone(phone: str) -> bool:
+    """Valida formato telefono italiano (vuoto = valido, campo opzionale)"""
+    if not phone:
+        return True  # Telefono opzionale
+    
+    # Rimuovi spazi e caratteri speciali
+    clean_phone = _PHONE_STRIP_RE.sub('', phone)
+    
+    return _PHONE_RE.match(clean_phone) is not None
+
+
+@lru_cache(maxsize=512)
+def _check_cf(cf: str) -> bool:
+    """Valida Codice Fiscale italiano (vuoto = valido, campo opzionale)"""
+    if not cf:
+        return True  # CF opzionale
+    
+    cf = cf.strip().upper()
+    
+    # Controllo generato da _CF_SHAPE (i caratteri non ASCII diventano '?' e non passano)
+    return _cf_ok(cf.encode('ascii', 'replace'))
+
+
+@lru_cache(maxsize=512)
+def _check_partita_iva(piva: str) -> bool:
+    """Valida Partita IVA italiana (vuota = valida, campo opzionale)"""
+    if not piva:
+        return True  # P.IVA opzionale
+    
+    piva = piva.strip()
+    
+    # Lunghezza corretta
+    if len(piva) != 11:
+        return False
+    
+    # Solo cifre ASCII
+    if not (piva.isascii() and piva.isdigit()):
+        return False
+    
+    # Algoritmo di controllo P.IVA italiana
+    return bool(_piva_checksum_ok(piva.encode('ascii')))
+
 
 class ValidationMixin:
     """Mixin per validazioni comuni"""
     
+    # Mixin senza stato: non aggiunge __dict__ alle classi che lo compongono
+    __slots__ = ()
+    
     # ===== VALIDAZIONI CAMPI OBBLIGATORI =====
     
     def validate_required_fields(self, fields_dict: Dict[str, Any]) -> Tuple[bool, List[str]]:
@@ -32,28 +189,44 @@ class ValidationMixin:
         errors = []
         
         for field_name, value in fields_dict.items():
-            if not value or (isinstance(value, str) and not value.strip()):
-                errors.append(f"Il campo '{field_name}' è obbligatorio")
+            if not value or (type(value) is str and not value.strip()):
+                errors.append(_msg_required(field_name))
         
         return len(errors) == 0, errors
     
-    def validate_required_widgets(self, widgets_dict: Dict[str, Any]) -> Tuple[bool, List[str]]:
+    @staticmethod
+    def widget_getters(widgets_dict: Dict[str, Any]) -> Dict[str, Callable[[], Any]]:
         """
-        Valida widget con metodo get() (Entry, Textbox, etc.)
+        Prepara, alla costruzione del form, i metodi get() dei widget da validare
         
         Args:
             widgets_dict: Dizionario {nome_campo: widget}
             
+        Returns:
+            Dizionario {nome_campo: widget.get}, esclusi i widget assenti o senza get()
+        """
+        return {
+            field_name: widget.get
+            for field_name, widget in widgets_dict.items()
+            if widget and hasattr(widget, 'get')
+        }
+    
+    def validate_required_widgets(self, getters_dict: Dict[str, Callable[[], Any]]) -> Tuple[bool, List[str]]:
+        """
+        Valida widget con metodo get() (Entry, Textbox, etc.)
+        
+        Args:
+            getters_dict: Dizionario {nome_campo: widget.get}, vedi widget_getters()
+            
         Returns:
             Tupla (tutti_validi, lista_errori)
         """
         errors = []
         
-        for field_name, widget in widgets_dict.items():
-            if widget and hasattr(widget, 'get'):
-                value = widget.get()
-                if not value or (isinstance(value, str) and not value.strip()):
-                    errors.append(f"Il campo '{field_name}' è obbligatorio")
+        for field_name, getter in getters_dict.items():
+            value = getter()
+            if not value or (type(value) is str and not value.strip()):
+                errors.append(_msg_required(field_name))
         
         return len(errors) == 0, errors
     
@@ -69,11 +242,7 @@ class ValidationMixin:
         Returns:
             True se valida
         """
-        if not email:
-            return True  # Email opzionale
-        
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return bool(re.match(pattern, email))
+        return _check_email(email)
     
     def validate_phone(self, phone: str) -> bool:
         """
@@ -85,21 +254,7 @@ class ValidationMixin:
         Returns:
             True se valido
         """
-        if not phone:
-            return True  # Telefono opzionale
-        
-        # Rimuovi spazi e caratteri speciali
-        clean_phone = re.sub(r'[^\d+]', '', phone)
-        
-        # Pattern per telefoni italiani
-        patterns = [
-            r'^\+39\d{10}$',  # +39xxxxxxxxxx
-            r'^39\d{10}$',    # 39xxxxxxxxxx
-            r'^0\d{9,10}$',   # 0xxxxxxxxx o 0xxxxxxxxxx
-            r'^\d{10}$'       # xxxxxxxxxx
-        ]
-        
-        return any(re.match(pattern, clean_phone) for pattern in patterns)
+        return _check_phone(phone)
     
     def validate_cap(self, cap: str) -> bool:
         """
@@ -115,7 +270,8 @@ class ValidationMixin:
             return True  # CAP opzionale
         
         # CAP italiano: 5 cifre
-        return bool(re.match(r'^\d{5}$', cap.strip()))
+        cap = cap.strip()
+        return len(cap) == 5 and cap.isascii() and cap.isdecimal()
     
     def validate_cf(self, cf: str) -> bool:
         """
@@ -127,18 +283,7 @@ class ValidationMixin:
         Returns:
             True se valido
         """
-        if not cf:
-            return True  # CF opzionale
-        
-        cf = cf.strip().upper()
-        
-        # Lunghezza corretta
-        if len(cf) != 16:
-            return False
-        
-        # Pattern: 6 lettere + 2 cifre + 1 lettera + 2 cifre + 1 lettera + 3 cifre + 1 lettera
-        pattern = r'^[A-Z]{6}\d{2}[A-Z]\d{2}[A-Z]\d{3}[A-Z]$'
-        return bool(re.match(pattern, cf))
+        return _check_cf(cf)
     
     def validate_partita_iva(self, piva: str) -> bool:
         """
@@ -150,37 +295,37 @@ class ValidationMixin:
         Returns:
             True se valida
         """
-        if not piva:
-            return True  # P.IVA opzionale
+        return _check_partita_iva(piva)
+    
+    def validate_partita_iva_batch(self, pive: Iterable[str]) -> Any:
+        """
+        Valida un elenco di Partite IVA in un'unica passata vettoriale (importazioni massive)
         
-        piva = piva.strip()
+        Args:
+            pive: Partite IVA da validare
+            
+        Returns:
+            Array NumPy di bool allineato all'elenco (True se valida, come validate_partita_iva)
+        """
+        # NumPy serve solo alle importazioni massive: import locale
+        import numpy as np
         
-        # Lunghezza corretta
-        if len(piva) != 11:
-            return False
+        pive = list(pive)
         
-        # Solo cifre
-        if not piva.isdigit():
-            return False
+        # P.IVA vuote valide (campo opzionale, deciso sul valore grezzo come in validate_partita_iva),
+        # le altre valide solo se superano il controllo
+        risultati = np.fromiter((not piva for piva in pive), dtype=bool, count=len(pive))
+        pive = [piva.strip() if piva else "" for piva in pive]
         
-        # Algoritmo di controllo P.IVA italiana
-        try:
-            # Calcola cifra di controllo
-            somma = 0
-            for i in range(10):
-                cifra = int(piva[i])
-                if i % 2 == 1:  # Posizioni dispari (1, 3, 5, 7, 9)
-                    cifra *= 2
-                    if cifra > 9:
-                        cifra = cifra // 10 + cifra % 10
-                somma += cifra
-            
-            resto = somma % 10
-            cifra_controllo = (10 - resto) % 10
-            
-            return cifra_controllo == int(piva[10])
-        except:
-            return False
+        # Solo le P.IVA di 11 cifre ASCII arrivano al calcolo della cifra di controllo
+        indici = [i for i, piva in enumerate(pive) if len(piva) == 11 and piva.isascii() and piva.isdigit()]
+        if indici:
+            cifre = np.frombuffer("".join(pive[i] for i in indici).encode('ascii'), dtype=np.uint8)
+            cifre = cifre.reshape(-1, 11) - 48
+            somma = cifre[:, 0:10:2].sum(axis=1) + np.array(_PIVA_DOUBLED)[cifre[:, 1:10:2]].sum(axis=1)
+            risultati[indici] = (10 - somma % 10) % 10 == cifre[:, 10]
+        
+        return risultati
     
     # ===== VALIDAZIONI NUMERICHE =====
     
@@ -199,7 +344,7 @@ class ValidationMixin:
             num = float(value)
             if num < 0:
                 return False, f"{field_name} deve essere positivo"
-            return True, ""
+            return _OK
         except (ValueError, TypeError):
             return False, f"{field_name} deve essere un numero valido"
     
@@ -218,7 +363,7 @@ class ValidationMixin:
             num = int(value)
             if num < 0:
                 return False, f"{field_name} deve essere positivo"
-            return True, ""
+            return _OK
         except (ValueError, TypeError):
             return False, f"{field_name} deve essere un numero intero valido"
     
@@ -237,7 +382,7 @@ class ValidationMixin:
             num = float(value)
             if num < 0 or num > 100:
                 return False, f"{field_name} deve essere tra 0 e 100"
-            return True, ""
+            return _OK
         except (ValueError, TypeError):
             return False, f"{field_name} deve essere un numero valido"
     
@@ -258,7 +403,7 @@ class ValidationMixin:
                 return False, f"{field_name} non può essere negativo"
             if price > 999999.99:
                 return False, f"{field_name} troppo elevato"
-            return True, ""
+            return _OK
         except (ValueError, TypeError):
             return False, f"{field_name} deve essere un numero valido"
     
@@ -288,7 +433,7 @@ class ValidationMixin:
         if length > max_length:
             return False, f"{field_name} non può superare {max_length} caratteri"
         
-        return True, ""
+        return _OK
     
     def validate_alphanumeric(self, value: str, field_name: str = "Campo") -> Tuple[bool, str]:
         """
@@ -302,16 +447,40 @@ class ValidationMixin:
             Tupla (valido, messaggio_errore)
         """
         if not value:
-            return True, ""
+            return _OK
         
-        if not re.match(r'^[a-zA-Z0-9\s\-_]+$', value):
+        # Dopo la rimozione dei caratteri ammessi possono restare solo spazi
+        resto = value.translate(_ALNUM_DELETE)
+        if resto and not resto.isspace():
             return False, f"{field_name} può contenere solo lettere, numeri, spazi, trattini e underscore"
         
-        return True, ""
+        return _OK
     
     # ===== VALIDAZIONI COMPOSTE =====
     
-    def validate_form_data(self, form_data: Dict[str, Any], validation_rules: Dict[str, Dict[str, Any]]) -> Tuple[bool, List[str]]:
+    def _check_email_field(self, value: Any, field_name: str, rules: Dict[str, Any]) -> Tuple[bool, str]:
+        return _OK if self.validate_email(value) else (False, _msg_email(field_name))
+    
+    def _check_phone_field(self, value: Any, field_name: str, rules: Dict[str, Any]) -> Tuple[bool, str]:
+        return _OK if self.validate_phone(value) else (False, _msg_phone(field_name))
+    
+    def _check_number_field(self, value: Any, field_name: str, rules: Dict[str, Any]) -> Tuple[bool, str]:
+        return self.validate_positive_number(value, field_name)
+    
+    def _check_string_field(self, value: Any, field_name: str, rules: Dict[str, Any]) -> Tuple[bool, str]:
+        min_len = rules.get('min_length', 0)
+        max_len = rules.get('max_length', 255)
+        return self.validate_string_length(value, min_len, max_len, field_name)
+    
+    # Validatori per tipo di campo usati da validate_form_data (le sottoclassi possono aggiungerne)
+    _FIELD_TYPE_VALIDATORS = {
+        'email': _check_email_field,
+        'phone': _check_phone_field,
+        'number': _check_number_field,
+        'string': _check_string_field
+    }
+    
+    def validate_form_data(self, form_data: Dict[str, Any], validation_rules: Dict[str, Dict[str, Any]], fail_fast: bool = False) -> Tuple[bool, List[str]]:
         """
         Valida dati di un form con regole personalizzate
         
@@ -327,6 +496,7 @@ class ValidationMixin:
                     'max_value': float
                 }
             }
+            fail_fast: Se True si ferma al primo errore (utile per la rivalidazione durante la digitazione)
             
         Returns:
             Tupla (tutti_validi, lista_errori)
@@ -337,36 +507,23 @@ class ValidationMixin:
             value = form_data.get(field_name, "")
             
             # Controllo obbligatorietà
-            if rules.get('required', False) and (not value or (isinstance(value, str) and not value.strip())):
-                errors.append(f"Il campo '{field_name}' è obbligatorio")
+            vuoto = not value or (type(value) is str and not value.strip())
+            if vuoto:
+                if rules.get('required', False):
+                    errors.append(_msg_required(field_name))
+                    if fail_fast:
+                        return False, errors
+                # Se il campo è vuoto e non obbligatorio, salta le altre validazioni
                 continue
             
-            # Se il campo è vuoto e non obbligatorio, salta le altre validazioni
-            if not value or (isinstance(value, str) and not value.strip()):
-                continue
-            
-            # Validazioni specifiche per tipo
-            field_type = rules.get('type', 'string')
-            
-            if field_type == 'email':
-                if not self.validate_email(value):
-                    errors.append(f"Email non valida per il campo '{field_name}'")
-            
-            elif field_type == 'phone':
-                if not self.validate_phone(value):
-                    errors.append(f"Telefono non valido per il campo '{field_name}'")
-            
-            elif field_type == 'number':
-                valid, msg = self.validate_positive_number(value, field_name)
-                if not valid:
-                    errors.append(msg)
-            
-            elif field_type == 'string':
-                min_len = rules.get('min_length', 0)
-                max_len = rules.get('max_length', 255)
-                valid, msg = self.validate_string_length(value, min_len, max_len, field_name)
+            # Validazioni specifiche per tipo (i tipi senza validatore non hanno controlli aggiuntivi)
+            validator = self._FIELD_TYPE_VALIDATORS.get(rules.get('type', 'string'))
+            if validator is not None:
+                valid, msg = validator(self, value, field_name, rules)
                 if not valid:
                     errors.append(msg)
+                    if fail_fast:
+                        return False, errors
         
         return len(errors) == 0, errors
     
@@ -381,11 +538,10 @@ class ValidationMixin:
             title: Titolo del messagebox
         """
         if errors:
-            try:
-                import tkinter.messagebox as messagebox
-                error_text = "\n".join(f"• {error}" for error in errors)
-                messagebox.showerror(title, error_text)
-            except ImportError:
+            if _messagebox is not None:
+                error_text = "• " + "\n• ".join(errors)
+                _messagebox.showerror(title, error_text)
+            else:
                 logger.error(f"Errori validazione: {errors}")
     
     def log_validation_error(self, field_name: str, error: str, context: str = ""):